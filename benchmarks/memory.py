@@ -0,0 +1,164 @@
+"""
+Measures memory consumed by set instances.
+
+Run
+    python -m benchmarks.memory --output before.json
+on the old revision to save measurements and
+    python -m benchmarks.memory --baseline before.json
+on the new one to report bytes per instance before & after.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import tracemalloc
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional)
+
+from topo.base import (Set,
+                       Union)
+from topo.continuous import Interval
+from topo.discrete import DiscreteSet
+
+
+def to_intervals(count: int, seed: int) -> List[Set]:
+    generator = random.Random(seed)
+    return [Interval(index, index + generator.random())
+            for index in range(count)]
+
+
+def to_discrete_sets(count: int, seed: int) -> List[Set]:
+    generator = random.Random(seed)
+    return [DiscreteSet(generator.random())
+            for _ in range(count)]
+
+
+def to_unions(count: int, seed: int) -> List[Set]:
+    generator = random.Random(seed)
+    return [Union(Interval(0, 1), DiscreteSet(generator.random() + 2))
+            for _ in range(count)]
+
+
+def to_hashed_intervals(count: int, seed: int) -> List[Set]:
+    result = to_intervals(count, seed)
+    for interval in result:
+        hash(interval)
+    return result
+
+
+def to_bounded_discrete_sets(count: int, seed: int) -> List[Set]:
+    result = to_discrete_sets(count, seed)
+    for discrete_set in result:
+        # older versions have no bounds
+        getattr(discrete_set, 'bounds', None)
+    return result
+
+
+def to_bounded_unions(count: int, seed: int) -> List[Set]:
+    result = to_unions(count, seed)
+    for union in result:
+        getattr(union, 'bounds', None)
+    return result
+
+
+factories = {
+    'interval': to_intervals,
+    'hashed interval': to_hashed_intervals,
+    'discrete set': to_discrete_sets,
+    'bounded discrete set': to_bounded_discrete_sets,
+    'union': to_unions,
+    'bounded union': to_bounded_unions,
+}  # type: Dict[str, Callable[[int, int], List[Set]]]
+
+
+def measure(factory: Callable[[int, int], List[Set]],
+            count: int,
+            seed: int) -> float:
+    """
+    Returns average number of bytes allocated per created set.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        snapshot = tracemalloc.take_snapshot()
+        sets = factory(count, seed)
+        allocated = sum(statistic.size_diff
+                        for statistic in tracemalloc.take_snapshot()
+                        .compare_to(snapshot, 'filename'))
+    finally:
+        tracemalloc.stop()
+    del sets
+    return allocated / count
+
+
+def run(count: int, seed: int) -> Dict[str, Any]:
+    return {'python': platform.python_implementation(),
+            'python_version': platform.python_version(),
+            'count': count,
+            'sizes': {name: measure(factory, count, seed)
+                      for name, factory in factories.items()}}
+
+
+def to_report(current: Dict[str, Any],
+              baseline: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Returns descriptions of bytes per instance of current run
+    side by side with the baseline ones if given.
+    """
+    baseline_sizes = {} if baseline is None else baseline['sizes']
+    result = []
+    for name, size in current['sizes'].items():
+        try:
+            old_size = baseline_sizes[name]
+        except KeyError:
+            result.append('{name}: {size:.1f} bytes per instance'
+                          .format(name=name,
+                                  size=size))
+        else:
+            result.append('{name}: {old_size:.1f} -> {size:.1f} '
+                          'bytes per instance ({ratio:.2f}x)'
+                          .format(name=name,
+                                  old_size=old_size,
+                                  size=size,
+                                  ratio=size / old_size))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+            description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count',
+                        type=int,
+                        default=100000,
+                        help='number of instances to create')
+    parser.add_argument('--seed',
+                        type=int,
+                        default=0,
+                        help='random seed')
+    parser.add_argument('--output',
+                        help='path to JSON file to save results to')
+    parser.add_argument('--baseline',
+                        help='path to JSON file with results '
+                             'to compare with')
+    namespace = parser.parse_args()
+    current = run(namespace.count, namespace.seed)
+    if namespace.output is not None:
+        with open(namespace.output, 'w') as file:
+            json.dump(current, file,
+                      indent=2)
+    if namespace.baseline is None:
+        baseline = None
+    else:
+        with open(namespace.baseline) as file:
+            baseline = json.load(file)
+    for line in to_report(current, baseline):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
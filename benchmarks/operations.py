@@ -0,0 +1,308 @@
+"""
+Measures time & memory of sets construction, operators and relations
+across sets kinds & sizes.
+
+Run
+    python -m benchmarks.operations run --output results.json
+to save measurements and
+    python -m benchmarks.operations compare old.json new.json
+to report regressions between two runs.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from operator import (and_,
+                      contains,
+                      eq,
+                      le,
+                      or_,
+                      sub,
+                      xor)
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Tuple)
+
+from topo.base import (Set,
+                       Union)
+from topo.continuous import Interval
+from topo.discrete import DiscreteSet
+
+Arguments = Tuple[Any, ...]
+Case = Callable[[int, int], Tuple[Callable[..., Any], Arguments]]
+
+
+def to_interval(size: int, seed: int) -> Interval:
+    generator = random.Random(seed)
+    return Interval(generator.random() * size,
+                    size + generator.random() * size)
+
+
+def to_points(size: int, seed: int) -> List[float]:
+    generator = random.Random(seed)
+    return [generator.random() * 3 * size for _ in range(size)]
+
+
+def to_discrete_set(size: int, seed: int) -> DiscreteSet:
+    return DiscreteSet(*to_points(size, seed))
+
+
+def to_subsets(size: int, seed: int) -> List[Set]:
+    generator = random.Random(seed)
+    intervals = [Interval(3 * index + generator.random(), 3 * index + 2)
+                 for index in range(size)]
+    return [*intervals, DiscreteSet(*to_points(size, seed))]
+
+
+def to_union(size: int, seed: int) -> Set:
+    return Union(*to_subsets(size, seed))
+
+
+factories = {
+    'interval': to_interval,
+    'discrete set': to_discrete_set,
+    'union': to_union,
+}  # type: Dict[str, Callable[[int, int], Set]]
+operators = {
+    '&': and_,
+    '|': or_,
+    '-': sub,
+    '^': xor,
+    '<=': le,
+    '==': eq,
+}  # type: Dict[str, Callable[[Set, Set], Any]]
+mixed_kinds = [('union', 'interval'),
+               ('union', 'discrete set'),
+               ('discrete set', 'interval')]
+
+
+def to_cases() -> Dict[Tuple[str, str], Case]:
+    """
+    Returns factories of measured calls with their arguments
+    keyed by operands kinds & operation name.
+    """
+    result = {}  # type: Dict[Tuple[str, str], Case]
+    result['interval', 'construction'] = (
+        lambda size, seed: (Interval, (seed, seed + size)))
+    result['discrete set', 'construction'] = (
+        lambda size, seed: (DiscreteSet, tuple(to_points(size, seed))))
+    result['union', 'construction'] = (
+        lambda size, seed: (Union, tuple(to_subsets(size, seed))))
+    kinds_pairs = [(kind, kind) for kind in factories] + mixed_kinds
+    for left_kind, right_kind in kinds_pairs:
+        kinds = (left_kind
+                 if left_kind == right_kind
+                 else left_kind + ' & ' + right_kind)
+        for name, operator in operators.items():
+            result[kinds, name] = to_operator_case(
+                    operator, factories[left_kind], factories[right_kind],
+                    same=name == '==' and left_kind == right_kind)
+    for kind, factory in factories.items():
+        result[kind, 'in'] = to_membership_case(factory)
+        result[kind, 'hash'] = to_hash_case(factory)
+    return result
+
+
+def to_operator_case(operator: Callable[[Set, Set], Any],
+                     left_factory: Callable[[int, int], Set],
+                     right_factory: Callable[[int, int], Set],
+                     *,
+                     same: bool) -> Case:
+    def case(size: int, seed: int) -> Tuple[Callable[..., Any], Arguments]:
+        # equal operands are created separately to measure full comparison
+        right_seed = seed if same else seed + 1
+        return operator, (left_factory(size, seed),
+                          right_factory(size, right_seed))
+
+    return case
+
+
+def to_membership_case(factory: Callable[[int, int], Set]) -> Case:
+    def case(size: int, seed: int) -> Tuple[Callable[..., Any], Arguments]:
+        return contains, (factory(size, seed),
+                          random.Random(seed).random() * 3 * size)
+
+    return case
+
+
+def to_hash_case(factory: Callable[[int, int], Set]) -> Case:
+    def case(size: int, seed: int) -> Tuple[Callable[..., Any], Arguments]:
+        # sets are created for every call since they cache hashes
+        return hash, (factory(size, seed),)
+
+    return case
+
+
+def measure(case: Case,
+            size: int,
+            *,
+            repeats: int,
+            seed: int) -> Dict[str, float]:
+    """
+    Returns the best time in seconds of a single call over repeats
+    and peak number of bytes allocated by it.
+    """
+    times = []
+    for repeat in range(repeats):
+        function, arguments = case(size, seed + repeat)
+        gc.collect()
+        start = time.perf_counter()
+        function(*arguments)
+        times.append(time.perf_counter() - start)
+    function, arguments = case(size, seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(*arguments)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times),
+            'peak_bytes': peak}
+
+
+def run(sizes: List[int],
+        *,
+        repeats: int,
+        seed: int,
+        time_limit: float) -> Dict[str, Any]:
+    results = []
+    for (kinds, operation), case in to_cases().items():
+        for size in sizes:
+            if kinds == 'interval' and size > 1:
+                # intervals do not depend on size
+                break
+            measurement = measure(case, size,
+                                  repeats=repeats,
+                                  seed=seed)
+            results.append({'kinds': kinds,
+                            'operation': operation,
+                            'size': size,
+                            **measurement})
+            print('{kinds} {operation} (size {size}): '
+                  '{seconds:.6f} s, {peak_bytes} B'
+                  .format(kinds=kinds,
+                          operation=operation,
+                          size=size,
+                          **measurement),
+                  file=sys.stderr)
+            if measurement['seconds'] > time_limit:
+                # larger sizes would take too long
+                break
+    return {'python': platform.python_implementation(),
+            'python_version': platform.python_version(),
+            'results': results}
+
+
+def to_key(result: Dict[str, Any]) -> Tuple[str, str, int]:
+    return result['kinds'], result['operation'], result['size']
+
+
+def compare(baseline: Dict[str, Any],
+            current: Dict[str, Any],
+            *,
+            threshold: float) -> List[str]:
+    """
+    Returns descriptions of measurements of current run
+    which are worse than the baseline ones more than given ratio.
+    """
+    baseline_results = {to_key(result): result
+                        for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        try:
+            baseline_result = baseline_results[to_key(result)]
+        except KeyError:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            old, new = baseline_result[metric], result[metric]
+            if old and new / old > threshold:
+                regressions.append('{kinds} {operation} (size {size}): '
+                                   '{metric} {old} -> {new} ({ratio:.2f}x)'
+                                   .format(metric=metric,
+                                           old=old,
+                                           new=new,
+                                           ratio=new / old,
+                                           **result))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+            description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    run_parser = subparsers.add_parser('run',
+                                       help='measure and save results')
+    run_parser.add_argument('--max-size',
+                            type=int,
+                            default=10 ** 6,
+                            help='largest size of sets, '
+                                 'sizes are powers of 10 starting from 1')
+    run_parser.add_argument('--repeats',
+                            type=int,
+                            default=5,
+                            help='number of timed calls per measurement')
+    run_parser.add_argument('--seed',
+                            type=int,
+                            default=0,
+                            help='random seed')
+    run_parser.add_argument('--time-limit',
+                            type=float,
+                            default=1.,
+                            help='seconds per call after which '
+                                 'larger sizes are skipped')
+    run_parser.add_argument('--output',
+                            default='-',
+                            help='path to JSON file with results')
+    compare_parser = subparsers.add_parser('compare',
+                                           help='report regressions')
+    compare_parser.add_argument('baseline',
+                                help='path to JSON file with old results')
+    compare_parser.add_argument('current',
+                                help='path to JSON file with new results')
+    compare_parser.add_argument('--threshold',
+                                type=float,
+                                default=1.25,
+                                help='ratio of new to old measurement '
+                                     'considered as regression')
+    namespace = parser.parse_args()
+    if namespace.command == 'run':
+        sizes = []
+        size = 1
+        while size <= namespace.max_size:
+            sizes.append(size)
+            size *= 10
+        results = run(sizes,
+                      repeats=namespace.repeats,
+                      seed=namespace.seed,
+                      time_limit=namespace.time_limit)
+        if namespace.output == '-':
+            json.dump(results, sys.stdout,
+                      indent=2)
+        else:
+            with open(namespace.output, 'w') as file:
+                json.dump(results, file,
+                          indent=2)
+    elif namespace.command == 'compare':
+        with open(namespace.baseline) as file:
+            baseline = json.load(file)
+        with open(namespace.current) as file:
+            current = json.load(file)
+        regressions = compare(baseline, current,
+                              threshold=namespace.threshold)
+        for regression in regressions:
+            print(regression)
+        sys.exit(1 if regressions else 0)
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
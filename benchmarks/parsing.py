@@ -0,0 +1,80 @@
+"""Measures throughput of parsing sets from their string notation."""
+import argparse
+import random
+import time
+from typing import (Callable,
+                    Dict)
+
+from topo.base import (Set,
+                       Union)
+from topo.continuous import Interval
+from topo.discrete import DiscreteSet
+from topo.parsing import parse
+
+
+def to_notation(count: int, seed: int) -> str:
+    generator = random.Random(seed)
+    subsets = []
+    for index in range(count):
+        if generator.random() < 0.1:
+            subsets.append(DiscreteSet(3 * index + generator.random()))
+        else:
+            subsets.append(Interval(3 * index + generator.random(),
+                                    3 * index + 2,
+                                    left_end_inclusive=generator.random()
+                                    < 0.5))
+    return ' or '.join(map(str, subsets))
+
+
+def parse_by_objects(string: str) -> Set:
+    """
+    Constructs sets term by term as it would be done without parser.
+    """
+    subsets = []
+    for term in string.split(' or '):
+        if term.startswith('{'):
+            subsets.append(DiscreteSet(*map(float, term[1:-1].split(', '))))
+        else:
+            left_end, right_end = map(float, term[1:-1].split(', '))
+            subsets.append(Interval(left_end, right_end,
+                                    left_end_inclusive=term[0] == '[',
+                                    right_end_inclusive=term[-1] == ']'))
+    return Union(*subsets).fold()
+
+
+parsers = {
+    'parse': parse,
+    'term by term': parse_by_objects,
+}  # type: Dict[str, Callable[[str], Set]]
+
+
+def measure(parser: Callable[[str], Set], string: str) -> float:
+    """
+    Returns number of megabytes parsed per second.
+    """
+    start = time.perf_counter()
+    parser(string)
+    return len(string) / (time.perf_counter() - start) / 10 ** 6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count',
+                        type=int,
+                        default=100000,
+                        help='number of terms in notation')
+    parser.add_argument('--seed',
+                        type=int,
+                        default=0,
+                        help='random seed')
+    namespace = parser.parse_args()
+    string = to_notation(namespace.count, namespace.seed)
+    print('notation size: {size:.1f} MB'.format(size=len(string) / 10 ** 6))
+    for name, parser_ in parsers.items():
+        print('{name}: {throughput:.2f} MB/s'
+              .format(name=name,
+                      throughput=measure(parser_, string)))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,9 @@ import topo
 project_base_url = 'https://github.com/lycantropos/topo/'
 
 install_requires = [
+    'numpy>=1.17.0',
     'reprit>=0.0.0',
+    'sortedcontainers>=2.0.0',
 ]
 setup_requires = [
     'pytest-runner>=4.2',
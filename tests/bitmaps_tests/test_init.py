@@ -0,0 +1,27 @@
+from topo.bitmaps import BitmapSet
+from topo.discrete import DiscreteSet
+from topo.ranges import RangeSet
+
+
+def test_equivalence(bitmap_set: BitmapSet) -> None:
+    result = DiscreteSet(*bitmap_set)
+
+    assert result == bitmap_set
+    assert bitmap_set == result
+    assert hash(result) == hash(bitmap_set)
+    assert len(bitmap_set) == len(result.points)
+
+
+def test_runs(bitmap_set: BitmapSet) -> None:
+    result = RangeSet.from_runs(bitmap_set.runs())
+
+    assert result == bitmap_set
+    assert hash(result) == hash(bitmap_set)
+    assert BitmapSet.from_runs(result.runs()) == bitmap_set
+
+
+def test_fallback() -> None:
+    result = BitmapSet(0, -1)
+
+    assert not isinstance(result, BitmapSet)
+    assert result == DiscreteSet(0, -1)
@@ -0,0 +1,73 @@
+from typing import Iterable
+
+from tests.utils import equivalence
+from topo.bitmaps import BitmapSet
+from topo.continuous import Interval
+from topo.discrete import DiscreteSet
+
+
+def test_difference(bitmap_set: BitmapSet,
+                    other_bitmap_set: BitmapSet) -> None:
+    result = bitmap_set - other_bitmap_set
+
+    assert all(equivalence(integer in result,
+                           integer in bitmap_set
+                           and integer not in other_bitmap_set)
+               for integer in to_integers(bitmap_set, other_bitmap_set))
+
+
+def test_intersection(bitmap_set: BitmapSet,
+                      other_bitmap_set: BitmapSet) -> None:
+    result = bitmap_set & other_bitmap_set
+
+    assert all(equivalence(integer in result,
+                           integer in bitmap_set
+                           and integer in other_bitmap_set)
+               for integer in to_integers(bitmap_set, other_bitmap_set))
+
+
+def test_symmetric_difference(bitmap_set: BitmapSet,
+                              other_bitmap_set: BitmapSet) -> None:
+    result = bitmap_set ^ other_bitmap_set
+
+    assert all(equivalence(integer in result,
+                           (integer in bitmap_set)
+                           ^ (integer in other_bitmap_set))
+               for integer in to_integers(bitmap_set, other_bitmap_set))
+
+
+def test_union(bitmap_set: BitmapSet, other_bitmap_set: BitmapSet) -> None:
+    result = bitmap_set | other_bitmap_set
+
+    assert all(equivalence(integer in result,
+                           integer in bitmap_set
+                           or integer in other_bitmap_set)
+               for integer in to_integers(bitmap_set, other_bitmap_set))
+
+
+def test_interval_difference(bitmap_set: BitmapSet,
+                             interval: Interval) -> None:
+    result = interval - bitmap_set
+
+    assert result == interval - DiscreteSet(*bitmap_set)
+
+
+def test_interval_union(bitmap_set: BitmapSet, interval: Interval) -> None:
+    result = bitmap_set | interval
+    points_union = interval | DiscreteSet(*bitmap_set)
+
+    assert result == points_union
+    assert hash(result) == hash(points_union)
+
+
+def test_interval_union_boundary() -> None:
+    result = BitmapSet(0) | Interval(0, 1,
+                                     left_end_inclusive=False)
+
+    assert result == Interval(0, 1)
+    assert hash(result) == hash(Interval(0, 1))
+
+
+def to_integers(*sets: BitmapSet) -> Iterable[int]:
+    for set_ in sets:
+        yield from set_
@@ -0,0 +1,26 @@
+from typing import Tuple
+
+from tests.utils import implication
+from topo.base import (Set,
+                       are_bounds_disjoint,
+                       lies_within_bounds)
+
+
+def test_emptiness(set_: Set) -> None:
+    assert implication(not set_, set_.bounds is None)
+
+
+def test_membership(set_: Set, floats_tuple: Tuple[float, ...]) -> None:
+    bounds = set_.bounds
+
+    assert all(implication(number in set_,
+                           lies_within_bounds(number, bounds))
+               for number in floats_tuple)
+
+
+def test_disjointness(set_: Set, other_set: Set) -> None:
+    bounds, other_bounds = set_.bounds, other_set.bounds
+
+    assert implication(bounds is not None and other_bounds is not None
+                       and are_bounds_disjoint(bounds, other_bounds),
+                       not set_ & other_set)
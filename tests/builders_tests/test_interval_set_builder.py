@@ -0,0 +1,34 @@
+from functools import reduce
+from operator import sub
+from typing import Tuple
+
+from tests.utils import equivalence
+from topo.builders import IntervalSetBuilder
+from topo.continuous import (Interval,
+                             IntervalUnion)
+
+
+def test_add(intervals_tuple: Tuple[Interval, ...]) -> None:
+    builder = IntervalSetBuilder()
+
+    for interval in intervals_tuple:
+        builder.add(interval)
+
+    assert builder.freeze() == IntervalUnion(*intervals_tuple).fold()
+
+
+def test_discard(interval_union: IntervalUnion,
+                 intervals_tuple: Tuple[Interval, ...]) -> None:
+    builder = IntervalSetBuilder(interval_union)
+
+    for interval in intervals_tuple:
+        builder.discard(interval)
+
+    assert builder.freeze() == reduce(sub, intervals_tuple, interval_union)
+
+
+def test_membership(interval_union: IntervalUnion, interval: Interval) -> None:
+    builder = IntervalSetBuilder(interval_union)
+
+    assert all(equivalence(end in builder, end in interval_union)
+               for end in (interval.left_end, interval.right_end))
@@ -0,0 +1,41 @@
+from operator import (and_,
+                      or_,
+                      sub)
+
+from topo.base import Set
+from topo.caching import (OperationCache,
+                          caching,
+                          enabled_cache)
+from topo.continuous import Interval
+
+
+def test_disabling() -> None:
+    method = Interval.__and__
+
+    with caching() as cache:
+        assert enabled_cache() is cache
+        assert Interval.__and__ is not method
+
+    assert enabled_cache() is None
+    assert Interval.__and__ is method
+
+
+def test_eviction(set_: Set, other_set: Set) -> None:
+    with caching(max_size=1) as cache:
+        for operation in (and_, or_, sub):
+            operation(set_, other_set)
+
+    assert cache.cache_info().size <= 1
+
+
+def test_results(set_: Set, other_set: Set) -> None:
+    results = [set_ & other_set, set_ | other_set, set_ - other_set]
+
+    with OperationCache() as cache:
+        cached_results = [set_ & other_set, set_ | other_set,
+                          set_ - other_set]
+        repeated_results = [set_ & other_set, set_ | other_set,
+                            set_ - other_set]
+
+    assert cached_results == repeated_results == results
+    assert cache.cache_info().hits >= len(results)
@@ -0,0 +1,41 @@
+from typing import Tuple
+
+from tests.utils import equivalence
+from topo.base import Set
+from topo.continuous import (Interval,
+                             complement,
+                             real_line)
+from topo.discrete import NumericDiscreteSet
+
+
+def test_basic(set_: Set) -> None:
+    result = ~set_
+
+    assert isinstance(result, Set)
+    assert result == real_line - set_
+
+
+def test_involution(set_: Set) -> None:
+    assert ~~set_ == real_line & set_
+
+
+def test_membership(set_: Set, floats_tuple: Tuple[float, ...]) -> None:
+    result = ~set_
+
+    assert all(equivalence(number in result,
+                           number in real_line and number not in set_)
+               for number in floats_tuple)
+
+
+def test_points(numeric_discrete_set: NumericDiscreteSet) -> None:
+    result = ~numeric_discrete_set
+
+    assert result == real_line - numeric_discrete_set
+    assert not result & numeric_discrete_set
+
+
+def test_universe(set_: Set, interval: Interval) -> None:
+    result = complement(set_, interval)
+
+    assert result == interval - set_
+    assert complement(result, interval) == interval & set_
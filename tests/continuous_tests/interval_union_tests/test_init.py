@@ -0,0 +1,43 @@
+from itertools import (islice,
+                       tee)
+from typing import Tuple
+
+from tests.utils import equivalence
+from topo.base import Union
+from topo.continuous import (Interval,
+                             IntervalUnion)
+
+
+def test_canonicity(interval_union: IntervalUnion) -> None:
+    pieces, next_pieces = tee(interval_union.pieces())
+    for piece, next_piece in zip(pieces, islice(next_pieces, 1, None)):
+        _, _, right_end, right_end_inclusive = piece
+        next_left_end, next_left_end_inclusive, _, _ = next_piece
+
+        assert (right_end < next_left_end
+                or right_end == next_left_end
+                and not (right_end_inclusive or next_left_end_inclusive))
+
+
+def test_coverage(intervals_tuple: Tuple[Interval, ...]) -> None:
+    result = IntervalUnion(*intervals_tuple)
+
+    assert all(interval <= result
+               for interval in intervals_tuple)
+
+
+def test_membership(intervals_tuple: Tuple[Interval, ...]) -> None:
+    result = IntervalUnion(*intervals_tuple)
+
+    assert all(equivalence(end in result,
+                           any(end in interval
+                               for interval in intervals_tuple))
+               for interval in intervals_tuple
+               for end in (interval.left_end, interval.right_end))
+
+
+def test_union_construction(intervals_tuple: Tuple[Interval, ...]) -> None:
+    result = Union(*intervals_tuple)
+
+    assert isinstance(result, IntervalUnion) or not intervals_tuple
+    assert result == IntervalUnion(*intervals_tuple)
@@ -0,0 +1,52 @@
+from typing import (Iterable,
+                    SupportsFloat)
+
+from tests.utils import equivalence
+from topo.continuous import IntervalUnion
+
+
+def test_difference(interval_union: IntervalUnion,
+                    other_interval_union: IntervalUnion) -> None:
+    result = interval_union - other_interval_union
+
+    assert all(equivalence(end in result,
+                           end in interval_union
+                           and end not in other_interval_union)
+               for end in to_ends(interval_union, other_interval_union))
+
+
+def test_intersection(interval_union: IntervalUnion,
+                      other_interval_union: IntervalUnion) -> None:
+    result = interval_union & other_interval_union
+
+    assert all(equivalence(end in result,
+                           end in interval_union
+                           and end in other_interval_union)
+               for end in to_ends(interval_union, other_interval_union))
+
+
+def test_symmetric_difference(interval_union: IntervalUnion,
+                              other_interval_union: IntervalUnion) -> None:
+    result = interval_union ^ other_interval_union
+
+    assert all(equivalence(end in result,
+                           (end in interval_union)
+                           ^ (end in other_interval_union))
+               for end in to_ends(interval_union, other_interval_union))
+
+
+def test_union(interval_union: IntervalUnion,
+               other_interval_union: IntervalUnion) -> None:
+    result = interval_union | other_interval_union
+
+    assert all(equivalence(end in result,
+                           end in interval_union
+                           or end in other_interval_union)
+               for end in to_ends(interval_union, other_interval_union))
+
+
+def to_ends(*unions: IntervalUnion) -> Iterable[SupportsFloat]:
+    for union in unions:
+        for left_end, _, right_end, _ in union.pieces():
+            yield left_end
+            yield right_end
@@ -0,0 +1,54 @@
+from tests.utils import equivalence
+from topo.continuous import (Interval,
+                             IntervalUnion)
+from topo.discrete import NumericDiscreteSet
+
+
+def test_equality(interval_union: IntervalUnion,
+                  other_interval_union: IntervalUnion) -> None:
+    assert equivalence(interval_union == other_interval_union,
+                       interval_union <= other_interval_union
+                       and other_interval_union <= interval_union)
+
+
+def test_strict_subset(interval_union: IntervalUnion,
+                       other_interval_union: IntervalUnion) -> None:
+    assert equivalence(interval_union < other_interval_union,
+                       interval_union <= other_interval_union
+                       and interval_union != other_interval_union)
+    assert equivalence(interval_union > other_interval_union,
+                       other_interval_union < interval_union)
+
+
+def test_subset(interval_union: IntervalUnion,
+                other_interval_union: IntervalUnion) -> None:
+    assert equivalence(interval_union <= other_interval_union,
+                       interval_union | other_interval_union
+                       == other_interval_union)
+    assert equivalence(interval_union >= other_interval_union,
+                       other_interval_union <= interval_union)
+
+
+def test_subset_with_interval(interval_union: IntervalUnion,
+                              interval: Interval) -> None:
+    assert equivalence(interval <= interval_union,
+                       interval | interval_union == interval_union)
+    assert equivalence(interval_union <= interval,
+                       interval | interval_union == interval)
+    assert equivalence(interval_union >= interval, interval <= interval_union)
+    assert equivalence(interval >= interval_union, interval_union <= interval)
+
+
+def test_subset_with_points(interval_union: IntervalUnion,
+                            numeric_discrete_set: NumericDiscreteSet
+                            ) -> None:
+    assert equivalence(numeric_discrete_set <= interval_union,
+                       numeric_discrete_set | interval_union
+                       == interval_union)
+    assert equivalence(interval_union <= numeric_discrete_set,
+                       numeric_discrete_set | interval_union
+                       == numeric_discrete_set)
+    assert equivalence(interval_union >= numeric_discrete_set,
+                       numeric_discrete_set <= interval_union)
+    assert equivalence(numeric_discrete_set >= interval_union,
+                       interval_union <= numeric_discrete_set)
@@ -0,0 +1,36 @@
+from tests.utils import equivalence
+from topo.discrete import (DiscreteSet,
+                           NumericDiscreteSet)
+
+
+def test_sortedness(numeric_discrete_set: NumericDiscreteSet) -> None:
+    array = numeric_discrete_set.array
+
+    assert (array[:-1] < array[1:]).all()
+
+
+def test_equivalence(numeric_discrete_set: NumericDiscreteSet) -> None:
+    result = DiscreteSet(*numeric_discrete_set.points)
+
+    assert result == numeric_discrete_set
+    assert hash(result) == hash(numeric_discrete_set)
+    assert all(equivalence(point in result,
+                           point in numeric_discrete_set)
+               for point in numeric_discrete_set.points)
+
+
+def test_fallback() -> None:
+    result = NumericDiscreteSet(0, 'a')
+
+    assert not isinstance(result, NumericDiscreteSet)
+    assert result == DiscreteSet(0, 'a')
+
+
+def test_large_integers() -> None:
+    large_integer = 2 ** 53 + 1
+
+    result = NumericDiscreteSet(0.5, large_integer)
+
+    assert large_integer in result
+    assert large_integer - 1 not in result
+    assert result == DiscreteSet(0.5, large_integer)
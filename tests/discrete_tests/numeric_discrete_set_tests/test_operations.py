@@ -0,0 +1,93 @@
+from decimal import Decimal
+from typing import (Iterable,
+                    SupportsFloat)
+
+from tests.utils import equivalence
+from topo.continuous import (Interval,
+                             IntervalUnion)
+from topo.discrete import (DiscreteSet,
+                           NumericDiscreteSet)
+
+
+def test_between(numeric_discrete_set: NumericDiscreteSet,
+                 interval: Interval) -> None:
+    result = interval.slice(numeric_discrete_set)
+
+    assert result == numeric_discrete_set & interval
+    assert result == DiscreteSet(*numeric_discrete_set.points) & interval
+
+
+def test_difference(numeric_discrete_set: NumericDiscreteSet,
+                    other_numeric_discrete_set: NumericDiscreteSet) -> None:
+    result = numeric_discrete_set - other_numeric_discrete_set
+
+    assert all(equivalence(point in result,
+                           point in numeric_discrete_set
+                           and point not in other_numeric_discrete_set)
+               for point in to_points(numeric_discrete_set,
+                                      other_numeric_discrete_set))
+
+
+def test_intersection(numeric_discrete_set: NumericDiscreteSet,
+                      other_numeric_discrete_set: NumericDiscreteSet
+                      ) -> None:
+    result = numeric_discrete_set & other_numeric_discrete_set
+
+    assert all(equivalence(point in result,
+                           point in numeric_discrete_set
+                           and point in other_numeric_discrete_set)
+               for point in to_points(numeric_discrete_set,
+                                      other_numeric_discrete_set))
+
+
+def test_symmetric_difference(numeric_discrete_set: NumericDiscreteSet,
+                              other_numeric_discrete_set: NumericDiscreteSet
+                              ) -> None:
+    result = numeric_discrete_set ^ other_numeric_discrete_set
+
+    assert all(equivalence(point in result,
+                           (point in numeric_discrete_set)
+                           ^ (point in other_numeric_discrete_set))
+               for point in to_points(numeric_discrete_set,
+                                      other_numeric_discrete_set))
+
+
+def test_union(numeric_discrete_set: NumericDiscreteSet,
+               other_numeric_discrete_set: NumericDiscreteSet) -> None:
+    result = numeric_discrete_set | other_numeric_discrete_set
+
+    assert isinstance(result, NumericDiscreteSet)
+    assert all(equivalence(point in result,
+                           point in numeric_discrete_set
+                           or point in other_numeric_discrete_set)
+               for point in to_points(numeric_discrete_set,
+                                      other_numeric_discrete_set))
+
+
+def test_union_with_large_integers() -> None:
+    large_integer = 2 ** 60 + 1
+    integers_set = NumericDiscreteSet(1, large_integer)
+    floats_set = NumericDiscreteSet(0.5)
+
+    result = integers_set | floats_set
+
+    assert large_integer in result
+    assert large_integer - 1 not in result
+    assert result == floats_set | DiscreteSet(1, large_integer)
+    assert result == DiscreteSet(0.5, 1, large_integer)
+
+
+def test_decimal_ends() -> None:
+    numeric_discrete_set = NumericDiscreteSet(4, 5)
+    points = DiscreteSet(4, 5)
+    union = IntervalUnion(Interval(Decimal('3'), 5.0), DiscreteSet('a'))
+
+    assert numeric_discrete_set & union == points & union
+    assert numeric_discrete_set - union == points - union
+    assert numeric_discrete_set ^ union == points ^ union
+    assert (numeric_discrete_set <= union) is (points <= union)
+
+
+def to_points(*sets: NumericDiscreteSet) -> Iterable[SupportsFloat]:
+    for set_ in sets:
+        yield from set_.array.tolist()
@@ -0,0 +1,43 @@
+import pytest
+
+from topo import dispatch
+from topo.base import Set
+from topo.continuous import (Interval,
+                             intersect_intervals)
+from topo.discrete import DiscreteSet
+from topo.floats import FloatInterval
+from topo.ranges import RangeSet
+
+
+def test_resolution() -> None:
+    assert (dispatch.resolve('__and__', FloatInterval, Interval)
+            is intersect_intervals)
+    assert dispatch.resolve('__and__', Interval, RangeSet) is None
+
+
+def test_registration() -> None:
+    # operands should overlap since disjoint ones are rejected right away
+    interval, range_set = Interval(5, 20), RangeSet(range(10))
+    calls = []
+
+    def intersect(set_: Set, other: Set) -> Set:
+        calls.append((set_, other))
+        return DiscreteSet()
+
+    dispatch.register('__and__', Interval, RangeSet,
+                      symmetric=True)(intersect)
+    try:
+        interval & range_set
+        range_set & interval
+    finally:
+        dispatch.unregister('__and__', Interval, RangeSet,
+                            symmetric=True)
+
+    assert calls == [(interval, range_set), (interval, range_set)]
+    assert dispatch.resolve('__and__', Interval, RangeSet) is None
+    assert interval & range_set == range_set & interval
+
+
+def test_invalid_name() -> None:
+    with pytest.raises(ValueError):
+        dispatch.register('__contains__', Interval, Interval)
@@ -1,5 +1,6 @@
 from functools import partial
-from typing import Optional
+from typing import (Optional,
+                    Tuple)
 
 import pytest
 from hypothesis.searchstrategy import SearchStrategy
@@ -32,6 +33,11 @@ def sets_strategy(min_set_size: int,
     return plain_sets | limit_size(strategies.to_unions)(plain_sets)
 
 
+@pytest.fixture(scope='function')
+def floats_tuple() -> Tuple[float, ...]:
+    return find(strategies.to_homogeneous_tuples(strategies.floats))
+
+
 @pytest.fixture(scope='function')
 def set_(sets_strategy: SearchStrategy[Set]) -> Set:
     return find(sets_strategy)
@@ -45,3 +51,9 @@ def other_set(sets_strategy: SearchStrategy[Set]) -> Set:
 @pytest.fixture(scope='function')
 def another_set(sets_strategy: SearchStrategy[Set]) -> Set:
     return find(sets_strategy)
+
+
+@pytest.fixture(scope='function')
+def sets_tuple(sets_strategy: SearchStrategy[Set]) -> Tuple[Set, ...]:
+    return find(strategies.to_homogeneous_tuples(sets_strategy,
+                                                 max_size=5))
@@ -0,0 +1,15 @@
+import pytest
+
+from tests import strategies
+from tests.utils import find
+from topo.bitmaps import BitmapSet
+
+
+@pytest.fixture(scope='function')
+def bitmap_set() -> BitmapSet:
+    return find(strategies.bitmap_sets)
+
+
+@pytest.fixture(scope='function')
+def other_bitmap_set() -> BitmapSet:
+    return find(strategies.bitmap_sets)
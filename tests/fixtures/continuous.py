@@ -1,8 +1,11 @@
+from typing import Tuple
+
 import pytest
 
 from tests import strategies
 from tests.utils import find
-from topo.continuous import Interval
+from topo.continuous import (Interval,
+                             IntervalUnion)
 
 
 @pytest.fixture(scope='function')
@@ -18,3 +21,28 @@ def other_interval() -> Interval:
 @pytest.fixture(scope='function')
 def another_interval() -> Interval:
     return find(strategies.intervals)
+
+
+@pytest.fixture(scope='function')
+def intervals_tuple() -> Tuple[Interval, ...]:
+    return find(strategies.intervals_tuples)
+
+
+@pytest.fixture(scope='function')
+def other_intervals_tuple() -> Tuple[Interval, ...]:
+    return find(strategies.intervals_tuples)
+
+
+@pytest.fixture(scope='function')
+def interval_union() -> IntervalUnion:
+    return find(strategies.interval_unions)
+
+
+@pytest.fixture(scope='function')
+def other_interval_union() -> IntervalUnion:
+    return find(strategies.interval_unions)
+
+
+@pytest.fixture(scope='function')
+def decimal_interval_union() -> IntervalUnion:
+    return find(strategies.decimal_interval_unions)
@@ -0,0 +1,15 @@
+import pytest
+
+from tests import strategies
+from tests.utils import find
+from topo.discrete import NumericDiscreteSet
+
+
+@pytest.fixture(scope='function')
+def numeric_discrete_set() -> NumericDiscreteSet:
+    return find(strategies.numeric_discrete_sets)
+
+
+@pytest.fixture(scope='function')
+def other_numeric_discrete_set() -> NumericDiscreteSet:
+    return find(strategies.numeric_discrete_sets)
@@ -0,0 +1,21 @@
+import pytest
+
+from tests import strategies
+from tests.utils import find
+from topo.base import Set
+from topo.floats import FloatInterval
+
+
+@pytest.fixture(scope='function')
+def float_interval() -> FloatInterval:
+    return find(strategies.float_intervals)
+
+
+@pytest.fixture(scope='function')
+def float_interval_union() -> Set:
+    return find(strategies.float_interval_unions)
+
+
+@pytest.fixture(scope='function')
+def other_float_interval_union() -> Set:
+    return find(strategies.float_interval_unions)
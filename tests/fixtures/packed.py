@@ -0,0 +1,18 @@
+from typing import List
+
+import pytest
+
+from tests import strategies
+from tests.strategies.packed import IntervalRow
+from tests.utils import find
+from topo.packed import PackedIntervalUnion
+
+
+@pytest.fixture(scope='function')
+def packed_interval_union() -> PackedIntervalUnion:
+    return find(strategies.packed_interval_unions)
+
+
+@pytest.fixture(scope='function')
+def intervals_rows() -> List[IntervalRow]:
+    return find(strategies.intervals_rows)
@@ -0,0 +1,10 @@
+import pytest
+
+from tests import strategies
+from tests.utils import find
+from topo.persistent import PersistentIntervalSet
+
+
+@pytest.fixture(scope='function')
+def persistent_interval_set() -> PersistentIntervalSet:
+    return find(strategies.persistent_interval_sets)
@@ -0,0 +1,15 @@
+import pytest
+
+from tests import strategies
+from tests.utils import find
+from topo.ranges import RangeSet
+
+
+@pytest.fixture(scope='function')
+def range_set() -> RangeSet:
+    return find(strategies.range_sets)
+
+
+@pytest.fixture(scope='function')
+def other_range_set() -> RangeSet:
+    return find(strategies.range_sets)
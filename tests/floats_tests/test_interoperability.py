@@ -0,0 +1,75 @@
+from operator import (and_,
+                      eq,
+                      ge,
+                      le,
+                      or_,
+                      sub,
+                      xor)
+
+from tests.utils import equivalence
+from topo.base import (EMPTY_SET,
+                       Set,
+                       Union)
+from topo.continuous import Interval
+from topo.floats import (FloatInterval,
+                         FloatIntervalUnion,
+                         float_real_line,
+                         float_real_line_extended)
+
+
+def to_generic(set_: Set) -> Set:
+    return Union(*[Interval(subset.left_end, subset.right_end,
+                            left_end_inclusive=subset.left_end_inclusive,
+                            right_end_inclusive=subset.right_end_inclusive)
+                   if isinstance(subset, Interval)
+                   else subset
+                   for subset in set_.unfold()]).fold()
+
+
+def test_equivalence(float_interval_union: Set) -> None:
+    generic = to_generic(float_interval_union)
+
+    assert float_interval_union == generic
+    assert generic == float_interval_union
+    assert hash(float_interval_union) == hash(generic)
+
+
+def test_membership(float_interval_union: Set) -> None:
+    generic = to_generic(float_interval_union)
+    points = [point
+              for subset in float_interval_union.unfold()
+              if isinstance(subset, Interval)
+              for point in (subset.left_end, subset.right_end,
+                            (subset.left_end + subset.right_end) / 2)]
+    points.append(float('nan'))
+
+    assert all(equivalence(point in float_interval_union, point in generic)
+               for point in points)
+
+
+def test_operations(float_interval_union: Set,
+                    other_float_interval_union: Set) -> None:
+    generic = to_generic(float_interval_union)
+    other_generic = to_generic(other_float_interval_union)
+
+    for operation in (and_, or_, sub, xor):
+        result = operation(float_interval_union, other_float_interval_union)
+
+        assert result == operation(generic, other_generic)
+        assert result == operation(float_interval_union, other_generic)
+        assert result == operation(generic, other_float_interval_union)
+        assert all(isinstance(subset, FloatInterval)
+                   or not isinstance(subset, Interval)
+                   for subset in result.unfold())
+    for relation in (eq, ge, le):
+        assert (relation(float_interval_union, other_float_interval_union)
+                is relation(generic, other_generic))
+
+
+def test_unbounded(float_interval: FloatInterval) -> None:
+    assert float_interval <= float_real_line_extended
+    assert float_interval - float_real_line_extended is EMPTY_SET
+    assert float('inf') not in float_real_line
+    assert float('inf') in float_real_line_extended
+    assert isinstance(float_interval | float_real_line,
+                      (FloatInterval, FloatIntervalUnion))
@@ -0,0 +1,40 @@
+from tests.utils import implication
+from topo.base import (EMPTY_SET,
+                       Set,
+                       Union)
+from topo.continuous import (Interval,
+                             IntervalUnion)
+from topo.discrete import DiscreteSet
+from topo.ranges import RangeSet
+
+
+def test_consistency_with_equality(set_: Set, other_set: Set) -> None:
+    assert implication(set_ == other_set, hash(set_) == hash(other_set))
+
+
+def test_empty_discrete_set() -> None:
+    assert hash(DiscreteSet()) == hash(EMPTY_SET)
+
+
+def test_singleton_union(interval: Interval) -> None:
+    union = Union(interval)
+
+    assert union == interval
+    assert hash(union) == hash(interval)
+
+
+def test_interval_union(interval_union: IntervalUnion,
+                        range_set: RangeSet) -> None:
+    union = Union(interval_union, range_set)
+    points_union = interval_union | DiscreteSet(*range_set)
+
+    assert union == points_union
+    assert hash(union) == hash(points_union)
+
+
+def test_caching(set_: Set) -> None:
+    assert hash(set_) == hash(set_)
+
+
+def test_compactness(set_: Set) -> None:
+    assert not hasattr(set_, '__dict__')
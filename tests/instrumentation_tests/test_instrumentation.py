@@ -0,0 +1,69 @@
+from topo import base
+from topo.base import (Set,
+                       Union)
+from topo.continuous import Interval
+from topo.ranges import RangeSet
+from topo.instrumentation import (Instrumentation,
+                                  enabled_instrumentations,
+                                  instrumentation)
+
+
+def test_disabling() -> None:
+    method, compress = Interval.__and__, base.compress
+
+    with instrumentation() as statistics:
+        assert enabled_instrumentations() == [statistics]
+        assert Interval.__and__ is not method
+        assert base.compress is not compress
+
+    assert enabled_instrumentations() == []
+    assert Interval.__and__ is method
+    assert base.compress is compress
+
+
+def test_operations(set_: Set, other_set: Set) -> None:
+    result = set_ & other_set
+
+    with Instrumentation() as statistics:
+        instrumented_result = set_ & other_set
+        set_ <= other_set
+
+    operations = statistics.operations_statistics()
+    assert instrumented_result == result
+    assert any(name in ('__and__', '__rand__')
+               for name, _, _ in operations)
+    assert any(name in ('__le__', '__ge__')
+               for name, _, _ in operations)
+    assert all(values['calls'] > 0 and values['seconds'] >= 0
+               for values in operations.values())
+
+
+def test_compress() -> None:
+    with Instrumentation() as statistics:
+        union = Union(Interval(0, 1), Interval(1, 2), RangeSet(range(5, 7)))
+        union.subsets
+
+    compress_statistics = statistics.compress_statistics()
+    assert compress_statistics['calls'] == 1
+    assert compress_statistics['input_size'] == 3
+    assert compress_statistics['output_size'] == 2
+    assert compress_statistics['unions'] > 0
+
+
+def test_export(set_: Set, other_set: Set) -> None:
+    metrics = []
+
+    with Instrumentation() as statistics:
+        set_ | other_set
+
+    statistics.export(lambda name, tags, value:
+                      metrics.append((name, tags, value)))
+    dictionary = statistics.to_dict()
+    assert len(metrics) == (2 * len(dictionary['operations'])
+                            + len(dictionary['compress']))
+
+    statistics.reset()
+
+    assert statistics.to_dict() == {
+        'operations': [],
+        'compress': dict.fromkeys(dictionary['compress'], 0)}
@@ -0,0 +1,38 @@
+from typing import Tuple
+
+from topo.continuous import Interval
+from topo.joins import join_intervals
+
+
+def test_intersecting(intervals_tuple: Tuple[Interval, ...],
+                      other_intervals_tuple: Tuple[Interval, ...]) -> None:
+    result = join_intervals(dict(enumerate(intervals_tuple)),
+                            dict(enumerate(other_intervals_tuple)))
+
+    assert sorted(result) == [
+        (key, other_key)
+        for key, interval in enumerate(intervals_tuple)
+        for other_key, other_interval in enumerate(other_intervals_tuple)
+        if interval.intersects_with_interval(other_interval)]
+
+
+def test_merging(intervals_tuple: Tuple[Interval, ...],
+                 other_intervals_tuple: Tuple[Interval, ...]) -> None:
+    result = join_intervals(dict(enumerate(intervals_tuple)),
+                            dict(enumerate(other_intervals_tuple)),
+                            merging=True)
+
+    assert sorted(result) == [
+        (key, other_key)
+        for key, interval in enumerate(intervals_tuple)
+        for other_key, other_interval in enumerate(other_intervals_tuple)
+        if interval.merges_with_interval(other_interval)]
+
+
+def test_self_join(intervals_tuple: Tuple[Interval, ...]) -> None:
+    intervals = dict(enumerate(intervals_tuple))
+
+    result = set(join_intervals(intervals, intervals))
+
+    assert all((key, key) in result for key in intervals)
+    assert all((other_key, key) in result for key, other_key in result)
@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from topo.base import Set
+from topo.lazy import (Expression,
+                       lazy)
+
+
+def test_evaluation(set_: Set, other_set: Set, another_set: Set) -> None:
+    result = (lazy(set_) | other_set) & (lazy(set_) - another_set)
+
+    assert result.evaluate() == (set_ | other_set) & (set_ - another_set)
+
+
+def test_membership(set_: Set,
+                    other_set: Set,
+                    floats_tuple: Tuple[float, ...]) -> None:
+    result = lazy(set_) ^ other_set
+
+    assert all((number in result) is (number in (set_ ^ other_set))
+               for number in floats_tuple)
+
+
+def test_subexpressions_sharing(set_: Set, other_set: Set) -> None:
+    result = lazy(set_) | lazy(other_set)
+
+    assert result is lazy(other_set) | lazy(set_)
+    assert result & set_ is (lazy(set_) | other_set) & set_
+
+
+def test_truthiness(set_: Set, other_set: Set) -> None:
+    result = lazy(set_) & other_set
+
+    assert bool(result) is bool(set_ & other_set)
+
+
+def test_abstractness() -> None:
+    assert '_compute' in Expression.__abstractmethods__
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from typing import Tuple
+
+from topo.base import Set
+from topo.continuous import (Interval,
+                             IntervalUnion)
+
+
+def test_basic(set_: Set, floats_tuple: Tuple[float, ...]) -> None:
+    result = set_.contains_many(floats_tuple)
+
+    assert result.shape == (len(floats_tuple),)
+    assert result.tolist() == [number in set_ for number in floats_tuple]
+
+
+def test_objects(set_: Set) -> None:
+    objects = [object(), 'a', None, 0, 1.5]
+
+    result = set_.contains_many(objects)
+
+    assert result.tolist() == [object_ in set_ for object_ in objects]
+
+
+def test_decimal_ends() -> None:
+    union = IntervalUnion(Interval(Decimal('1.5'), 3), Interval(5, 6))
+    numbers = [0, 2, 4, 5, 7]
+
+    result = union.contains_many(numbers)
+
+    assert result.tolist() == [number in union for number in numbers]
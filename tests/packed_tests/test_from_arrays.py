@@ -0,0 +1,44 @@
+from typing import List
+
+import pytest
+
+from tests.strategies.packed import IntervalRow
+from topo.base import Union
+from topo.continuous import Interval
+from topo.packed import PackedIntervalUnion
+
+
+def test_equivalence(intervals_rows: List[IntervalRow]) -> None:
+    left_ends, right_ends, left_ends_inclusive, right_ends_inclusive = (
+        map(list, zip(*intervals_rows)) if intervals_rows else ([],) * 4)
+
+    result = PackedIntervalUnion.from_arrays(left_ends, right_ends,
+                                             left_ends_inclusive,
+                                             right_ends_inclusive)
+
+    assert result == Union(*[
+        Interval(left_end, right_end,
+                 left_end_inclusive=left_end_inclusive,
+                 right_end_inclusive=right_end_inclusive)
+        for (left_end, right_end,
+             left_end_inclusive, right_end_inclusive) in intervals_rows])
+    assert PackedIntervalUnion.from_columns(*result.columns) == result
+
+
+def test_common_inclusions() -> None:
+    result = PackedIntervalUnion.from_arrays([2, 0, 1], [3, 1, 1],
+                                             right_ends_inclusive=False)
+
+    assert result.fold() == Union(Interval(0, 1,
+                                           right_end_inclusive=False),
+                                  Interval(2, 3,
+                                           right_end_inclusive=False))
+
+
+def test_invalid_ends() -> None:
+    with pytest.raises(ValueError):
+        PackedIntervalUnion.from_arrays([0, 1], [1])
+    with pytest.raises(ValueError):
+        PackedIntervalUnion.from_arrays([[0]], [[1]])
+    with pytest.raises(ValueError):
+        PackedIntervalUnion.from_arrays(['a'], ['b'])
@@ -0,0 +1,23 @@
+from tests.utils import equivalence
+from topo.continuous import IntervalUnion
+from topo.packed import PackedIntervalUnion
+
+
+def test_equivalence(packed_interval_union: PackedIntervalUnion) -> None:
+    result = IntervalUnion.from_pieces(packed_interval_union.pieces())
+
+    assert result == packed_interval_union
+    assert packed_interval_union == result
+    assert hash(result) == hash(packed_interval_union)
+
+
+def test_membership(packed_interval_union: PackedIntervalUnion) -> None:
+    folded = packed_interval_union.fold()
+    ends = [end
+            for left_end, _, right_end, _ in packed_interval_union.pieces()
+            for end in (left_end, right_end)]
+
+    assert all(equivalence(end in packed_interval_union, end in folded)
+               for end in ends)
+    assert (packed_interval_union.contains_many(ends).tolist()
+            == folded.contains_many(ends).tolist())
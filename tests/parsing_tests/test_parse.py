@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from topo.continuous import IntervalUnion
+from topo.discrete import NumericDiscreteSet
+from topo.packed import PackedIntervalUnion
+from topo.parsing import (parse,
+                          parse_lines)
+from topo.ranges import RangeSet
+
+
+def test_interval_union(packed_interval_union: PackedIntervalUnion) -> None:
+    set_ = packed_interval_union.fold()
+
+    result = parse(str(set_))
+
+    assert result == set_
+
+
+def test_decimal_interval_union(decimal_interval_union: IntervalUnion
+                                ) -> None:
+    result = parse(str(decimal_interval_union),
+                   number_type=Decimal)
+
+    assert result == decimal_interval_union
+
+
+def test_numeric_discrete_set(numeric_discrete_set: NumericDiscreteSet
+                              ) -> None:
+    result = parse(str(numeric_discrete_set))
+
+    assert result == numeric_discrete_set
+
+
+def test_range_set(range_set: RangeSet) -> None:
+    result = parse(str(range_set))
+
+    assert not (result - range_set) and not (range_set - result)
+
+
+def test_lines(packed_interval_union: PackedIntervalUnion,
+               numeric_discrete_set: NumericDiscreteSet) -> None:
+    sets = [packed_interval_union.fold(), numeric_discrete_set]
+    lines = [str(set_) + '\n' for set_ in sets]
+
+    result = list(parse_lines(lines))
+
+    assert result == sets
+
+
+def test_invalid() -> None:
+    for string in ['', 'or', '[0, 1', '[0, 1) {2}', '{a}', '{1, ..., 2.5}',
+                   '[0, 1] or']:
+        with pytest.raises(ValueError):
+            parse(string)
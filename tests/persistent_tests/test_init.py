@@ -0,0 +1,17 @@
+from topo.continuous import IntervalUnion
+from topo.persistent import PersistentIntervalSet
+
+
+def test_equivalence(interval_union: IntervalUnion) -> None:
+    result = PersistentIntervalSet(interval_union)
+
+    assert result == interval_union
+    assert interval_union == result
+    assert hash(result) == hash(interval_union)
+    assert list(result.pieces()) == list(interval_union.pieces())
+
+
+def test_pieces(persistent_interval_set: PersistentIntervalSet) -> None:
+    pieces = list(persistent_interval_set.pieces())
+
+    assert PersistentIntervalSet.from_pieces(pieces) == persistent_interval_set
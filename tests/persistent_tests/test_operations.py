@@ -0,0 +1,52 @@
+from typing import Tuple
+
+from tests.utils import equivalence
+from topo.continuous import (Interval,
+                             IntervalUnion)
+from topo.persistent import PersistentIntervalSet
+
+
+def test_add(persistent_interval_set: PersistentIntervalSet,
+             interval: Interval) -> None:
+    result = persistent_interval_set.add(interval)
+
+    assert isinstance(result, PersistentIntervalSet)
+    assert result == persistent_interval_set.fold() | interval
+
+
+def test_discard(persistent_interval_set: PersistentIntervalSet,
+                 interval: Interval) -> None:
+    result = persistent_interval_set.discard(interval)
+
+    assert isinstance(result, PersistentIntervalSet)
+    assert result == persistent_interval_set.fold() - interval
+
+
+def test_versions(persistent_interval_set: PersistentIntervalSet,
+                  intervals_tuple: Tuple[Interval, ...]) -> None:
+    initial_pieces = list(persistent_interval_set.pieces())
+    version = persistent_interval_set
+
+    for interval in intervals_tuple:
+        version = version.add(interval)
+        version = version.discard(interval)
+
+    assert list(persistent_interval_set.pieces()) == initial_pieces
+
+
+def test_binary_operations(persistent_interval_set: PersistentIntervalSet,
+                           interval_union: IntervalUnion) -> None:
+    folded = persistent_interval_set.fold()
+
+    assert persistent_interval_set & interval_union == folded & interval_union
+    assert persistent_interval_set | interval_union == folded | interval_union
+    assert persistent_interval_set - interval_union == folded - interval_union
+    assert persistent_interval_set ^ interval_union == folded ^ interval_union
+
+
+def test_membership(persistent_interval_set: PersistentIntervalSet,
+                    interval: Interval) -> None:
+    folded = persistent_interval_set.fold()
+
+    assert all(equivalence(end in persistent_interval_set, end in folded)
+               for end in (interval.left_end, interval.right_end))
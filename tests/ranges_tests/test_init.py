@@ -0,0 +1,23 @@
+from itertools import (islice,
+                       tee)
+
+from topo.discrete import DiscreteSet
+from topo.ranges import RangeSet
+
+
+def test_canonicity(range_set: RangeSet) -> None:
+    runs, next_runs = tee(range_set.runs())
+    for run, next_run in zip(runs, islice(next_runs, 1, None)):
+        start, stop = run
+        next_start, _ = next_run
+
+        assert start < stop < next_start
+
+
+def test_equivalence(range_set: RangeSet) -> None:
+    result = DiscreteSet(*range_set)
+
+    assert result == range_set
+    assert range_set == result
+    assert hash(result) == hash(range_set)
+    assert len(range_set) == len(result.points)
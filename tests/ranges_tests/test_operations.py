@@ -0,0 +1,89 @@
+from typing import Iterable
+
+from tests.utils import equivalence
+from topo.continuous import Interval
+from topo.discrete import DiscreteSet
+from topo.ranges import RangeSet
+
+
+def test_difference(range_set: RangeSet, other_range_set: RangeSet) -> None:
+    result = range_set - other_range_set
+
+    assert all(equivalence(integer in result,
+                           integer in range_set
+                           and integer not in other_range_set)
+               for integer in to_integers(range_set, other_range_set))
+
+
+def test_intersection(range_set: RangeSet,
+                      other_range_set: RangeSet) -> None:
+    result = range_set & other_range_set
+
+    assert all(equivalence(integer in result,
+                           integer in range_set
+                           and integer in other_range_set)
+               for integer in to_integers(range_set, other_range_set))
+
+
+def test_symmetric_difference(range_set: RangeSet,
+                              other_range_set: RangeSet) -> None:
+    result = range_set ^ other_range_set
+
+    assert all(equivalence(integer in result,
+                           (integer in range_set)
+                           ^ (integer in other_range_set))
+               for integer in to_integers(range_set, other_range_set))
+
+
+def test_union(range_set: RangeSet, other_range_set: RangeSet) -> None:
+    result = range_set | other_range_set
+
+    assert all(equivalence(integer in result,
+                           integer in range_set
+                           or integer in other_range_set)
+               for integer in to_integers(range_set, other_range_set))
+
+
+def test_discrete_set(range_set: RangeSet,
+                      other_range_set: RangeSet) -> None:
+    points = DiscreteSet(*other_range_set)
+
+    assert range_set & points == range_set & other_range_set
+    assert range_set | points == range_set | other_range_set
+    assert range_set - points == range_set - other_range_set
+
+
+def test_interval(range_set: RangeSet, interval: Interval) -> None:
+    result = range_set & interval
+
+    assert all(equivalence(integer in result,
+                           integer in interval)
+               for integer in range_set)
+
+
+def test_interval_difference(range_set: RangeSet,
+                             interval: Interval) -> None:
+    result = interval - range_set
+
+    assert result == interval - DiscreteSet(*range_set)
+
+
+def test_interval_union(range_set: RangeSet, interval: Interval) -> None:
+    result = range_set | interval
+    points_union = interval | DiscreteSet(*range_set)
+
+    assert result == points_union
+    assert hash(result) == hash(points_union)
+
+
+def test_interval_union_boundary() -> None:
+    result = RangeSet(range(0, 1)) | Interval(0, 1,
+                                              left_end_inclusive=False)
+
+    assert result == Interval(0, 1)
+    assert hash(result) == hash(Interval(0, 1))
+
+
+def to_integers(*sets: RangeSet) -> Iterable[int]:
+    for set_ in sets:
+        yield from set_
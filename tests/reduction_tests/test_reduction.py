@@ -0,0 +1,80 @@
+from functools import reduce
+from operator import (and_,
+                      or_)
+from typing import Tuple
+
+from topo.base import (EMPTY_SET,
+                       Union)
+from topo.continuous import (Interval,
+                             IntervalUnion)
+from topo.ranges import RangeSet
+from topo.reduction import (covered_by_at_least,
+                            intersect_all,
+                            union_all)
+
+
+def test_union(intervals_tuple: Tuple[Interval, ...],
+               interval_union: IntervalUnion) -> None:
+    sets = intervals_tuple + (interval_union,)
+
+    result = union_all(sets)
+
+    assert result == reduce(or_, sets, EMPTY_SET)
+
+
+def test_intersection(intervals_tuple: Tuple[Interval, ...],
+                      interval_union: IntervalUnion) -> None:
+    sets = intervals_tuple + (interval_union,)
+
+    result = intersect_all(sets)
+
+    assert result == reduce(and_, sets)
+
+
+def test_range_sets(range_set: RangeSet, other_range_set: RangeSet) -> None:
+    sets = [range_set, other_range_set]
+
+    assert union_all(sets) == range_set | other_range_set
+    assert intersect_all(sets) == range_set & other_range_set
+
+
+def test_workers(intervals_tuple: Tuple[Interval, ...],
+                 interval_union: IntervalUnion) -> None:
+    sets = intervals_tuple + (interval_union,)
+
+    assert union_all(sets,
+                     workers=2) == union_all(sets)
+    assert intersect_all(sets,
+                         workers=2) == intersect_all(sets)
+
+
+def test_workers_fallback(interval: Interval,
+                          other_interval: Interval) -> None:
+    sets = [Union(interval, RangeSet(range(10))),
+            Union(other_interval, RangeSet(range(5, 15)))]
+
+    assert union_all(sets,
+                     workers=2) == reduce(or_, sets)
+    assert intersect_all(sets,
+                         workers=2) == reduce(and_, sets)
+
+
+def test_covered_by_at_least(intervals_tuple: Tuple[Interval, ...],
+                             interval_union: IntervalUnion) -> None:
+    sets = intervals_tuple + (interval_union,)
+
+    assert covered_by_at_least(sets, 1) == union_all(sets)
+    assert covered_by_at_least(sets, len(sets)) == intersect_all(sets)
+    assert covered_by_at_least(sets, len(sets) + 1) == EMPTY_SET
+
+
+def test_covered_by_at_least_twice(interval: Interval,
+                                   other_interval: Interval,
+                                   another_interval: Interval) -> None:
+    sets = [interval, other_interval, another_interval]
+
+    result = covered_by_at_least(sets, 2)
+
+    assert result == ((interval & other_interval)
+                      | (interval & another_interval)
+                      | (other_interval & another_interval))
@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from topo.packed import PackedIntervalUnion
+from topo.serialization import dumps
+
+
+def test_unsupported_ends_type(packed_interval_union: PackedIntervalUnion
+                               ) -> None:
+    left_ends, right_ends, inclusions, points = packed_interval_union.columns
+    union = PackedIntervalUnion.from_columns(left_ends.astype(np.float32),
+                                             right_ends.astype(np.float32),
+                                             inclusions,
+                                             points.astype(np.float32))
+
+    with pytest.raises(ValueError):
+        dumps(union)
@@ -0,0 +1,32 @@
+import os
+
+from topo.discrete import NumericDiscreteSet
+from topo.packed import PackedIntervalUnion
+from topo.serialization import (dump,
+                                dumps,
+                                load,
+                                loads)
+
+
+def test_packed_interval_union(packed_interval_union: PackedIntervalUnion
+                               ) -> None:
+    result = loads(dumps(packed_interval_union))
+
+    assert result == packed_interval_union
+
+
+def test_numeric_discrete_set(numeric_discrete_set: NumericDiscreteSet
+                              ) -> None:
+    result = loads(dumps(numeric_discrete_set))
+
+    assert result == numeric_discrete_set
+
+
+def test_file(tmpdir, packed_interval_union: PackedIntervalUnion) -> None:
+    path = os.path.join(str(tmpdir), 'set.topo')
+    with open(path, 'wb') as file:
+        dump(packed_interval_union, file)
+
+    result = load(path)
+
+    assert result == packed_interval_union
@@ -0,0 +1,24 @@
+from typing import Tuple
+
+from topo.base import Set
+from topo.stabbing import StabbingIndex
+
+
+def test_stab(sets_tuple: Tuple[Set, ...],
+              floats_tuple: Tuple[float, ...]) -> None:
+    index = StabbingIndex(dict(enumerate(sets_tuple)))
+
+    assert all(sorted(index.stab(number))
+               == [key
+                   for key, set_ in enumerate(sets_tuple)
+                   if number in set_]
+               for number in floats_tuple)
+
+
+def test_stab_many(sets_tuple: Tuple[Set, ...],
+                   floats_tuple: Tuple[float, ...]) -> None:
+    index = StabbingIndex(dict(enumerate(sets_tuple)))
+
+    result = index.stab_many(floats_tuple)
+
+    assert result == [index.stab(number) for number in floats_tuple]
@@ -1,5 +1,18 @@
 from .base import (empty_sets,
                    to_unions)
-from .continuous import intervals
-from .discrete import to_discrete_sets
-from .literals.base import hashables
+from .bitmaps import bitmap_sets
+from .continuous import (decimal_interval_unions,
+                         interval_unions,
+                         intervals,
+                         intervals_tuples)
+from .discrete import (numeric_discrete_sets,
+                       to_discrete_sets)
+from .floats import (float_interval_unions,
+                     float_intervals)
+from .literals.base import (floats,
+                            hashables)
+from .literals.factories import to_homogeneous_tuples
+from .packed import (intervals_rows,
+                     packed_interval_unions)
+from .persistent import persistent_interval_sets
+from .ranges import range_sets
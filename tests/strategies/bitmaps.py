@@ -0,0 +1,15 @@
+from typing import List
+
+from hypothesis import strategies
+
+from topo.bitmaps import (CONTAINER_SIZE,
+                          BitmapSet)
+
+
+def bitmap_set_from_points(points: List[int]) -> BitmapSet:
+    return BitmapSet.from_points(points)
+
+
+bitmap_sets = (strategies.lists(strategies.integers(0, 100)
+                                | strategies.integers(0, 3 * CONTAINER_SIZE))
+               .map(bitmap_set_from_points))
@@ -1,16 +1,20 @@
 import math
 from functools import partial
 from operator import lt
-from typing import SupportsFloat
+from typing import (SupportsFloat,
+                    Tuple)
 
 from hypothesis import strategies
 from hypothesis.searchstrategy import SearchStrategy
 
 from tests.utils import Domain
-from topo.continuous import Interval
+from topo.continuous import (Interval,
+                             IntervalUnion)
 from topo.hints import Map
 from .literals.base import (booleans,
+                            decimals,
                             real_numbers)
+from .literals.factories import to_homogeneous_tuples
 
 
 @strategies.composite
@@ -28,3 +32,17 @@ def to_intervals(draw: Map[SearchStrategy[Domain], Domain],
 
 
 intervals = to_intervals(real_numbers)
+
+
+def to_intervals_tuples(intervals_strategy: SearchStrategy[Interval]
+                        ) -> SearchStrategy[Tuple[Interval, ...]]:
+    return to_homogeneous_tuples(intervals_strategy,
+                                 max_size=5)
+
+
+intervals_tuples = to_intervals_tuples(intervals)
+interval_unions = intervals_tuples.map(lambda intervals_tuple:
+                                       IntervalUnion(*intervals_tuple))
+decimal_interval_unions = (to_intervals_tuples(to_intervals(decimals))
+                           .map(lambda intervals_tuple:
+                                IntervalUnion(*intervals_tuple)))
@@ -1,10 +1,12 @@
 from typing import (Iterable,
                     Optional)
 
+from hypothesis import strategies
 from hypothesis.searchstrategy import SearchStrategy
 
 from tests.utils import Domain
-from topo.discrete import DiscreteSet
+from topo.discrete import (DiscreteSet,
+                           NumericDiscreteSet)
 from .literals.factories import to_homogeneous_tuples
 
 
@@ -20,3 +22,8 @@ def to_discrete_sets(elements: SearchStrategy[Domain],
                                   min_size=min_size,
                                   max_size=max_size)
             .map(discrete_set_from_points))
+
+
+numeric_discrete_sets = (to_homogeneous_tuples(strategies.integers(-10, 10)
+                                               | strategies.floats(-10, 10))
+                         .map(NumericDiscreteSet.from_array))
@@ -0,0 +1,30 @@
+from typing import Tuple
+
+from hypothesis import strategies
+
+from topo.base import (Set,
+                       Union)
+from topo.continuous import Interval
+from topo.floats import FloatInterval
+from .continuous import (to_intervals,
+                         to_intervals_tuples)
+
+float_ends = strategies.floats(allow_nan=False,
+                               allow_infinity=True)
+
+
+def float_interval_from_interval(interval: Interval) -> FloatInterval:
+    return FloatInterval(interval.left_end, interval.right_end,
+                         left_end_inclusive=interval.left_end_inclusive,
+                         right_end_inclusive=interval.right_end_inclusive)
+
+
+def float_interval_union_from_intervals(intervals_tuple: Tuple[Interval,
+                                                               ...]) -> Set:
+    return Union(*map(float_interval_from_interval, intervals_tuple)).fold()
+
+
+float_intervals = (to_intervals(float_ends)
+                   .map(float_interval_from_interval))
+float_interval_unions = (to_intervals_tuples(to_intervals(float_ends))
+                         .map(float_interval_union_from_intervals))
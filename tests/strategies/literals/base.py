@@ -9,11 +9,14 @@ from .factories import (to_byte_strings,
 booleans = strategies.booleans()
 integers = (booleans
             | strategies.integers())
+floats = strategies.floats(allow_nan=True,
+                           allow_infinity=True)
+decimals = strategies.decimals(allow_nan=False,
+                               allow_infinity=True)
 real_numbers = (integers
                 | strategies.floats(allow_nan=False,
                                     allow_infinity=True)
-                | strategies.decimals(allow_nan=False,
-                                      allow_infinity=True))
+                | decimals)
 numbers = (real_numbers
            | strategies.complex_numbers(allow_nan=False,
                                         allow_infinity=True))
@@ -0,0 +1,46 @@
+from typing import (Any,
+                    List,
+                    Tuple)
+
+from hypothesis import strategies
+from hypothesis.searchstrategy import SearchStrategy
+
+from topo.continuous import Interval
+from topo.packed import PackedIntervalUnion
+from .continuous import (to_intervals,
+                         to_intervals_tuples)
+
+MAX_EXACT_FLOAT_INTEGER = 2 ** 53
+
+packable_ends = (strategies.integers(-MAX_EXACT_FLOAT_INTEGER,
+                                     MAX_EXACT_FLOAT_INTEGER)
+                 | strategies.floats(allow_nan=False,
+                                     allow_infinity=True))
+
+
+def packed_interval_union_from_intervals(intervals_tuple: Tuple[Interval,
+                                                                ...]
+                                         ) -> PackedIntervalUnion:
+    return PackedIntervalUnion(*intervals_tuple)
+
+
+packed_interval_unions = (to_intervals_tuples(to_intervals(packable_ends))
+                          .map(packed_interval_union_from_intervals))
+
+IntervalRow = Tuple[Any, Any, bool, bool]
+
+
+def to_intervals_rows(ends: SearchStrategy[Any]
+                      ) -> SearchStrategy[List[IntervalRow]]:
+    """
+    Returns strategy of rows of intervals ends & their inclusions
+    with both empty & overlapping intervals.
+    """
+    return strategies.lists(strategies.tuples(ends, ends,
+                                              strategies.booleans(),
+                                              strategies.booleans()))
+
+
+intervals_rows = (to_intervals_rows(strategies.integers(-100, 100))
+                  | to_intervals_rows(strategies.floats(allow_nan=False,
+                                                        allow_infinity=True)))
@@ -0,0 +1,15 @@
+from typing import Tuple
+
+from topo.continuous import Interval
+from topo.persistent import PersistentIntervalSet
+from .continuous import intervals_tuples
+
+
+def persistent_interval_set_from_intervals(intervals_tuple: Tuple[Interval,
+                                                                  ...]
+                                           ) -> PersistentIntervalSet:
+    return PersistentIntervalSet(*intervals_tuple)
+
+
+persistent_interval_sets = intervals_tuples.map(
+        persistent_interval_set_from_intervals)
@@ -0,0 +1,23 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from topo.ranges import RangeSet
+
+
+def to_range(bounds: Tuple[int, int]) -> range:
+    start, size = bounds
+    return range(start, start + size)
+
+
+def range_set_from_ranges(ranges_list: List[range]) -> RangeSet:
+    return RangeSet(*ranges_list)
+
+
+ranges = (strategies.tuples(strategies.integers(-100, 100),
+                            strategies.integers(0, 10))
+          .map(to_range))
+range_sets = (strategies.lists(ranges,
+                               max_size=5)
+              .map(range_set_from_ranges))
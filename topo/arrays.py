@@ -0,0 +1,136 @@
+import math
+from decimal import Decimal
+from numbers import (Complex,
+                     Number)
+from typing import (Any,
+                    Iterable,
+                    Optional,
+                    SupportsFloat)
+
+import numpy as np
+
+NUMERIC_KINDS = 'biufc'
+REAL_KINDS = 'fiu'
+
+
+def to_array(objects: Iterable[Any]) -> np.ndarray:
+    """
+    Converts given array-like, buffer or iterable into array.
+    """
+    if isinstance(objects, np.ndarray):
+        return objects
+    if not hasattr(objects, '__len__'):
+        objects = list(objects)
+    result = np.asarray(objects)
+    if result.dtype.kind not in NUMERIC_KINDS:
+        result = np.asarray(objects,
+                            dtype=object)
+    return result
+
+
+def is_numeric(array: np.ndarray) -> bool:
+    return array.dtype.kind in NUMERIC_KINDS
+
+
+def is_real(array: np.ndarray) -> bool:
+    """
+    Checks if array consists of real numbers
+    each of which can be compared with others without ambiguities.
+    """
+    return array.dtype.kind in REAL_KINDS and not np.isnan(array).any()
+
+
+def is_cast_exact(array: np.ndarray, dtype: np.dtype) -> bool:
+    """
+    Checks if array values do not change after casting to given type,
+    which does not hold e.g. for integers too large for floats.
+    """
+    if array.dtype.kind in 'iu' and dtype.kind == 'f':
+        limit = 2 ** (np.finfo(dtype).nmant + 1)
+        if (not array.size
+                or -limit <= array.min() and array.max() <= limit):
+            return True
+        return array.astype(dtype).tolist() == array.tolist()
+    return np.can_cast(array.dtype, dtype)
+
+
+def represents_exactly(array: np.ndarray, objects: Any) -> bool:
+    """
+    Checks if array created from given objects represents them exactly,
+    e.g. integers mixed with floats are not rounded.
+    """
+    if array is objects or array.dtype.kind != 'f' or not array.size:
+        return True
+    limit = 2 ** (np.finfo(array.dtype).nmant + 1)
+    if np.abs(array).max() < limit:
+        # integers below the limit are represented exactly
+        # and larger ones are never rounded below it
+        return True
+    return (np.asarray(objects,
+                       dtype=object).ravel().tolist()
+            == array.ravel().tolist())
+
+
+def in_sorted(sorted_array: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Checks membership of given values in sorted array
+    returning boolean mask of values shape.
+    """
+    if not sorted_array.size:
+        return np.zeros(values.shape,
+                        dtype=bool)
+    indices = np.searchsorted(sorted_array, values)
+    np.minimum(indices, sorted_array.size - 1,
+               out=indices)
+    return sorted_array[indices] == values
+
+
+def to_array_scalar(number: Any) -> Any:
+    """
+    Converts number into one which can be compared with array
+    without falling back to element-wise ``object`` comparisons.
+    """
+    if isinstance(number, Decimal) and number.is_infinite():
+        return float(number)
+    return number
+
+
+def to_real_parts(array: np.ndarray) -> np.ndarray:
+    """
+    Returns real parts of complex array elements
+    replacing ones with non-zero imaginary parts by NaN.
+    """
+    if array.dtype.kind != 'c':
+        return array
+    return np.where(array.imag == 0, array.real, np.nan)
+
+
+def to_real_point(object_: Any) -> Optional[SupportsFloat]:
+    """
+    Returns real number which given object is equal to
+    or ``None`` if there is no such one.
+    """
+    if not isinstance(object_, Number):
+        return None
+    if isinstance(object_, Complex):
+        if object_.imag:
+            return None
+        object_ = object_.real
+    if math.isnan(object_):
+        return None
+    return object_
+
+
+def to_integer(object_: Any) -> Optional[int]:
+    """
+    Returns integer which given object is equal to
+    or ``None`` if there is no such one.
+    """
+    real_point = to_real_point(object_)
+    if real_point is None:
+        return None
+    try:
+        result = int(real_point)
+    except OverflowError:
+        return None
+    return result if result == real_point else None
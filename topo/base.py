@@ -1,20 +1,78 @@
 from abc import (ABC,
                  abstractmethod)
-from functools import reduce
+from functools import (reduce,
+                       wraps)
 from itertools import repeat
 from operator import (and_,
+                      methodcaller,
                       sub)
-from typing import (FrozenSet,
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    FrozenSet,
                     Generic,
-                    Iterable)
+                    Iterable,
+                    Optional,
+                    Tuple)
 
+import numpy as np
 from reprit.base import generate_repr
 
+from .arrays import (to_array,
+                     to_real_point)
+from .dispatch import dispatched
 from .functional import flatmap
 from .hints import Domain
 
+Bounds = Tuple[Any, bool, Any, bool]
+Operation = Callable[['Set', 'Set'], Any]
+
+# results of operations with operands having disjoint bounds,
+# both operands are non-empty since empty sets have no bounds
+disjoint_results = {
+    '__and__': lambda set_, other: EMPTY_SET,
+    '__eq__': lambda set_, other: False,
+    '__ge__': lambda set_, other: False,
+    '__le__': lambda set_, other: False,
+    '__rand__': lambda set_, other: EMPTY_SET,
+    '__rsub__': lambda set_, other: other,
+    '__sub__': lambda set_, other: set_,
+}  # type: Dict[str, Operation]
+
+
+def rejecting_disjoint(method: Operation) -> Operation:
+    """
+    Decorates operation method to return result right away
+    for operands with disjoint bounds.
+    """
+    to_disjoint_result = disjoint_results[method.__name__]
+
+    @wraps(method)
+    def wrapped(set_: 'Set', other: Any) -> Any:
+        if isinstance(other, Set):
+            bounds, other_bounds = set_.bounds, other.bounds
+            if (bounds is not None and other_bounds is not None
+                    and are_bounds_disjoint(bounds, other_bounds)):
+                return to_disjoint_result(set_, other)
+        return method(set_, other)
+
+    return wrapped
+
 
 class Set(ABC, Generic[Domain]):
+    __slots__ = ()
+
+    union_type = None
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        """
+        Returns infimum & supremum with flags of their inclusion
+        if set is non-empty & consists of real numbers
+        and ``None`` otherwise or if they are unknown.
+        """
+        return None
+
     @abstractmethod
     def __bool__(self) -> bool:
         """
@@ -66,6 +124,7 @@ class Set(ABC, Generic[Domain]):
         """
         pass
 
+    @dispatched
     def __eq__(self, other: 'Set') -> bool:
         """
         Checks equality with given set.
@@ -76,6 +135,7 @@ class Set(ABC, Generic[Domain]):
             return not other
         return not (self - other) and not (other - self)
 
+    @dispatched
     def __ge__(self, other: 'Set') -> bool:
         """
         Checks if set is superset of given set.
@@ -84,6 +144,7 @@ class Set(ABC, Generic[Domain]):
             return NotImplemented
         return self & other == other
 
+    @dispatched
     def __gt__(self, other: 'Set') -> bool:
         """
         Checks if set is strict superset of given set.
@@ -92,6 +153,7 @@ class Set(ABC, Generic[Domain]):
             return NotImplemented
         return self >= other and self != other
 
+    @dispatched
     def __le__(self, other: 'Set') -> bool:
         """
         Checks if set is subset of given set.
@@ -100,6 +162,7 @@ class Set(ABC, Generic[Domain]):
             return NotImplemented
         return self & other == self
 
+    @dispatched
     def __lt__(self, other: 'Set') -> bool:
         """
         Checks if set is strict subset of given set.
@@ -108,9 +171,32 @@ class Set(ABC, Generic[Domain]):
             return NotImplemented
         return self <= other and self != other
 
+    def __invert__(self) -> 'Set':
+        """
+        Returns complement to the real line.
+        """
+        # module of continuous sets depends on this one
+        from .continuous import complement
+        return complement(self)
+
+    @dispatched
     def __rsub__(self, other: 'Set') -> 'Set':
         return NotImplemented
 
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        """
+        Checks membership of given objects
+        returning boolean mask of the same shape.
+        """
+        objects = to_array(objects)
+        # array scalars are not comparable with every number type
+        # (e.g. with decimals), so plain ones are checked
+        return (np.fromiter(map(self.__contains__, objects.ravel().tolist()),
+                            dtype=bool,
+                            count=objects.size)
+                .reshape(objects.shape))
+
+    @dispatched
     def __xor__(self, other: 'Set') -> 'Set':
         """
         Symmetrically subtracts given set.
@@ -128,6 +214,8 @@ EMPTY_SET_STRING = '{}'
 
 
 class EmptySet(Set[Domain]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -142,45 +230,58 @@ class EmptySet(Set[Domain]):
     def __str__(self) -> str:
         return EMPTY_SET_STRING
 
+    @dispatched
     def __and__(self, other: Set) -> Set:
         return self
 
     def __contains__(self, object_: Domain) -> bool:
         return False
 
+    @dispatched
     def __eq__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
         return not other
 
+    @dispatched
     def __ge__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
         return not other
 
+    @dispatched
     def __gt__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
         return False
 
+    @dispatched
     def __le__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
         return True
 
+    @dispatched
     def __lt__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
         return bool(other)
 
+    @dispatched
     def __or__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
         return other
 
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        return np.zeros(to_array(objects).shape,
+                        dtype=bool)
+
+    @dispatched
     def __rsub__(self, other: Set) -> Set:
         return other
 
+    @dispatched
     def __sub__(self, other: Set) -> Set:
         return self
 
@@ -189,9 +290,45 @@ EMPTY_SET = EmptySet()
 
 
 class Union(Set[Domain]):
+    __slots__ = ('_disperse', '_subsets', '_hash', '_bounds')
+
+    def __new__(cls, *subsets: Set) -> 'Union':
+        if cls is not Union:
+            return super().__new__(cls)
+        subsets = list(filter(None, flatmap(methodcaller('unfold'), subsets)))
+        union_types = {subset.union_type for subset in subsets} - {None}
+        if not union_types:
+            return super().__new__(cls)
+        # specialized union types are subclasses of general ones,
+        # so the most general of them should be able to unite all subsets
+        union_type = min(union_types,
+                         key=lambda type_: len(type_.__mro__))
+        if not all(issubclass(type_, union_type) for type_ in union_types):
+            return super().__new__(cls)
+        for union_type in union_type.__mro__:
+            if union_type is Union:
+                break
+            if (issubclass(union_type, Union)
+                    and union_type.unites(subsets)):
+                return super().__new__(union_type)
+        return super().__new__(cls)
+
     def __init__(self, *subsets: Set) -> None:
         self._disperse = True
         self._subsets = frozenset(filter(None, flatmap(Set.unfold, subsets)))
+        self._hash = None
+        self._bounds = None
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if self._bounds is None:
+            # bounds do not depend on compression,
+            # so they are computed from the original subsets
+            bounds = [subset.bounds for subset in self._subsets]
+            self._bounds = (unite_bounds(bounds)
+                            if bounds and None not in bounds
+                            else ())
+        return self._bounds or None
 
     @property
     def subsets(self) -> FrozenSet[Set]:
@@ -201,10 +338,20 @@ class Union(Set[Domain]):
         return self._subsets
 
     def __bool__(self) -> bool:
-        return any(map(bool, self.subsets))
+        # empty subsets are filtered out on creation
+        # and compression never produces new empty ones
+        return bool(self._subsets)
 
     def __hash__(self) -> int:
-        return hash(self.subsets)
+        if self._hash is None:
+            set_ = self.fold()
+            # combining hashes of subsets instead of subsets themselves
+            # allows specialized unions to hash their subsets
+            # without creating them
+            self._hash = (hash(frozenset(map(hash, self.subsets)))
+                          if set_ is self
+                          else hash(set_))
+        return self._hash
 
     __repr__ = generate_repr(__init__)
 
@@ -213,6 +360,8 @@ class Union(Set[Domain]):
             return EMPTY_SET_STRING
         return ' or '.join(map(str, self.subsets))
 
+    @rejecting_disjoint
+    @dispatched
     def __and__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
@@ -221,24 +370,37 @@ class Union(Set[Domain]):
         return (Union(*map(and_, self.subsets, repeat(other)))
                 .fold())
 
+    @rejecting_disjoint
+    @dispatched
     def __eq__(self, other: Set) -> bool:
         if not isinstance(other, Union):
-            return super().__eq__(other)
-        return self.subsets == other.subsets
-
+            set_ = self.fold()
+            return super().__eq__(other) if set_ is self else set_ == other
+        # compression does not make subsets unique,
+        # so equal unions can have different subsets
+        return (self.subsets == other.subsets
+                or self <= other and other <= self)
+
+    @rejecting_disjoint
+    @dispatched
     def __ge__(self, other: Set) -> bool:
         if not self:
             return not other
         if not isinstance(other, Union):
-            return any(subset >= other
-                       for subset in self.subsets)
+            # given set can be covered by several subsets together
+            return (any(subset >= other
+                        for subset in self.subsets)
+                    or not other - self)
         return all(self >= subset
                    for subset in other.subsets)
 
+    @rejecting_disjoint
+    @dispatched
     def __le__(self, other: Set) -> bool:
         return all(subset <= other
                    for subset in self.subsets)
 
+    @dispatched
     def __or__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
@@ -248,9 +410,20 @@ class Union(Set[Domain]):
                 .fold())
 
     def __contains__(self, object_: Domain) -> bool:
-        return any(object_ in subset
-                   for subset in self.subsets)
-
+        return (lies_within_bounds(object_, self.bounds)
+                and any(object_ in subset
+                        for subset in self.subsets))
+
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        objects = to_array(objects)
+        result = np.zeros(objects.shape,
+                          dtype=bool)
+        for subset in self.subsets:
+            result |= subset.contains_many(objects)
+        return result
+
+    @rejecting_disjoint
+    @dispatched
     def __rsub__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
@@ -261,12 +434,21 @@ class Union(Set[Domain]):
         operands = map(sub, repeat(other), self.subsets)
         return reduce(and_, operands)
 
+    @rejecting_disjoint
+    @dispatched
     def __sub__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
         return (Union(*map(sub, self.subsets, repeat(other)))
                 .fold())
 
+    @classmethod
+    def unites(cls, subsets: Iterable[Set]) -> bool:
+        """
+        Checks if given disjunctive subsets can be united by the union type.
+        """
+        return True
+
     def fold(self) -> Set:
         """
         Flattens union if possible.
@@ -300,3 +482,42 @@ def compress(sets: Iterable[Set]) -> Iterable[Set]:
                 break
         else:
             yield from set_.unfold()
+
+
+def are_bounds_disjoint(bounds: Bounds, other_bounds: Bounds) -> bool:
+    inf, inf_inclusive, sup, sup_inclusive = bounds
+    other_inf, other_inf_inclusive, other_sup, other_sup_inclusive = (
+        other_bounds)
+    return (sup < other_inf
+            or sup == other_inf
+            and not (sup_inclusive and other_inf_inclusive)
+            or other_sup < inf
+            or other_sup == inf
+            and not (other_sup_inclusive and inf_inclusive))
+
+
+def lies_within_bounds(object_: Any, bounds: Optional[Bounds]) -> bool:
+    """
+    Checks if given object can belong to the set with given bounds.
+    """
+    if bounds is None:
+        return True
+    point = to_real_point(object_)
+    if point is None:
+        return False
+    inf, inf_inclusive, sup, sup_inclusive = bounds
+    return ((inf < point or inf_inclusive and inf == point)
+            and (point < sup or sup_inclusive and point == sup))
+
+
+def unite_bounds(bounds: Iterable[Bounds]) -> Bounds:
+    """
+    Returns bounds of union of sets with given non-empty bounds.
+    """
+    infs, sups = [], []
+    for inf, inf_inclusive, sup, sup_inclusive in bounds:
+        infs.append((inf, not inf_inclusive))
+        sups.append((sup, sup_inclusive))
+    inf, inf_exclusive = min(infs)
+    sup, sup_inclusive = max(sups)
+    return inf, not inf_exclusive, sup, sup_inclusive
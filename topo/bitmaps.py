@@ -0,0 +1,598 @@
+from array import array
+from bisect import (bisect_left,
+                    bisect_right)
+from itertools import filterfalse
+from typing import (Any,
+                    Callable,
+                    FrozenSet,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union as TypingUnion)
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import (is_numeric,
+                     to_array,
+                     to_integer,
+                     to_real_parts)
+from .base import (EMPTY_SET,
+                   EMPTY_SET_STRING,
+                   Bounds,
+                   Set,
+                   Union,
+                   rejecting_disjoint)
+from .continuous import (Interval,
+                         IntervalUnion,
+                         close_interval,
+                         interval_to_piece)
+from .discrete import (DiscreteSet,
+                       Run,
+                       to_runs)
+from .dispatch import dispatched
+from .ranges import (RangeSet,
+                     puncture_piece,
+                     run_to_string,
+                     to_integer_bounds,
+                     unite_runs)
+
+CONTAINER_BITS = 16
+CONTAINER_SIZE = 1 << CONTAINER_BITS
+CONTAINER_MASK = CONTAINER_SIZE - 1
+ARRAY_CONTAINER_MAX_SIZE = 4096
+BITMAP_CONTAINER_BYTES = CONTAINER_SIZE // 8
+
+# array container stores sorted low bits as unsigned 16-bit integers,
+# bitmap container stores them as bits of an integer
+# & run container stores them as sorted disjoint non-adjacent runs
+Container = TypingUnion[array, int, Tuple[Run, ...]]
+
+try:
+    bits_count = int.bit_count
+except AttributeError:
+    def bits_count(value: int) -> int:
+        return bin(value).count('1')
+
+
+class BitmapSet(Set[int]):
+    """
+    Set of non-negative integers stored as compressed bitmap
+    split into containers by high bits of integers.
+
+    Set with other points falls back to general discrete set.
+    """
+
+    __slots__ = ('_keys', '_containers', '_hash')
+
+    def __new__(cls, *points: int) -> Set:
+        return cls.from_points(points)
+
+    def __init__(self, *points: int) -> None:
+        pass
+
+    @classmethod
+    def from_points(cls, points: Iterable[Any]) -> Set:
+        """
+        Creates set from given array-like of points.
+        """
+        values = to_array(points)
+        if not values.size:
+            return cls.from_containers([], [])
+        if values.dtype.kind not in 'iu' or values.min() < 0:
+            points = values.ravel().tolist()
+            integers = list(map(to_integer, points))
+            if None in integers or min(integers) < 0:
+                return DiscreteSet(*points)
+            integers.sort()
+            return cls.from_runs(to_runs(integers))
+        values = np.unique(values)
+        highs = values >> CONTAINER_BITS
+        boundaries = np.flatnonzero(np.diff(highs)) + 1
+        keys = highs[np.concatenate(([0], boundaries))].tolist()
+        containers = [positions_to_container(positions)
+                      for positions in np.split(values & CONTAINER_MASK,
+                                                boundaries)]
+        return cls.from_containers(keys, containers)
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[Run]) -> 'BitmapSet':
+        """
+        Creates set from sorted disjoint non-adjacent runs
+        of non-negative integers.
+        """
+        keys, keys_runs = [], []  # type: List[int], List[List[Run]]
+        for start, stop in runs:
+            while start < stop:
+                key = start >> CONTAINER_BITS
+                offset = key << CONTAINER_BITS
+                run = start - offset, min(stop - offset, CONTAINER_SIZE)
+                if keys and keys[-1] == key:
+                    keys_runs[-1].append(run)
+                else:
+                    keys.append(key)
+                    keys_runs.append([run])
+                start = offset + run[1]
+        return cls.from_containers(keys, list(map(runs_to_container,
+                                                  keys_runs)))
+
+    @classmethod
+    def from_containers(cls,
+                        keys: List[int],
+                        containers: List[Container]) -> 'BitmapSet':
+        """
+        Creates set from sorted keys & corresponding non-empty containers
+        without normalization.
+        """
+        result = super().__new__(cls)
+        result._keys = keys
+        result._containers = containers
+        result._hash = None
+        return result
+
+    @property
+    def points(self) -> FrozenSet[int]:
+        return frozenset(self)
+
+    def runs(self) -> Iterable[Run]:
+        """
+        Returns sorted runs of consecutive integers.
+        """
+        return unite_runs(self._to_containers_runs())
+
+    def _to_containers_runs(self) -> Iterable[Run]:
+        for key, container in zip(self._keys, self._containers):
+            offset = key << CONTAINER_BITS
+            for start, stop in container_to_runs(container):
+                yield offset + start, offset + stop
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if not self._keys:
+            return None
+        return ((self._keys[0] << CONTAINER_BITS)
+                + container_min(self._containers[0]),
+                True,
+                (self._keys[-1] << CONTAINER_BITS)
+                + container_max(self._containers[-1]),
+                True)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = (hash(tuple(self.runs()))
+                          if self
+                          else hash(EMPTY_SET))
+        return self._hash
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in zip(self._keys, self._containers):
+            offset = key << CONTAINER_BITS
+            for position in container_to_positions(container).tolist():
+                yield offset + position
+
+    def __len__(self) -> int:
+        return sum(map(container_to_size, self._containers))
+
+    __repr__ = generate_repr(__init__)
+
+    def __str__(self) -> str:
+        if not self:
+            return EMPTY_SET_STRING
+        return ' or '.join(map(run_to_string, self.runs()))
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, Interval):
+            return self._clip(other)
+        other_bitmap = to_bitmap_set(other)
+        if other_bitmap is None:
+            return other & self
+        return self._combine(other_bitmap, intersect_containers,
+                             keep_left=False,
+                             keep_right=False)
+
+    def __contains__(self, object_: Any) -> bool:
+        integer = to_integer(object_)
+        if integer is None or integer < 0:
+            return False
+        key = integer >> CONTAINER_BITS
+        index = bisect_left(self._keys, key)
+        return (index < len(self._keys)
+                and self._keys[index] == key
+                and container_contains(self._containers[index],
+                                       integer & CONTAINER_MASK))
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        if not is_numeric(objects):
+            return super().contains_many(objects)
+        objects = to_real_parts(objects)
+        result = np.zeros(objects.shape,
+                          dtype=bool)
+        if not self:
+            return result
+        candidates = ((objects >= 0)
+                      & (objects == np.floor(objects))
+                      & (objects < (self._keys[-1] + 1) << CONTAINER_BITS))
+        values = objects[candidates].astype(np.int64)
+        highs = values >> CONTAINER_BITS
+        lows = values & CONTAINER_MASK
+        mask = np.zeros(values.shape,
+                        dtype=bool)
+        for key in np.unique(highs).tolist():
+            index = bisect_left(self._keys, key)
+            if index == len(self._keys) or self._keys[index] != key:
+                continue
+            key_mask = highs == key
+            positions = container_to_positions(self._containers[index])
+            mask[key_mask] = in_positions(positions, lows[key_mask])
+        result[candidates] = mask
+        return result
+
+    @rejecting_disjoint
+    @dispatched
+    def __eq__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, BitmapSet):
+            return (self._keys == other._keys
+                    and self._containers == other._containers)
+        if isinstance(other, RangeSet):
+            return tuple(self.runs()) == tuple(other.runs())
+        if isinstance(other, DiscreteSet):
+            return (len(self) == len(other.points)
+                    and all(map(self.__contains__, other.points)))
+        if isinstance(other, Interval):
+            return False
+        return super().__eq__(other)
+
+    @rejecting_disjoint
+    @dispatched
+    def __ge__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, DiscreteSet):
+            return all(map(self.__contains__, other.points))
+        if isinstance(other, Interval):
+            return False
+        if isinstance(other, RangeSet):
+            return RangeSet.from_runs(self.runs()) >= other
+        if not isinstance(other, BitmapSet):
+            return super().__ge__(other)
+        return not other - self
+
+    @rejecting_disjoint
+    @dispatched
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, DiscreteSet):
+            return (len(self) <= len(other.points)
+                    and all(map(other.__contains__, self)))
+        other_bitmap = to_bitmap_set(other)
+        if other_bitmap is None:
+            return super().__le__(other)
+        return not self - other_bitmap
+
+    @dispatched
+    def __or__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, Interval):
+            other = close_interval(other, self)
+            rest_integers = self - other
+            return Union(other, rest_integers) if rest_integers else other
+        if isinstance(other, DiscreteSet):
+            integers = self | BitmapSet.from_points(
+                    list(filter(is_natural, other.points)))
+            rest_points = DiscreteSet(*filterfalse(is_natural,
+                                                   other.points))
+            return Union(integers, rest_points) if rest_points else integers
+        if isinstance(other, RangeSet):
+            return RangeSet.from_runs(self.runs()) | other
+        if not isinstance(other, BitmapSet):
+            return other | self
+        return self._combine(other, unite_containers,
+                             keep_left=True,
+                             keep_right=True)
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if isinstance(other, Interval):
+            punctures = self._clip(other)
+            if not punctures:
+                return other
+            return (IntervalUnion.from_pieces(
+                    puncture_piece(interval_to_piece(other),
+                                   punctures.runs()))
+                    .fold())
+        if isinstance(other, RangeSet):
+            return other - RangeSet.from_runs(self.runs())
+        return super().__rsub__(other)
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, Interval):
+            return self - (self & other)
+        if isinstance(other, DiscreteSet):
+            other = BitmapSet.from_points(list(filter(is_natural,
+                                                      other.points)))
+        other_bitmap = to_bitmap_set(other)
+        if other_bitmap is None:
+            return other.__rsub__(self)
+        return self._combine(other_bitmap, subtract_containers,
+                             keep_left=True,
+                             keep_right=False)
+
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if isinstance(other, RangeSet):
+            return RangeSet.from_runs(self.runs()) ^ other
+        if not isinstance(other, BitmapSet):
+            return super().__xor__(other)
+        return self._combine(other, symmetrically_subtract_containers,
+                             keep_left=True,
+                             keep_right=True)
+
+    def _clip(self, interval: Interval) -> 'BitmapSet':
+        if not self:
+            return self
+        start, stop = to_integer_bounds(interval)
+        start = 0 if start is None else max(start, 0)
+        if stop is None:
+            stop = (self._keys[-1] + 1) << CONTAINER_BITS
+        if start >= stop:
+            return BitmapSet.from_containers([], [])
+        start_index = bisect_left(self._keys, start >> CONTAINER_BITS)
+        stop_index = bisect_right(self._keys, (stop - 1) >> CONTAINER_BITS)
+        keys, containers = [], []
+        for key, container in zip(self._keys[start_index:stop_index],
+                                  self._containers[start_index:stop_index]):
+            offset = key << CONTAINER_BITS
+            run = max(start - offset, 0), min(stop - offset, CONTAINER_SIZE)
+            if run != (0, CONTAINER_SIZE):
+                container = intersect_containers(container, (run,))
+                if container is None:
+                    continue
+            keys.append(key)
+            containers.append(container)
+        return BitmapSet.from_containers(keys, containers)
+
+    def _combine(self,
+                 other: 'BitmapSet',
+                 operation: Callable[[Container, Container],
+                                     Optional[Container]],
+                 *,
+                 keep_left: bool,
+                 keep_right: bool) -> 'BitmapSet':
+        keys, containers = [], []
+        left_keys, right_keys = self._keys, other._keys
+        left_index = right_index = 0
+        while left_index < len(left_keys) and right_index < len(right_keys):
+            left_key, right_key = (left_keys[left_index],
+                                   right_keys[right_index])
+            if left_key < right_key:
+                if keep_left:
+                    keys.append(left_key)
+                    containers.append(self._containers[left_index])
+                left_index += 1
+            elif right_key < left_key:
+                if keep_right:
+                    keys.append(right_key)
+                    containers.append(other._containers[right_index])
+                right_index += 1
+            else:
+                container = operation(self._containers[left_index],
+                                      other._containers[right_index])
+                if container is not None:
+                    keys.append(left_key)
+                    containers.append(container)
+                left_index += 1
+                right_index += 1
+        if keep_left:
+            keys.extend(left_keys[left_index:])
+            containers.extend(self._containers[left_index:])
+        if keep_right:
+            keys.extend(right_keys[right_index:])
+            containers.extend(other._containers[right_index:])
+        return BitmapSet.from_containers(keys, containers)
+
+
+def to_bitmap_set(set_: Set) -> Optional[BitmapSet]:
+    """
+    Converts non-negative integers of given set into bitmap set
+    if it is possible without enumeration.
+    """
+    if isinstance(set_, BitmapSet):
+        return set_
+    if isinstance(set_, RangeSet):
+        return BitmapSet.from_runs((max(start, 0), stop)
+                                   for start, stop in set_.runs()
+                                   if stop > 0)
+    return None
+
+
+def is_natural(object_: Any) -> bool:
+    """
+    Checks if given object is equal to non-negative integer.
+    """
+    integer = to_integer(object_)
+    return integer is not None and integer >= 0
+
+
+def bitmap_to_bits(bitmap: int) -> np.ndarray:
+    return np.unpackbits(np.frombuffer(bitmap.to_bytes(BITMAP_CONTAINER_BYTES,
+                                                       'little'),
+                                       dtype=np.uint8),
+                         bitorder='little').view(bool)
+
+
+def bits_to_bitmap(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits,
+                                      bitorder='little').tobytes(),
+                          'little')
+
+
+def container_contains(container: Container, position: int) -> bool:
+    if isinstance(container, int):
+        return bool(container >> position & 1)
+    if isinstance(container, array):
+        index = bisect_left(container, position)
+        return index < len(container) and container[index] == position
+    index = bisect_right(container, (position, CONTAINER_SIZE)) - 1
+    return index >= 0 and position < container[index][1]
+
+
+def container_max(container: Container) -> int:
+    if isinstance(container, int):
+        return container.bit_length() - 1
+    if isinstance(container, array):
+        return container[-1]
+    return container[-1][1] - 1
+
+
+def container_min(container: Container) -> int:
+    if isinstance(container, int):
+        return (container & -container).bit_length() - 1
+    if isinstance(container, array):
+        return container[0]
+    return container[0][0]
+
+
+def container_to_bitmap(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    if isinstance(container, array):
+        bits = np.zeros(CONTAINER_SIZE,
+                        dtype=bool)
+        bits[container_to_positions(container)] = True
+        return bits_to_bitmap(bits)
+    result = 0
+    for start, stop in container:
+        result |= ((1 << (stop - start)) - 1) << start
+    return result
+
+
+def container_to_positions(container: Container) -> np.ndarray:
+    if isinstance(container, int):
+        return np.flatnonzero(bitmap_to_bits(container))
+    if isinstance(container, array):
+        return np.frombuffer(container,
+                             dtype=np.uint16)
+    return np.concatenate([np.arange(start, stop)
+                           for start, stop in container])
+
+
+def container_to_runs(container: Container) -> Iterable[Run]:
+    if isinstance(container, tuple):
+        return container
+    return positions_to_runs(container_to_positions(container))
+
+
+def positions_to_runs(positions: np.ndarray) -> Iterable[Run]:
+    boundaries = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = positions[np.concatenate(([0], boundaries))]
+    stops = positions[np.concatenate((boundaries - 1,
+                                      [positions.size - 1]))] + 1
+    return zip(starts.tolist(), stops.tolist())
+
+
+def container_to_size(container: Container) -> int:
+    if isinstance(container, int):
+        return bits_count(container)
+    if isinstance(container, array):
+        return len(container)
+    return sum(stop - start for start, stop in container)
+
+
+def in_positions(positions: np.ndarray, values: np.ndarray) -> np.ndarray:
+    if not positions.size:
+        return np.zeros(values.shape,
+                        dtype=bool)
+    indices = np.searchsorted(positions, values)
+    np.minimum(indices, positions.size - 1,
+               out=indices)
+    return positions[indices] == values
+
+
+def positions_to_container(positions: np.ndarray) -> Optional[Container]:
+    """
+    Returns the most compact container of sorted distinct positions.
+    """
+    count = positions.size
+    if not count:
+        return None
+    runs_count = int(np.count_nonzero(np.diff(positions) != 1)) + 1
+    if is_run_container_compact(count, runs_count):
+        return tuple(positions_to_runs(positions))
+    if count <= ARRAY_CONTAINER_MAX_SIZE:
+        return array('H', positions.astype(np.uint16).tobytes())
+    bits = np.zeros(CONTAINER_SIZE,
+                    dtype=bool)
+    bits[positions] = True
+    return bits_to_bitmap(bits)
+
+
+def runs_to_container(runs: List[Run]) -> Container:
+    count = sum(stop - start for start, stop in runs)
+    if is_run_container_compact(count, len(runs)):
+        return tuple(runs)
+    return positions_to_container(
+            np.concatenate([np.arange(start, stop)
+                            for start, stop in runs]))
+
+
+def is_run_container_compact(count: int, runs_count: int) -> bool:
+    """
+    Checks if run container takes less memory than other ones
+    with sizes estimated as in serialized form.
+    """
+    run_container_size = 2 + 4 * runs_count
+    return run_container_size < min(2 * count, BITMAP_CONTAINER_BYTES)
+
+
+def bitmap_to_container(bitmap: int) -> Optional[Container]:
+    if not bitmap:
+        return None
+    return positions_to_container(np.flatnonzero(bitmap_to_bits(bitmap)))
+
+
+def intersect_containers(left: Container,
+                         right: Container) -> Optional[Container]:
+    if isinstance(left, array) and isinstance(right, array):
+        return positions_to_container(np.intersect1d(
+                container_to_positions(left), container_to_positions(right),
+                assume_unique=True))
+    return bitmap_to_container(container_to_bitmap(left)
+                               & container_to_bitmap(right))
+
+
+def subtract_containers(minuend: Container,
+                        subtrahend: Container) -> Optional[Container]:
+    return bitmap_to_container(container_to_bitmap(minuend)
+                               & ~container_to_bitmap(subtrahend))
+
+
+def symmetrically_subtract_containers(left: Container,
+                                      right: Container
+                                      ) -> Optional[Container]:
+    return bitmap_to_container(container_to_bitmap(left)
+                               ^ container_to_bitmap(right))
+
+
+def unite_containers(left: Container,
+                     right: Container) -> Optional[Container]:
+    return bitmap_to_container(container_to_bitmap(left)
+                               | container_to_bitmap(right))
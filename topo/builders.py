@@ -0,0 +1,159 @@
+from typing import (Any,
+                    Iterable,
+                    List,
+                    MutableSet,
+                    Tuple)
+
+from reprit.base import generate_repr
+from sortedcontainers import SortedKeyList
+
+from .arrays import to_real_point
+from .base import Set
+from .continuous import (Interval,
+                         IntervalUnion,
+                         Piece,
+                         interval_to_piece,
+                         merge_pieces,
+                         point_to_piece,
+                         subtract_pieces,
+                         to_interval_union,
+                         to_piece_sorting_key)
+from .discrete import DiscreteSet
+
+
+class IntervalSetBuilder:
+    """
+    Mutable union of intervals and points
+    kept as sorted disjoint non-mergeable pieces,
+    so each update takes logarithmic amortized time.
+    """
+
+    def __init__(self, *subsets: Set) -> None:
+        self._pieces = SortedKeyList(key=to_piece_sorting_key)
+        self._non_real_points = set()  # type: MutableSet[Any]
+        for subset in subsets:
+            self.add(subset)
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def subsets(self) -> Tuple[Set, ...]:
+        return tuple(self.freeze().unfold())
+
+    def __bool__(self) -> bool:
+        return bool(self._pieces or self._non_real_points)
+
+    def __contains__(self, object_: Any) -> bool:
+        point = to_real_point(object_)
+        if point is None:
+            return object_ in self._non_real_points
+        index = self._pieces.bisect_key_right((point, False)) - 1
+        if index < 0:
+            return False
+        _, _, right_end, right_end_inclusive = self._pieces[index]
+        return (point < right_end
+                or point == right_end and right_end_inclusive)
+
+    def __len__(self) -> int:
+        """
+        Returns number of disjoint pieces and non-real points.
+        """
+        return len(self._pieces) + len(self._non_real_points)
+
+    def add(self, set_: Set) -> None:
+        """
+        Adds given set.
+        """
+        pieces, non_real_points = to_pieces(set_)
+        for piece in pieces:
+            self._add_piece(piece)
+        self._non_real_points.update(non_real_points)
+
+    def clear(self) -> None:
+        self._pieces.clear()
+        self._non_real_points.clear()
+
+    def discard(self, set_: Set) -> None:
+        """
+        Removes given set.
+        """
+        pieces, non_real_points = to_pieces(set_)
+        for piece in pieces:
+            self._discard_piece(piece)
+        self._non_real_points.difference_update(non_real_points)
+
+    def freeze(self) -> Set:
+        """
+        Returns immutable set with the same elements.
+        """
+        return (IntervalUnion.from_pieces(list(self._pieces),
+                                          frozenset(self._non_real_points))
+                .fold())
+
+    def _add_piece(self, piece: Piece) -> None:
+        pieces = self._pieces
+        index = pieces.bisect_key_left(to_piece_sorting_key(piece))
+        if index:
+            merged = list(merge_pieces([pieces[index - 1], piece]))
+            if len(merged) == 1:
+                index -= 1
+                del pieces[index]
+                piece, = merged
+        while index < len(pieces):
+            merged = list(merge_pieces([piece, pieces[index]]))
+            if len(merged) != 1:
+                break
+            del pieces[index]
+            piece, = merged
+        pieces.add(piece)
+
+    def _discard_piece(self, piece: Piece) -> None:
+        pieces = self._pieces
+        start = max(pieces.bisect_key_left(to_piece_sorting_key(piece)) - 1,
+                    0)
+        _, _, right_end, _ = piece
+        stop = pieces.bisect_key_right((right_end, False))
+        candidates = pieces[start:stop]
+        rest_pieces = subtract_pieces(candidates, [piece])
+        del pieces[start:stop]
+        pieces.update(rest_pieces)
+
+
+def to_pieces(set_: Set) -> Tuple[List[Piece], List[Any]]:
+    """
+    Returns pieces & non-real points of given set.
+    """
+    if not set_:
+        return [], []
+    if isinstance(set_, Interval):
+        return [interval_to_piece(set_)], []
+    if isinstance(set_, DiscreteSet):
+        return points_to_pieces(set_.points)
+    union = to_interval_union(set_)
+    if union is None:
+        raise TypeError('Invalid set: {set_!r}, '
+                        'should be union of intervals & points.'
+                        .format(set_=set_))
+    return list(union.pieces()), list(union.non_real_points)
+
+
+def to_sorted_pieces(set_: Set) -> Tuple[List[Piece], List[Any]]:
+    """
+    Returns sorted disjoint non-mergeable pieces & non-real points
+    of given set.
+    """
+    pieces, non_real_points = to_pieces(set_)
+    pieces.sort(key=to_piece_sorting_key)
+    return list(merge_pieces(pieces)), non_real_points
+
+
+def points_to_pieces(points: Iterable[Any]
+                     ) -> Tuple[List[Piece], List[Any]]:
+    pieces, non_real_points = [], []
+    for point in points:
+        real_point = to_real_point(point)
+        if real_point is None:
+            non_real_points.append(point)
+        else:
+            pieces.append(point_to_piece(real_point))
+    return pieces, non_real_points
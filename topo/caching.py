@@ -0,0 +1,124 @@
+from collections import (OrderedDict,
+                         namedtuple)
+from functools import wraps
+from typing import (Any,
+                    Optional,
+                    Type)
+
+from reprit.base import generate_repr
+
+from . import hooks
+from .base import Set
+from .lazy import Expression
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions',
+                                     'max_size', 'size'])
+
+
+class OperationCache:
+    """
+    Memoizes results of binary set operations
+    keyed by operation name & operands with their types
+    (so keys comparison never falls back to sets operations)
+    evicting least recently used ones when exceeding maximum size.
+
+    Works only while enabled (either explicitly or as a context manager),
+    at most one cache can be enabled at a time.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 1:
+            raise ValueError('Maximum size should be positive, '
+                             'but found {max_size}.'
+                             .format(max_size=max_size))
+        self.max_size = max_size
+        self._results = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    __repr__ = generate_repr(__init__)
+
+    def __enter__(self) -> 'OperationCache':
+        self.enable()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.disable()
+
+    def cache_clear(self) -> None:
+        """
+        Clears results & statistics.
+        """
+        self._results.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns usage statistics.
+        """
+        return CacheInfo(self._hits, self._misses, self._evictions,
+                         self.max_size, len(self._results))
+
+    def disable(self) -> None:
+        global _enabled_cache
+        if _enabled_cache is not self:
+            return
+        hooks.uninstall(self._wrap)
+        _enabled_cache = None
+
+    def enable(self) -> None:
+        global _enabled_cache
+        if _enabled_cache is self:
+            return
+        if _enabled_cache is not None:
+            _enabled_cache.disable()
+        hooks.install(self._wrap)
+        _enabled_cache = self
+
+    def _wrap(self,
+              cls: Type[Set],
+              name: str,
+              method: hooks.Operation) -> hooks.Operation:
+        if (issubclass(cls, Expression)
+                or name not in hooks.OPERATIONS):
+            return method
+        results = self._results
+
+        @wraps(method)
+        def wrapped(set_: Set, other: Set) -> Set:
+            if not isinstance(other, Set) or isinstance(other, Expression):
+                return method(set_, other)
+            key = name, type(set_), set_, type(other), other
+            try:
+                result = results[key]
+            except KeyError:
+                self._misses += 1
+                result = method(set_, other)
+                if result is NotImplemented:
+                    return result
+                results[key] = result
+                if len(results) > self.max_size:
+                    results.popitem(last=False)
+                    self._evictions += 1
+            else:
+                self._hits += 1
+                results.move_to_end(key)
+            return result
+
+        return wrapped
+
+
+_enabled_cache = None  # type: Optional[OperationCache]
+
+
+def caching(max_size: int = 1024) -> OperationCache:
+    """
+    Returns new operation cache to be used as a context manager.
+    """
+    return OperationCache(max_size)
+
+
+def enabled_cache() -> Optional[OperationCache]:
+    """
+    Returns currently enabled cache if any.
+    """
+    return _enabled_cache
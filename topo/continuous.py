@@ -1,29 +1,58 @@
 import math
+from bisect import (bisect_left,
+                    bisect_right)
 from decimal import Decimal
 from functools import partial
+from heapq import merge
 from itertools import (chain,
-                       filterfalse,
                        repeat)
 from numbers import (Complex,
                      Number)
 from operator import (le,
-                      lt)
+                      lt,
+                      methodcaller)
 from typing import (Any,
                     Callable,
+                    FrozenSet,
+                    Iterable,
+                    Optional,
+                    Sequence,
                     SupportsFloat,
                     Tuple,
+                    Type,
                     cast)
 
+import numpy as np
 from reprit.base import generate_repr
 
+from .arrays import (is_numeric,
+                     to_array,
+                     to_array_scalar,
+                     to_real_parts,
+                     to_real_point)
 from .base import (EMPTY_SET,
                    EMPTY_SET_STRING,
+                   Bounds,
                    Set,
-                   Union)
-from .discrete import DiscreteSet
+                   Union,
+                   rejecting_disjoint,
+                   unite_bounds)
+from .discrete import (DiscreteSet,
+                       NumericDiscreteSet,
+                       to_points_hash)
+from .dispatch import (dispatched,
+                       register,
+                       to_swapped)
+from .functional import flatmap
+
+Piece = Tuple[SupportsFloat, bool, SupportsFloat, bool]
 
 
 class Interval(Set[SupportsFloat]):
+    __slots__ = ('left_end', 'right_end',
+                 'left_end_inclusive', 'right_end_inclusive',
+                 '_hash')
+
     operators_by_inclusion = {False: lt,
                               True: le}
 
@@ -51,20 +80,33 @@ class Interval(Set[SupportsFloat]):
         self.right_end = right_end
         self.left_end_inclusive = left_end_inclusive
         self.right_end_inclusive = right_end_inclusive
+        self._hash = None
 
     def __bool__(self) -> bool:
-        inclusion = self.left_end_inclusive and self.right_end_inclusive
-        operator = self.operators_by_inclusion[inclusion]
-        return operator(self.left_end, self.right_end)
+        # empty intervals are never created
+        return True
+
+    @property
+    def bounds(self) -> Bounds:
+        return (self.left_end, self.left_end_inclusive,
+                self.right_end, self.right_end_inclusive)
 
     def __hash__(self) -> int:
-        return hash((self.left_end,
-                     self.right_end,
-                     self.left_end_inclusive,
-                     self.right_end_inclusive))
+        if self._hash is None:
+            self._hash = hash((self.left_end,
+                               self.right_end,
+                               self.left_end_inclusive,
+                               self.right_end_inclusive))
+        return self._hash
 
     __repr__ = generate_repr(__init__)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (partial(type(self),
+                        left_end_inclusive=self.left_end_inclusive,
+                        right_end_inclusive=self.right_end_inclusive),
+                (self.left_end, self.right_end))
+
     def __str__(self) -> str:
         if not self:
             return EMPTY_SET_STRING
@@ -74,41 +116,11 @@ class Interval(Set[SupportsFloat]):
                 + str(self.left_end) + ', ' + str(self.right_end)
                 + right_bracket)
 
+    @dispatched
     def __and__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
-
-        if not isinstance(other, Interval):
-            return other & self
-
-        if not self.intersects_with_interval(other):
-            return EMPTY_SET
-
-        if self.left_end < other.left_end:
-            left_end = other.left_end
-            left_end_inclusive = other.left_end_inclusive
-        elif self.left_end == other.left_end:
-            left_end = self.left_end
-            left_end_inclusive = min(self.left_end_inclusive,
-                                     other.left_end_inclusive)
-        else:
-            left_end = self.left_end
-            left_end_inclusive = self.left_end_inclusive
-
-        if self.right_end < other.right_end:
-            right_end = self.right_end
-            right_end_inclusive = self.right_end_inclusive
-        elif self.right_end == other.right_end:
-            right_end = self.right_end
-            right_end_inclusive = min(self.right_end_inclusive,
-                                      other.right_end_inclusive)
-        else:
-            right_end = other.right_end
-            right_end_inclusive = other.right_end_inclusive
-
-        return Interval(left_end, right_end,
-                        left_end_inclusive=left_end_inclusive,
-                        right_end_inclusive=right_end_inclusive)
+        return other & self
 
     def __contains__(self, object_: Any) -> bool:
         if not isinstance(object_, Number):
@@ -125,145 +137,71 @@ class Interval(Set[SupportsFloat]):
         right_comparison = right_operator(object_, self.right_end)
         return left_comparison and right_comparison
 
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        if not is_numeric(objects):
+            return super().contains_many(objects)
+        objects = to_real_parts(objects)
+        left_operator = self.operators_by_inclusion[self.left_end_inclusive]
+        right_operator = self.operators_by_inclusion[self.right_end_inclusive]
+        return (left_operator(to_array_scalar(self.left_end), objects)
+                & right_operator(objects, to_array_scalar(self.right_end)))
+
+    @dispatched
     def __eq__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
-        if isinstance(other, DiscreteSet):
-            return False
         if isinstance(other, Union):
             return other.fold() == self
-        if not isinstance(other, Interval):
-            return other == self
-        return (self.left_end == other.left_end
-                and self.left_end_inclusive == other.left_end_inclusive
-                and self.right_end == other.right_end
-                and self.right_end_inclusive == other.right_end_inclusive)
+        return other == self
 
+    @dispatched
     def __ge__(self, other: Set) -> bool:
-        if isinstance(other, DiscreteSet):
-            return all(point in self
-                       for point in other.points)
         if isinstance(other, Union):
             return all(self >= subset
                        for subset in other.subsets)
-        if not isinstance(other, Interval):
-            return super().__ge__(other)
-        return self.overlaps_interval(other)
+        return super().__ge__(other)
 
+    @dispatched
     def __le__(self, other: Set) -> bool:
-        if isinstance(other, DiscreteSet):
-            return False
         if isinstance(other, Union):
-            return any(self <= subset
-                       for subset in other.subsets)
-        if not isinstance(other, Interval):
-            return super().__le__(other)
-        return other.overlaps_interval(self)
+            # interval can be covered by several subsets together
+            return (any(self <= subset
+                        for subset in other.subsets)
+                    or not self - other)
+        return super().__le__(other)
 
+    @dispatched
     def __or__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
+        return other | self
 
-        if isinstance(other, DiscreteSet):
-            left_end = self.left_end
-            left_end_inclusive = self.left_end_inclusive
-            if left_end in other:
-                left_end_inclusive = True
-            right_end = self.right_end
-            right_end_inclusive = self.right_end_inclusive
-            if right_end in other:
-                right_end_inclusive = True
-            merged_interval = Interval(left_end, right_end,
-                                       left_end_inclusive=left_end_inclusive,
-                                       right_end_inclusive=right_end_inclusive)
-            extra_points = filterfalse(merged_interval.__contains__,
-                                       other.points)
-            return Union(merged_interval, DiscreteSet(*extra_points))
-
-        if not isinstance(other, Interval):
-            return other | self
-
-        if not self.merges_with_interval(other):
-            return Union(self, other)
-
-        def by_left_end_sorting_key(interval: Interval
-                                    ) -> Tuple[SupportsFloat, bool]:
-            return interval.left_end, not interval.left_end_inclusive
-
-        def by_right_end_sorting_key(interval: Interval
-                                     ) -> Tuple[SupportsFloat, bool]:
-            return interval.right_end, interval.right_end_inclusive
-
-        left_interval = min(self, other,
-                            key=by_left_end_sorting_key)
-        right_interval = max(self, other,
-                             key=by_right_end_sorting_key)
-        return Interval(left_interval.left_end, right_interval.right_end,
-                        left_end_inclusive=left_interval.left_end_inclusive,
-                        right_end_inclusive=right_interval.right_end_inclusive)
-
+    @dispatched
     def __sub__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
+        return other.__rsub__(self)
 
-        if isinstance(other, DiscreteSet):
-            def to_real_part(number: Number) -> SupportsFloat:
-                if not isinstance(number, Complex):
-                    return number
-                return number.real
-
-            break_points = sorted(map(to_real_part, filter(self.__contains__,
-                                                           other.points)))
-            if not break_points:
-                return self
-            first_excluded_number = break_points[0]
-            left_end = self.left_end
-            right_end = self.right_end
-            left_end_inclusive = self.left_end_inclusive
-            if first_excluded_number == left_end:
-                left_end_inclusive = False
-                break_points.pop(0)
-            right_end_inclusive = self.right_end_inclusive
-            try:
-                last_excluded_number = break_points[-1]
-            except IndexError:
-                pass
-            else:
-                if last_excluded_number == right_end:
-                    right_end_inclusive = False
-                    break_points.pop(-1)
-            left_ends = chain([left_end], break_points)
-            right_ends = chain(break_points, [right_end])
-            left_ends_inclusion = chain([left_end_inclusive],
-                                        repeat(False,
-                                               times=len(break_points)))
-            right_ends_inclusion = chain(repeat(False,
-                                                times=len(break_points)),
-                                         [right_end_inclusive])
-            parts = (Interval(left_end, right_end,
-                              left_end_inclusive=left_end_inclusive,
-                              right_end_inclusive=right_end_inclusive)
-                     for (left_end, right_end,
-                          left_end_inclusive,
-                          right_end_inclusive) in zip(left_ends, right_ends,
-                                                      left_ends_inclusion,
-                                                      right_ends_inclusion))
-            return Union(*parts).fold()
-
-        if not isinstance(other, Interval):
-            return other.__rsub__(self)
-
-        if not self.intersects_with_interval(other):
-            return self
-
-        return (Union(
-                Interval(self.left_end, other.left_end,
-                         left_end_inclusive=self.left_end_inclusive,
-                         right_end_inclusive=not other.left_end_inclusive),
-                Interval(other.right_end, self.right_end,
-                         left_end_inclusive=not other.right_end_inclusive,
-                         right_end_inclusive=self.right_end_inclusive))
-                .fold())
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if isinstance(other, IntervalUnion):
+            return other ^ self
+        return super().__xor__(other)
+
+    def _result_type(self, other: Set) -> Type['Interval']:
+        """
+        Returns type of intervals with ends taken from both operands.
+        """
+        return Interval
+
+    def slice(self, points: NumericDiscreteSet) -> NumericDiscreteSet:
+        """
+        Returns given points which lie in the interval.
+        """
+        return points.between(self.left_end, self.right_end,
+                              left_end_inclusive=self.left_end_inclusive,
+                              right_end_inclusive=self.right_end_inclusive)
 
     def intersects_with_interval(self, other: 'Interval') -> bool:
         if self.left_end < other.left_end:
@@ -308,9 +246,884 @@ class Interval(Set[SupportsFloat]):
                 and right_operator(other.right_end, self.right_end))
 
 
+class IntervalUnion(Union[SupportsFloat]):
+    """
+    Union of intervals and isolated points
+    with real parts stored as sorted disjoint non-mergeable pieces.
+    """
+
+    __slots__ = ('_left_ends', '_left_ends_inclusive',
+                 '_right_ends', '_right_ends_inclusive',
+                 '_points', '_non_real_points',
+                 '_intervals', '_subsets_cache', '_arrays')
+
+    interval_type = Interval
+
+    def __init__(self, *subsets: Set) -> None:
+        pieces = []
+        non_real_points = []
+        for subset in flatmap(methodcaller('unfold'), subsets):
+            if isinstance(subset, Interval):
+                pieces.append(interval_to_piece(subset))
+            elif isinstance(subset, DiscreteSet):
+                for point in subset.points:
+                    real_point = to_real_point(point)
+                    if real_point is None:
+                        non_real_points.append(point)
+                    else:
+                        pieces.append(point_to_piece(real_point))
+            elif subset:
+                raise TypeError('Invalid subset: {subset!r}, '
+                                'should be either interval '
+                                'or discrete set.'
+                                .format(subset=subset))
+        pieces.sort(key=to_piece_sorting_key)
+        self._initialize(merge_pieces(pieces), frozenset(non_real_points))
+
+    @classmethod
+    def from_pieces(cls,
+                    pieces: Iterable[Piece],
+                    non_real_points: FrozenSet[Any] = frozenset()
+                    ) -> 'IntervalUnion':
+        """
+        Creates union from sorted disjoint non-mergeable pieces
+        without normalization.
+        """
+        result = super().__new__(cls)
+        result._initialize(pieces, non_real_points)
+        return result
+
+    def _initialize(self,
+                    pieces: Iterable[Piece],
+                    non_real_points: FrozenSet[Any]) -> None:
+        left_ends, left_ends_inclusive = [], []
+        right_ends, right_ends_inclusive = [], []
+        points = []
+        for left_end, left_end_inclusive, right_end, right_end_inclusive \
+                in pieces:
+            if left_end == right_end:
+                points.append(left_end)
+                continue
+            left_ends.append(left_end)
+            left_ends_inclusive.append(left_end_inclusive)
+            right_ends.append(right_end)
+            right_ends_inclusive.append(right_end_inclusive)
+        self._left_ends = left_ends
+        self._left_ends_inclusive = left_ends_inclusive
+        self._right_ends = right_ends
+        self._right_ends_inclusive = right_ends_inclusive
+        self._points = points
+        self._non_real_points = non_real_points
+        self._intervals = None
+        self._subsets_cache = None
+        self._arrays = None
+        self._hash = None
+
+    @classmethod
+    def unites(cls, subsets: Iterable[Set]) -> bool:
+        return all(isinstance(subset, (Interval, DiscreteSet))
+                   for subset in subsets)
+
+    @property
+    def intervals(self) -> Tuple[Interval, ...]:
+        """
+        Returns sorted disjoint intervals.
+        """
+        if self._intervals is None:
+            interval_type = self.interval_type
+            self._intervals = tuple(
+                    interval_type(left_end, right_end,
+                                  left_end_inclusive=left_end_inclusive,
+                                  right_end_inclusive=right_end_inclusive)
+                    for (left_end, left_end_inclusive,
+                         right_end, right_end_inclusive)
+                    in zip(self._left_ends, self._left_ends_inclusive,
+                           self._right_ends, self._right_ends_inclusive))
+        return self._intervals
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self).from_pieces,
+                (list(self.pieces()), self._non_real_points))
+
+    @property
+    def points(self) -> Tuple[SupportsFloat, ...]:
+        """
+        Returns sorted isolated real points.
+        """
+        return tuple(self._points)
+
+    @property
+    def non_real_points(self) -> FrozenSet[Any]:
+        """
+        Returns points which are not real numbers.
+        """
+        return self._non_real_points
+
+    @property
+    def subsets(self) -> FrozenSet[Set]:
+        if self._subsets_cache is None:
+            self._subsets_cache = frozenset(self.unfold())
+        return self._subsets_cache
+
+    @property
+    def _subsets(self) -> FrozenSet[Set]:
+        return self.subsets
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if self._non_real_points or not self:
+            return None
+        bounds = []
+        if self._left_ends:
+            bounds.append((self._left_ends[0], self._left_ends_inclusive[0],
+                           self._right_ends[-1],
+                           self._right_ends_inclusive[-1]))
+        if self._points:
+            bounds.append((self._points[0], True, self._points[-1], True))
+        return unite_bounds(bounds)
+
+    def __bool__(self) -> bool:
+        return bool(self._left_ends
+                    or self._points
+                    or self._non_real_points)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            set_ = self.fold()
+            if set_ is self:
+                # agrees with hashes of unfolded intervals & points
+                subsets_hashes = set(map(hash, zip(
+                        self._left_ends, self._right_ends,
+                        self._left_ends_inclusive,
+                        self._right_ends_inclusive)))
+                if self._points or self._non_real_points:
+                    subsets_hashes.add(to_points_hash(frozenset(
+                            chain(self._points, self._non_real_points))))
+                self._hash = hash(frozenset(subsets_hashes))
+            else:
+                self._hash = hash(set_)
+        return self._hash
+
+    def __str__(self) -> str:
+        if not self:
+            return EMPTY_SET_STRING
+        return ' or '.join(map(str, self.unfold()))
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, NumericDiscreteSet):
+            return other & self
+        other_union = to_interval_union(other)
+        if other_union is None:
+            return super().__and__(other)
+        return (self._result_type(other_union).from_pieces(
+                intersect_pieces(list(self.pieces()),
+                                 list(other_union.pieces())),
+                self._non_real_points & other_union._non_real_points)
+                .fold())
+
+    def __contains__(self, object_: Any) -> bool:
+        point = to_real_point(object_)
+        if point is None:
+            return object_ in self._non_real_points
+        return self._contains_real_point(point)
+
+    def _contains_real_point(self, point: SupportsFloat) -> bool:
+        index = bisect_right(self._left_ends, point) - 1
+        if index >= 0:
+            left_end = self._left_ends[index]
+            right_end = self._right_ends[index]
+            if ((left_end < point
+                 or self._left_ends_inclusive[index] and left_end == point)
+                    and (point < right_end
+                         or self._right_ends_inclusive[index]
+                         and point == right_end)):
+                return True
+        points = self._points
+        index = bisect_left(points, point)
+        return index < len(points) and points[index] == point
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        arrays = self._to_arrays()
+        if arrays is None or not is_numeric(objects):
+            return Set.contains_many(self, objects)
+        (left_ends, left_ends_inclusive,
+         right_ends, right_ends_inclusive, points) = arrays
+        values = to_real_parts(objects)
+        result = np.isin(values, points)
+        if self._left_ends:
+            indices = np.searchsorted(left_ends, values,
+                                      side='right') - 1
+            found = indices >= 0
+            indices[~found] = 0
+            candidates_left_ends = left_ends[indices]
+            candidates_right_ends = right_ends[indices]
+            result |= (found
+                       & ((candidates_left_ends < values)
+                          | left_ends_inclusive[indices]
+                          & (candidates_left_ends == values))
+                       & ((values < candidates_right_ends)
+                          | right_ends_inclusive[indices]
+                          & (values == candidates_right_ends)))
+        if objects.dtype.kind == 'c' and self._non_real_points:
+            result |= np.isin(objects,
+                              [point
+                               for point in self._non_real_points
+                               if isinstance(point, Number)])
+        return result
+
+    def _to_arrays(self) -> Optional[Tuple[np.ndarray, ...]]:
+        if self._arrays is None:
+            arrays = (to_array(list(map(to_array_scalar, self._left_ends))),
+                      np.array(self._left_ends_inclusive,
+                               dtype=bool),
+                      to_array(list(map(to_array_scalar, self._right_ends))),
+                      np.array(self._right_ends_inclusive,
+                               dtype=bool),
+                      to_array(list(map(to_array_scalar, self._points))))
+            self._arrays = (arrays
+                            if all(map(is_numeric, arrays))
+                            else ())
+        return self._arrays or None
+
+    @dispatched
+    def __or__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        other_union = to_interval_union(other)
+        if other_union is None:
+            return super().__or__(other)
+        return (self._result_type(other_union).from_pieces(
+                unite_pieces(self.pieces(), other_union.pieces()),
+                self._non_real_points | other_union._non_real_points)
+                .fold())
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        other_union = to_interval_union(other)
+        if other_union is None:
+            return super().__rsub__(other)
+        return other_union - self
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        other_union = to_interval_union(other)
+        if other_union is None:
+            return super().__sub__(other)
+        return (self._result_type(other_union).from_pieces(
+                subtract_pieces(list(self.pieces()),
+                                list(other_union.pieces())),
+                self._non_real_points - other_union._non_real_points)
+                .fold())
+
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        other_union = to_interval_union(other)
+        if other_union is None:
+            return super().__xor__(other)
+        return (self._result_type(other_union).from_pieces(
+                symmetrically_subtract_pieces(list(self.pieces()),
+                                              list(other_union.pieces())),
+                self._non_real_points ^ other_union._non_real_points)
+                .fold())
+
+    def _result_type(self, other: 'IntervalUnion') -> Type['IntervalUnion']:
+        """
+        Returns type of unions with pieces taken from both operands.
+        """
+        return IntervalUnion
+
+    def fold(self) -> Set:
+        if not self._left_ends:
+            if self._points or self._non_real_points:
+                return DiscreteSet(*self._points, *self._non_real_points)
+            return EMPTY_SET
+        if (len(self._left_ends) == 1
+                and not (self._points or self._non_real_points)):
+            return self.intervals[0]
+        return self
+
+    def pieces(self) -> Iterable[Piece]:
+        """
+        Returns sorted disjoint pieces of real part
+        with isolated points as degenerate ones.
+        """
+        intervals_pieces = zip(self._left_ends, self._left_ends_inclusive,
+                               self._right_ends, self._right_ends_inclusive)
+        if not self._points:
+            return intervals_pieces
+        return merge(intervals_pieces, map(point_to_piece, self._points),
+                     key=to_piece_sorting_key)
+
+    def unfold(self) -> Iterable[Set]:
+        yield from self.intervals
+        if self._points or self._non_real_points:
+            yield DiscreteSet(*self._points, *self._non_real_points)
+
+
+Interval.union_type = IntervalUnion
+
+
+register('__and__', Interval, NumericDiscreteSet,
+         symmetric=True)(Interval.slice)
+
+
+@register('__and__', Interval, Interval)
+def intersect_intervals(interval: Interval, other: Interval) -> Set:
+    if not interval.intersects_with_interval(other):
+        return EMPTY_SET
+
+    if interval.left_end < other.left_end:
+        left_end = other.left_end
+        left_end_inclusive = other.left_end_inclusive
+    elif interval.left_end == other.left_end:
+        left_end = interval.left_end
+        left_end_inclusive = min(interval.left_end_inclusive,
+                                 other.left_end_inclusive)
+    else:
+        left_end = interval.left_end
+        left_end_inclusive = interval.left_end_inclusive
+
+    if interval.right_end < other.right_end:
+        right_end = interval.right_end
+        right_end_inclusive = interval.right_end_inclusive
+    elif interval.right_end == other.right_end:
+        right_end = interval.right_end
+        right_end_inclusive = min(interval.right_end_inclusive,
+                                  other.right_end_inclusive)
+    else:
+        right_end = other.right_end
+        right_end_inclusive = other.right_end_inclusive
+
+    return interval._result_type(other)(
+            left_end, right_end,
+            left_end_inclusive=left_end_inclusive,
+            right_end_inclusive=right_end_inclusive)
+
+
+@register('__eq__', Interval, DiscreteSet,
+          symmetric=True)
+def is_interval_equal_to_points(interval: Interval,
+                                points: DiscreteSet) -> bool:
+    # intervals are never empty or degenerate
+    return False
+
+
+@register('__eq__', Interval, Interval)
+def are_intervals_equal(interval: Interval, other: Interval) -> bool:
+    return (interval.left_end == other.left_end
+            and interval.left_end_inclusive == other.left_end_inclusive
+            and interval.right_end == other.right_end
+            and interval.right_end_inclusive == other.right_end_inclusive)
+
+
+@register('__ge__', Interval, DiscreteSet)
+def does_interval_contain_points(interval: Interval,
+                                 points: DiscreteSet) -> bool:
+    return all(point in interval
+               for point in points.points)
+
+
+@register('__ge__', Interval, Interval)
+def does_interval_contain_interval(interval: Interval,
+                                   other: Interval) -> bool:
+    return interval.overlaps_interval(other)
+
+
+@register('__le__', Interval, DiscreteSet)
+def does_interval_lie_in_points(interval: Interval,
+                                points: DiscreteSet) -> bool:
+    # intervals have infinitely many points
+    return False
+
+
+@register('__le__', Interval, Interval)
+def does_interval_lie_in_interval(interval: Interval,
+                                  other: Interval) -> bool:
+    return other.overlaps_interval(interval)
+
+
+@register('__or__', Interval, DiscreteSet,
+          symmetric=True)
+def unite_interval_with_points(interval: Interval,
+                               points: DiscreteSet) -> Set:
+    merged_interval = close_interval(interval, points)
+    return Union(merged_interval, points - merged_interval)
+
+
+def close_interval(interval: Interval, set_: Set) -> Interval:
+    """
+    Returns interval with its ends included if they belong to given set,
+    so united with the set it has canonical representation.
+    """
+    left_end_inclusive = (interval.left_end_inclusive
+                          or interval.left_end in set_)
+    right_end_inclusive = (interval.right_end_inclusive
+                           or interval.right_end in set_)
+    if (left_end_inclusive is interval.left_end_inclusive
+            and right_end_inclusive is interval.right_end_inclusive):
+        return interval
+    # ends are not changed, so their type is preserved
+    return type(interval)(interval.left_end, interval.right_end,
+                          left_end_inclusive=left_end_inclusive,
+                          right_end_inclusive=right_end_inclusive)
+
+
+@register('__or__', Interval, Interval)
+def unite_intervals(interval: Interval, other: Interval) -> Set:
+    if not interval.merges_with_interval(other):
+        return Union(interval, other)
+
+    def by_left_end_sorting_key(interval: Interval
+                                ) -> Tuple[SupportsFloat, bool]:
+        return interval.left_end, not interval.left_end_inclusive
+
+    def by_right_end_sorting_key(interval: Interval
+                                 ) -> Tuple[SupportsFloat, bool]:
+        return interval.right_end, interval.right_end_inclusive
+
+    left_interval = min(interval, other,
+                        key=by_left_end_sorting_key)
+    right_interval = max(interval, other,
+                         key=by_right_end_sorting_key)
+    return interval._result_type(other)(
+            left_interval.left_end, right_interval.right_end,
+            left_end_inclusive=left_interval.left_end_inclusive,
+            right_end_inclusive=right_interval.right_end_inclusive)
+
+
+@register('__sub__', Interval, DiscreteSet)
+def subtract_points_from_interval(interval: Interval,
+                                  points: DiscreteSet) -> Set:
+    def to_real_part(number: Number) -> SupportsFloat:
+        if not isinstance(number, Complex):
+            return number
+        return number.real
+
+    break_points = (interval.slice(points).array.tolist()
+                    if isinstance(points, NumericDiscreteSet)
+                    else sorted(map(to_real_part,
+                                    filter(interval.__contains__,
+                                           points.points))))
+    if not break_points:
+        return interval
+    first_excluded_number = break_points[0]
+    left_end = interval.left_end
+    right_end = interval.right_end
+    left_end_inclusive = interval.left_end_inclusive
+    if first_excluded_number == left_end:
+        left_end_inclusive = False
+        break_points.pop(0)
+    right_end_inclusive = interval.right_end_inclusive
+    try:
+        last_excluded_number = break_points[-1]
+    except IndexError:
+        pass
+    else:
+        if last_excluded_number == right_end:
+            right_end_inclusive = False
+            break_points.pop(-1)
+    left_ends = chain([left_end], break_points)
+    right_ends = chain(break_points, [right_end])
+    left_ends_inclusion = chain([left_end_inclusive],
+                                repeat(False,
+                                       times=len(break_points)))
+    right_ends_inclusion = chain(repeat(False,
+                                        times=len(break_points)),
+                                 [right_end_inclusive])
+    result_type = interval._result_type(points)
+    parts = (result_type(left_end, right_end,
+                         left_end_inclusive=left_end_inclusive,
+                         right_end_inclusive=right_end_inclusive)
+             for (left_end, right_end,
+                  left_end_inclusive,
+                  right_end_inclusive) in zip(left_ends, right_ends,
+                                              left_ends_inclusion,
+                                              right_ends_inclusion))
+    return Union(*parts).fold()
+
+
+@register('__sub__', Interval, Interval)
+def subtract_interval(interval: Interval, other: Interval) -> Set:
+    if not interval.intersects_with_interval(other):
+        return interval
+
+    result_type = interval._result_type(other)
+    return (Union(
+            result_type(interval.left_end, other.left_end,
+                        left_end_inclusive=interval.left_end_inclusive,
+                        right_end_inclusive=not other.left_end_inclusive),
+            result_type(other.right_end, interval.right_end,
+                        left_end_inclusive=not other.right_end_inclusive,
+                        right_end_inclusive=interval.right_end_inclusive))
+            .fold())
+
+
+@register('__eq__', IntervalUnion, IntervalUnion)
+def are_interval_unions_equal(union: IntervalUnion,
+                              other: IntervalUnion) -> bool:
+    return (union._left_ends == other._left_ends
+            and union._left_ends_inclusive == other._left_ends_inclusive
+            and union._right_ends == other._right_ends
+            and union._right_ends_inclusive == other._right_ends_inclusive
+            and union._points == other._points
+            and union._non_real_points == other._non_real_points)
+
+
+@register('__eq__', IntervalUnion, DiscreteSet,
+          symmetric=True)
+def is_interval_union_equal_to_points(union: IntervalUnion,
+                                      points: DiscreteSet) -> bool:
+    # unions are canonical, so the one with intervals has no equal points
+    return not union._left_ends and union.fold() == points
+
+
+@register('__ge__', IntervalUnion, DiscreteSet)
+def does_interval_union_contain_points(union: IntervalUnion,
+                                       points: DiscreteSet) -> bool:
+    return points <= union
+
+
+@register('__ge__', IntervalUnion, IntervalUnion)
+def does_interval_union_contain_interval_union(union: IntervalUnion,
+                                               other: IntervalUnion
+                                               ) -> bool:
+    return does_interval_union_lie_in_interval_union(other, union)
+
+
+@register('__gt__', IntervalUnion, IntervalUnion)
+def does_interval_union_strictly_contain_interval_union(
+        union: IntervalUnion, other: IntervalUnion) -> bool:
+    return (does_interval_union_lie_in_interval_union(other, union)
+            and not are_interval_unions_equal(union, other))
+
+
+@register('__le__', IntervalUnion, DiscreteSet)
+def does_interval_union_lie_in_points(union: IntervalUnion,
+                                      points: DiscreteSet) -> bool:
+    return not union._left_ends and all(
+            map(points.__contains__,
+                chain(union._points, union._non_real_points)))
+
+
+@register('__le__', IntervalUnion, IntervalUnion)
+def does_interval_union_lie_in_interval_union(union: IntervalUnion,
+                                              other: IntervalUnion
+                                              ) -> bool:
+    return (union._non_real_points <= other._non_real_points
+            and are_pieces_covered(union.pieces(), other.pieces()))
+
+
+@register('__lt__', IntervalUnion, IntervalUnion)
+def does_interval_union_strictly_lie_in_interval_union(
+        union: IntervalUnion, other: IntervalUnion) -> bool:
+    return (does_interval_union_lie_in_interval_union(union, other)
+            and not are_interval_unions_equal(union, other))
+
+
+@register('__ge__', Interval, IntervalUnion)
+def does_interval_contain_interval_union(interval: Interval,
+                                         union: IntervalUnion) -> bool:
+    if union._non_real_points:
+        return False
+    # interval is convex, so it suffices to check extreme pieces
+    extreme_pieces = []
+    if union._left_ends:
+        extreme_pieces.extend(
+                (union._left_ends[index], union._left_ends_inclusive[index],
+                 union._right_ends[index], union._right_ends_inclusive[index])
+                for index in (0, -1))
+    if union._points:
+        extreme_pieces.extend(map(point_to_piece,
+                                  (union._points[0], union._points[-1])))
+    piece = interval_to_piece(interval)
+    return all(is_piece_covered(extreme_piece, piece)
+               for extreme_piece in extreme_pieces)
+
+
+@register('__le__', Interval, IntervalUnion)
+def does_interval_lie_in_interval_union(interval: Interval,
+                                        union: IntervalUnion) -> bool:
+    # isolated points can not cover interval, so the only candidate
+    # is the last union's interval which does not start after it
+    index = bisect_right(union._left_ends, interval.left_end) - 1
+    return index >= 0 and is_piece_covered(
+            interval_to_piece(interval),
+            (union._left_ends[index], union._left_ends_inclusive[index],
+             union._right_ends[index], union._right_ends_inclusive[index]))
+
+
+register('__ge__', IntervalUnion, Interval)(
+        to_swapped(does_interval_lie_in_interval_union))
+register('__le__', IntervalUnion, Interval)(
+        to_swapped(does_interval_contain_interval_union))
+register('__ge__', DiscreteSet, IntervalUnion)(
+        to_swapped(does_interval_union_lie_in_points))
+
+
+def to_interval_union(set_: Set) -> Optional[IntervalUnion]:
+    """
+    Converts given set to interval union if possible.
+    """
+    if isinstance(set_, IntervalUnion):
+        return set_
+    subsets = list(set_.unfold())
+    for union_type in (set_.union_type, IntervalUnion):
+        if (union_type is not None
+                and issubclass(union_type, IntervalUnion)
+                and union_type.unites(subsets)):
+            return union_type(*subsets)
+    return None
+
+
+def interval_to_piece(interval: Interval) -> Piece:
+    return (interval.left_end, interval.left_end_inclusive,
+            interval.right_end, interval.right_end_inclusive)
+
+
+def point_to_piece(point: SupportsFloat) -> Piece:
+    return point, True, point, True
+
+
+def to_piece_sorting_key(piece: Piece) -> Tuple[SupportsFloat, bool]:
+    return piece[0], not piece[1]
+
+
+def merge_pieces(pieces: Iterable[Piece]) -> Iterable[Piece]:
+    """
+    Merges intersecting & adjacent pieces
+    sorted by left ends into disjoint non-mergeable ones.
+    """
+    pieces = iter(pieces)
+    try:
+        (left_end, left_end_inclusive,
+         right_end, right_end_inclusive) = next(pieces)
+    except StopIteration:
+        return
+    for (next_left_end, next_left_end_inclusive,
+         next_right_end, next_right_end_inclusive) in pieces:
+        if (next_left_end < right_end
+                or next_left_end == right_end
+                and (right_end_inclusive or next_left_end_inclusive)):
+            if next_right_end > right_end:
+                right_end = next_right_end
+                right_end_inclusive = next_right_end_inclusive
+            elif next_right_end == right_end:
+                right_end_inclusive = (right_end_inclusive
+                                       or next_right_end_inclusive)
+            continue
+        yield left_end, left_end_inclusive, right_end, right_end_inclusive
+        (left_end, left_end_inclusive,
+         right_end, right_end_inclusive) = (next_left_end,
+                                            next_left_end_inclusive,
+                                            next_right_end,
+                                            next_right_end_inclusive)
+    yield left_end, left_end_inclusive, right_end, right_end_inclusive
+
+
+def are_pieces_covered(pieces: Iterable[Piece],
+                       other_pieces: Iterable[Piece]) -> bool:
+    """
+    Checks if sorted disjoint non-mergeable pieces are covered
+    by other ones in linear time stopping at the first uncovered piece.
+    """
+    other_pieces = iter(other_pieces)
+    other_piece = None
+    for piece in pieces:
+        left_end, left_end_inclusive, _, _ = piece
+        # the only candidate to cover the piece is the first other piece
+        # which does not end before it
+        while (other_piece is None
+               or other_piece[2] < left_end
+               or other_piece[2] == left_end
+               and not (other_piece[3] and left_end_inclusive)):
+            try:
+                other_piece = next(other_pieces)
+            except StopIteration:
+                return False
+        if not is_piece_covered(piece, other_piece):
+            return False
+    return True
+
+
+def is_piece_covered(piece: Piece, other_piece: Piece) -> bool:
+    left_end, left_end_inclusive, right_end, right_end_inclusive = piece
+    (other_left_end, other_left_end_inclusive,
+     other_right_end, other_right_end_inclusive) = other_piece
+    return ((other_left_end < left_end
+             or other_left_end == left_end
+             and (other_left_end_inclusive or not left_end_inclusive))
+            and (right_end < other_right_end
+                 or right_end == other_right_end
+                 and (other_right_end_inclusive or not right_end_inclusive)))
+
+
+def unite_pieces(pieces: Iterable[Piece],
+                 other_pieces: Iterable[Piece]) -> Iterable[Piece]:
+    """
+    Unites sorted disjoint non-mergeable pieces in linear time.
+    """
+    return merge_pieces(merge(pieces, other_pieces,
+                              key=to_piece_sorting_key))
+
+
+def intersect_pieces(pieces: Sequence[Piece],
+                     other_pieces: Sequence[Piece]) -> Iterable[Piece]:
+    """
+    Intersects sorted disjoint non-mergeable pieces in linear time.
+    """
+    index = other_index = 0
+    while index < len(pieces) and other_index < len(other_pieces):
+        (left_end, left_end_inclusive,
+         right_end, right_end_inclusive) = pieces[index]
+        (other_left_end, other_left_end_inclusive,
+         other_right_end, other_right_end_inclusive) = other_pieces[
+            other_index]
+        if (other_left_end > left_end
+                or other_left_end == left_end
+                and not other_left_end_inclusive):
+            left_end, left_end_inclusive = (other_left_end,
+                                            other_left_end_inclusive)
+        if (right_end < other_right_end
+                or right_end == other_right_end
+                and right_end_inclusive < other_right_end_inclusive):
+            index += 1
+        elif (other_right_end < right_end
+              or other_right_end == right_end
+              and other_right_end_inclusive < right_end_inclusive):
+            right_end, right_end_inclusive = (other_right_end,
+                                              other_right_end_inclusive)
+            other_index += 1
+        else:
+            index += 1
+            other_index += 1
+        if (left_end < right_end
+                or left_end == right_end
+                and left_end_inclusive and right_end_inclusive):
+            yield left_end, left_end_inclusive, right_end, right_end_inclusive
+
+
+def subtract_pieces(minuend: Sequence[Piece],
+                    subtrahend: Sequence[Piece]) -> Iterable[Piece]:
+    """
+    Subtracts sorted disjoint non-mergeable pieces in linear time.
+    """
+    start = 0
+    for (left_end, left_end_inclusive,
+         right_end, right_end_inclusive) in minuend:
+        while start < len(subtrahend):
+            _, _, other_right_end, other_right_end_inclusive = subtrahend[
+                start]
+            if not (other_right_end < left_end
+                    or other_right_end == left_end
+                    and not (other_right_end_inclusive
+                             and left_end_inclusive)):
+                break
+            start += 1
+        index = start
+        exhausted = False
+        while index < len(subtrahend):
+            (other_left_end, other_left_end_inclusive,
+             other_right_end, other_right_end_inclusive) = subtrahend[index]
+            if (other_left_end > right_end
+                    or other_left_end == right_end
+                    and not (other_left_end_inclusive
+                             and right_end_inclusive)):
+                break
+            if (left_end < other_left_end
+                    or left_end == other_left_end
+                    and left_end_inclusive
+                    and not other_left_end_inclusive):
+                yield (left_end, left_end_inclusive,
+                       other_left_end, not other_left_end_inclusive)
+            if (other_right_end > right_end
+                    or other_right_end == right_end
+                    and (other_right_end_inclusive
+                         or not right_end_inclusive)):
+                exhausted = True
+                break
+            left_end, left_end_inclusive = (other_right_end,
+                                            not other_right_end_inclusive)
+            index += 1
+        start = index
+        if not exhausted and (left_end < right_end
+                              or left_end == right_end
+                              and left_end_inclusive
+                              and right_end_inclusive):
+            yield left_end, left_end_inclusive, right_end, right_end_inclusive
+
+
+def symmetrically_subtract_pieces(pieces: Sequence[Piece],
+                                  other_pieces: Sequence[Piece]
+                                  ) -> Iterable[Piece]:
+    """
+    Symmetrically subtracts sorted disjoint non-mergeable pieces
+    in linear time.
+    """
+    return merge_pieces(merge(subtract_pieces(pieces, other_pieces),
+                              subtract_pieces(other_pieces, pieces),
+                              key=to_piece_sorting_key))
+
+
 OpenInterval = cast(Callable[[SupportsFloat, SupportsFloat], Interval],
                     partial(Interval,
                             left_end_inclusive=False,
                             right_end_inclusive=False))
 real_line = OpenInterval(Decimal('-inf'), Decimal('inf'))
 real_line_extended = Interval(Decimal('-inf'), Decimal('inf'))
+
+
+def complement(set_: Set, universe: Set = real_line) -> Set:
+    """
+    Returns complement of given set to given universe
+    (the real line by default, also available as ``~set_``)
+    in a single pass over their sorted pieces
+    if both of them are unions of intervals & points
+    with fallback to difference otherwise.
+    """
+    universe_union = to_interval_union(universe)
+    if universe_union is None:
+        return universe - set_
+    if type(set_) is Union:
+        # general union is split without compression of its subsets,
+        # other subsets are subtracted from the universe beforehand
+        # instead of intersecting complements of every subset
+        pieces_subsets, rest_subsets = [], []
+        for subset in set_._subsets:
+            (pieces_subsets
+             if isinstance(subset, (Interval, DiscreteSet))
+             else rest_subsets).append(subset)
+        if not pieces_subsets:
+            return universe - set_
+        return complement(IntervalUnion(*pieces_subsets),
+                          universe - Union(*rest_subsets)
+                          if rest_subsets
+                          else universe)
+    if isinstance(set_, NumericDiscreteSet):
+        # points are already sorted, so they are punctured right away
+        result_type = IntervalUnion
+        pieces = list(map(point_to_piece, set_.array.tolist()))
+        non_real_points = frozenset()  # type: FrozenSet[Any]
+    else:
+        union = to_interval_union(set_)
+        if union is None:
+            return universe - set_
+        result_type = universe_union._result_type(union)
+        pieces = list(union.pieces())
+        non_real_points = union._non_real_points
+    return (result_type.from_pieces(
+            subtract_pieces(list(universe_union.pieces()), pieces),
+            universe_union._non_real_points - non_real_points)
+            .fold())
@@ -1,24 +1,66 @@
+from itertools import filterfalse
+from numbers import Number
+from typing import (Any,
+                    FrozenSet,
+                    Iterable,
+                    Optional,
+                    SupportsFloat,
+                    Tuple)
+
+import numpy as np
 from reprit.base import generate_repr
 
-from .base import Set
+from .arrays import (in_sorted,
+                     is_cast_exact,
+                     is_numeric,
+                     is_real,
+                     represents_exactly,
+                     to_array,
+                     to_array_scalar,
+                     to_integer,
+                     to_real_parts,
+                     to_real_point)
+from .base import (EMPTY_SET,
+                   Bounds,
+                   Set,
+                   rejecting_disjoint)
+from .dispatch import (dispatched,
+                       register)
 from .hints import Domain
 
 
 class DiscreteSet(Set[Domain]):
+    __slots__ = ('points', '_hash', '_bounds')
+
     def __init__(self, *points: Domain) -> None:
         self.points = frozenset(points)
+        self._hash = None
+        self._bounds = None
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if self._bounds is None:
+            real_points = list(map(to_real_point, self.points))
+            self._bounds = ((min(real_points), True, max(real_points), True)
+                            if real_points and None not in real_points
+                            else ())
+        return self._bounds or None
 
     def __bool__(self) -> bool:
         return bool(self.points)
 
     def __hash__(self) -> int:
-        return hash(self.points)
+        if self._hash is None:
+            self._hash = to_points_hash(self.points)
+        return self._hash
 
     __repr__ = generate_repr(__init__)
 
     def __str__(self) -> str:
         return '{' + ', '.join(map(str, self.points)) + '}'
 
+    @rejecting_disjoint
+    @dispatched
     def __and__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
@@ -30,41 +72,31 @@ class DiscreteSet(Set[Domain]):
     def __contains__(self, object_: Domain) -> bool:
         return object_ in self.points
 
-    def __eq__(self, other: Set) -> bool:
-        if not isinstance(other, DiscreteSet):
-            return super().__eq__(other)
-        return self.points == other.points
-
-    def __ge__(self, other: Set) -> bool:
-        if not isinstance(other, DiscreteSet):
-            return super().__ge__(other)
-        return self.points >= other.points
-
-    def __gt__(self, other: Set) -> bool:
-        if not isinstance(other, DiscreteSet):
-            return super().__gt__(other)
-        return self.points > other.points
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        objects = to_array(objects)
+        points = to_array([point
+                           for point in self.points
+                           if isinstance(point, Number)])
+        if not (is_numeric(objects) and is_numeric(points)):
+            return super().contains_many(objects)
+        return np.isin(objects, points)
 
+    @rejecting_disjoint
+    @dispatched
     def __le__(self, other: Set) -> bool:
         if not isinstance(other, Set):
             return NotImplemented
-        if not isinstance(other, DiscreteSet):
-            return all(point in other
-                       for point in self.points)
-        return self.points <= other.points
-
-    def __lt__(self, other: Set) -> bool:
-        if not isinstance(other, DiscreteSet):
-            return super().__lt__(other)
-        return self.points < other.points
+        return all(point in other
+                   for point in self.points)
 
+    @dispatched
     def __or__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
-        if not isinstance(other, DiscreteSet):
-            return other | self
-        return DiscreteSet(*self.points, *other.points)
+        return other | self
 
+    @rejecting_disjoint
+    @dispatched
     def __sub__(self, other: Set) -> Set:
         if not isinstance(other, Set):
             return NotImplemented
@@ -72,3 +104,279 @@ class DiscreteSet(Set[Domain]):
                             for point in self.points
                             if point not in other)
         return DiscreteSet(*remaining_points)
+
+
+class NumericDiscreteSet(DiscreteSet[SupportsFloat]):
+    """
+    Discrete set of real numbers stored as sorted array.
+
+    Non-real points are not supported,
+    so creation with them falls back to general discrete set.
+    """
+
+    __slots__ = ('_array',)
+
+    def __new__(cls, *points: SupportsFloat) -> DiscreteSet:
+        return cls.from_array(points)
+
+    def __init__(self, *points: SupportsFloat) -> None:
+        pass
+
+    @classmethod
+    def from_array(cls, points: Iterable[SupportsFloat]) -> DiscreteSet:
+        """
+        Creates set from given array-like of points.
+        """
+        if not (isinstance(points, np.ndarray)
+                or hasattr(points, '__len__')):
+            points = list(points)
+        array = to_array(points)
+        if not is_real(array):
+            return DiscreteSet(*array.ravel().tolist())
+        if not represents_exactly(array, points):
+            return DiscreteSet(*np.asarray(points,
+                                           dtype=object).ravel().tolist())
+        return cls.from_sorted_array(np.unique(array))
+
+    @classmethod
+    def from_sorted_array(cls, array: np.ndarray) -> 'NumericDiscreteSet':
+        """
+        Creates set from given sorted one-dimensional array
+        of distinct real numbers without normalization & copying.
+        """
+        result = super().__new__(cls)
+        result._array = array
+        result._hash = None
+        return result
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Returns sorted array of points.
+        """
+        return self._array
+
+    @property
+    def points(self) -> FrozenSet[SupportsFloat]:
+        return frozenset(self._array.tolist())
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        array = self._array
+        if not array.size:
+            return None
+        return array[0].item(), True, array[-1].item(), True
+
+    def __bool__(self) -> bool:
+        return bool(self._array.size)
+
+    __repr__ = generate_repr(__init__)
+
+    def __str__(self) -> str:
+        return '{' + ', '.join(map(str, self._array.tolist())) + '}'
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, NumericDiscreteSet):
+            if other._array.size < self._array.size:
+                return other & self
+        elif (isinstance(other, DiscreteSet)
+              and len(other.points) < self._array.size):
+            return DiscreteSet(*filter(self.__contains__, other.points))
+        return self._select(other.contains_many(self._array))
+
+    def __contains__(self, object_: Any) -> bool:
+        point = to_real_point(object_)
+        if point is None:
+            return False
+        array = self._array
+        index = np.searchsorted(array, to_array_scalar(point))
+        return index < array.size and array[index].item() == point
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        if not is_numeric(objects):
+            return Set.contains_many(self, objects)
+        return in_sorted(self._array, to_real_parts(objects))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self).from_sorted_array, (self._array,)
+
+    @rejecting_disjoint
+    @dispatched
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return are_numeric_points_subset(self, other)
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if not isinstance(other, DiscreteSet):
+            return super().__rsub__(other)
+        return DiscreteSet(*filterfalse(self.__contains__, other.points))
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self._select(~other.contains_many(self._array))
+
+    __rand__ = __and__
+    __ror__ = DiscreteSet.__or__
+
+    def between(self,
+                left_end: SupportsFloat,
+                right_end: SupportsFloat,
+                *,
+                left_end_inclusive: bool = True,
+                right_end_inclusive: bool = True) -> 'NumericDiscreteSet':
+        """
+        Returns points lying between given ends
+        sharing memory with the set.
+        """
+        array = self._array
+        start = np.searchsorted(array, to_array_scalar(left_end),
+                                side='left' if left_end_inclusive else 'right')
+        stop = np.searchsorted(array, to_array_scalar(right_end),
+                               side='right' if right_end_inclusive else 'left')
+        return self.from_sorted_array(array[start:max(start, stop)])
+
+    def _merge(self, other: 'NumericDiscreteSet') -> DiscreteSet:
+        extra_points = other._array[~in_sorted(self._array, other._array)]
+        dtype = np.result_type(self._array, extra_points)
+        if not (is_cast_exact(self._array, dtype)
+                and is_cast_exact(extra_points, dtype)):
+            return DiscreteSet(*self._array.tolist(), *extra_points.tolist())
+        array = self._array.astype(dtype,
+                                   copy=False)
+        return self.from_sorted_array(
+                np.insert(array, np.searchsorted(array, extra_points),
+                          extra_points))
+
+    def _select(self, mask: np.ndarray) -> 'NumericDiscreteSet':
+        return self.from_sorted_array(self._array[mask])
+
+
+@register('__eq__', DiscreteSet, DiscreteSet)
+def are_points_equal(points: DiscreteSet, other: DiscreteSet) -> bool:
+    return points.points == other.points
+
+
+@register('__ge__', DiscreteSet, DiscreteSet)
+def are_points_superset(points: DiscreteSet, other: DiscreteSet) -> bool:
+    return points.points >= other.points
+
+
+@register('__gt__', DiscreteSet, DiscreteSet)
+def are_points_strict_superset(points: DiscreteSet,
+                               other: DiscreteSet) -> bool:
+    return points.points > other.points
+
+
+@register('__le__', DiscreteSet, DiscreteSet)
+def are_points_subset(points: DiscreteSet, other: DiscreteSet) -> bool:
+    return points.points <= other.points
+
+
+@register('__lt__', DiscreteSet, DiscreteSet)
+def are_points_strict_subset(points: DiscreteSet,
+                             other: DiscreteSet) -> bool:
+    return points.points < other.points
+
+
+@register('__or__', DiscreteSet, DiscreteSet)
+def unite_points(points: DiscreteSet, other: DiscreteSet) -> Set:
+    return DiscreteSet(*points.points, *other.points)
+
+
+@register('__eq__', NumericDiscreteSet, NumericDiscreteSet)
+def are_numeric_points_equal(points: NumericDiscreteSet,
+                             other: NumericDiscreteSet) -> bool:
+    return np.array_equal(points.array, other.array)
+
+
+@register('__ge__', NumericDiscreteSet, DiscreteSet)
+def are_numeric_points_superset(points: NumericDiscreteSet,
+                                other: DiscreteSet) -> bool:
+    if isinstance(other, NumericDiscreteSet):
+        return bool(points.contains_many(other.array).all())
+    return all(map(points.__contains__, other.points))
+
+
+@register('__gt__', NumericDiscreteSet, DiscreteSet)
+def are_numeric_points_strict_superset(points: NumericDiscreteSet,
+                                       other: DiscreteSet) -> bool:
+    return points >= other and points != other
+
+
+@register('__le__', NumericDiscreteSet, DiscreteSet)
+def are_numeric_points_subset(points: NumericDiscreteSet,
+                              other: Set) -> bool:
+    return bool(other.contains_many(points.array).all())
+
+
+@register('__lt__', NumericDiscreteSet, DiscreteSet)
+def are_numeric_points_strict_subset(points: NumericDiscreteSet,
+                                     other: DiscreteSet) -> bool:
+    return points <= other and points != other
+
+
+@register('__or__', NumericDiscreteSet, DiscreteSet)
+def unite_numeric_points(points: NumericDiscreteSet,
+                         other: DiscreteSet) -> Set:
+    if not isinstance(other, NumericDiscreteSet):
+        other = NumericDiscreteSet.from_array(list(other.points))
+        if not isinstance(other, NumericDiscreteSet):
+            return DiscreteSet(*points.points, *other.points)
+    return points._merge(other)
+
+
+@register('__xor__', NumericDiscreteSet, NumericDiscreteSet)
+def symmetrically_subtract_numeric_points(points: NumericDiscreteSet,
+                                          other: NumericDiscreteSet
+                                          ) -> NumericDiscreteSet:
+    return points.from_sorted_array(np.setxor1d(points.array, other.array,
+                                                assume_unique=True))
+
+
+Run = Tuple[int, int]
+
+
+def to_points_hash(points: FrozenSet[Any]) -> int:
+    """
+    Returns hash of points
+    which for integers is defined by their runs
+    to agree with sets storing them as such.
+    """
+    if not points:
+        return hash(EMPTY_SET)
+    integers = list(map(to_integer, points))
+    if None in integers:
+        return hash(points)
+    integers.sort()
+    return hash(tuple(to_runs(integers)))
+
+
+def to_runs(integers: Iterable[int]) -> Iterable[Run]:
+    """
+    Returns runs of consecutive integers
+    represented by start & stop pairs
+    from given sorted integers.
+    """
+    integers = iter(integers)
+    try:
+        start = next(integers)
+    except StopIteration:
+        return
+    stop = start + 1
+    for integer in integers:
+        if integer > stop:
+            yield start, stop
+            start = integer
+        stop = max(stop, integer + 1)
+    yield start, stop
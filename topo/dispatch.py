@@ -0,0 +1,128 @@
+"""
+Registry of implementations of binary set operations & relations
+for pairs of operands types.
+
+Operators of set classes look implementations up
+by operation method name & operands types
+resolving them along methods resolution orders of operands types
+(left operand type first) and fall back to their own methods
+if there is no implementation registered for any of types pairs.
+Resolutions are cached, so dispatching takes a single dictionary lookup.
+"""
+from functools import wraps
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Optional,
+                    Tuple)
+
+Implementation = Callable[[Any, Any], Any]
+Key = Tuple[str, type, type]
+
+OPERATIONS = ('__and__', '__or__', '__rand__', '__ror__', '__rsub__',
+              '__sub__', '__xor__')
+RELATIONS = ('__eq__', '__ge__', '__gt__', '__le__', '__lt__')
+METHODS = OPERATIONS + RELATIONS
+
+_implementations = {}  # type: Dict[Key, Implementation]
+_resolutions = {}  # type: Dict[Key, Optional[Implementation]]
+
+
+def register(name: str,
+             left_type: type,
+             right_type: type,
+             *,
+             symmetric: bool = False
+             ) -> Callable[[Implementation], Implementation]:
+    """
+    Returns decorator which registers implementation of operation
+    with given method name for operands of given types (or their subtypes).
+
+    Symmetric implementation is also registered for swapped operands types
+    (e.g. for intersection & union).
+    """
+    if name not in METHODS:
+        raise ValueError('Invalid name: {name!r}, should be one of {names}.'
+                         .format(name=name,
+                                 names=', '.join(METHODS)))
+
+    def decorator(implementation: Implementation) -> Implementation:
+        _implementations[name, left_type, right_type] = implementation
+        if symmetric and left_type is not right_type:
+            _implementations[name, right_type, left_type] = (
+                to_swapped(implementation))
+        _resolutions.clear()
+        return implementation
+
+    return decorator
+
+
+def unregister(name: str,
+               left_type: type,
+               right_type: type,
+               *,
+               symmetric: bool = False) -> None:
+    """
+    Unregisters implementation of operation
+    with given method name for operands of given types.
+    """
+    _implementations.pop((name, left_type, right_type), None)
+    if symmetric and left_type is not right_type:
+        _implementations.pop((name, right_type, left_type), None)
+    _resolutions.clear()
+
+
+def resolve(name: str,
+            left_type: type,
+            right_type: type) -> Optional[Implementation]:
+    """
+    Returns implementation of operation with given method name
+    for operands of given types or ``None`` if there is no such one.
+    """
+    key = name, left_type, right_type
+    try:
+        return _resolutions[key]
+    except KeyError:
+        pass
+    result = None
+    for left_base in left_type.__mro__:
+        for right_base in right_type.__mro__:
+            try:
+                result = _implementations[name, left_base, right_base]
+            except KeyError:
+                continue
+            break
+        if result is not None:
+            break
+    _resolutions[key] = result
+    return result
+
+
+def dispatched(method: Implementation) -> Implementation:
+    """
+    Decorates operation method to use registered implementations
+    falling back to the method itself.
+    """
+    name = method.__name__
+    resolutions = _resolutions
+
+    @wraps(method)
+    def wrapped(set_: Any, other: Any) -> Any:
+        key = name, type(set_), type(other)
+        try:
+            implementation = resolutions[key]
+        except KeyError:
+            implementation = resolve(*key)
+        if implementation is None:
+            return method(set_, other)
+        return implementation(set_, other)
+
+    return wrapped
+
+
+def to_swapped(implementation: Implementation) -> Implementation:
+    @wraps(implementation)
+    def swapped(left: Any, right: Any) -> Any:
+        return implementation(right, left)
+
+    return swapped
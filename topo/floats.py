@@ -0,0 +1,151 @@
+import math
+from functools import partial
+from typing import (Any,
+                    Callable,
+                    FrozenSet,
+                    Iterable,
+                    SupportsFloat,
+                    Type,
+                    cast)
+
+from reprit.base import generate_repr
+
+from .base import Set
+from .continuous import (Interval,
+                         IntervalUnion,
+                         Piece)
+from .discrete import DiscreteSet
+from .dispatch import register
+
+
+class FloatInterval(Interval):
+    """
+    Interval with ends converted to floats,
+    so membership & operations with other float intervals
+    take exact float-only fast paths.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls,
+                left_end: SupportsFloat,
+                right_end: SupportsFloat,
+                *,
+                left_end_inclusive: bool = True,
+                right_end_inclusive: bool = True):
+        return super().__new__(cls, float(left_end), float(right_end),
+                               left_end_inclusive=left_end_inclusive,
+                               right_end_inclusive=right_end_inclusive)
+
+    def __init__(self,
+                 left_end: SupportsFloat,
+                 right_end: SupportsFloat,
+                 *,
+                 left_end_inclusive: bool = True,
+                 right_end_inclusive: bool = True) -> None:
+        super().__init__(float(left_end), float(right_end),
+                         left_end_inclusive=left_end_inclusive,
+                         right_end_inclusive=right_end_inclusive)
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, object_: Any) -> bool:
+        if type(object_) is not float and type(object_) is not int:
+            return super().__contains__(object_)
+        # comparisons with NaN are false, so it is not contained
+        return ((self.left_end < object_
+                 or self.left_end_inclusive and self.left_end == object_)
+                and (object_ < self.right_end
+                     or self.right_end_inclusive
+                     and object_ == self.right_end))
+
+    def _result_type(self, other: Set) -> Type[Interval]:
+        return FloatInterval if isinstance(other, FloatInterval) else Interval
+
+
+class FloatIntervalUnion(IntervalUnion):
+    """
+    Union of float intervals and isolated float points
+    with ends converted to floats,
+    so membership & operations with other float unions
+    take exact float-only fast paths.
+    """
+
+    __slots__ = ()
+
+    interval_type = FloatInterval
+
+    def _initialize(self,
+                    pieces: Iterable[Piece],
+                    non_real_points: FrozenSet[Any]) -> None:
+        super()._initialize(map(to_float_piece, pieces), non_real_points)
+
+    @classmethod
+    def unites(cls, subsets: Iterable[Set]) -> bool:
+        return all(isinstance(subset, FloatInterval)
+                   or isinstance(subset, DiscreteSet)
+                   and all(isinstance(point, float)
+                           for point in subset.points)
+                   for subset in subsets)
+
+    def __contains__(self, object_: Any) -> bool:
+        if type(object_) is not float and type(object_) is not int:
+            return super().__contains__(object_)
+        return not math.isnan(object_) and self._contains_real_point(object_)
+
+    def _result_type(self, other: IntervalUnion) -> Type[IntervalUnion]:
+        return (FloatIntervalUnion
+                if isinstance(other, FloatIntervalUnion)
+                else IntervalUnion)
+
+
+FloatInterval.union_type = FloatIntervalUnion
+
+
+@register('__and__', FloatInterval, FloatInterval)
+def intersect_float_intervals(interval: FloatInterval,
+                              other: FloatInterval) -> Set:
+    if (interval.left_end < other.left_end
+            or interval.left_end == other.left_end
+            and other.left_end_inclusive < interval.left_end_inclusive):
+        left_end, left_end_inclusive = (other.left_end,
+                                        other.left_end_inclusive)
+    else:
+        left_end, left_end_inclusive = (interval.left_end,
+                                        interval.left_end_inclusive)
+    if (other.right_end < interval.right_end
+            or other.right_end == interval.right_end
+            and other.right_end_inclusive < interval.right_end_inclusive):
+        right_end, right_end_inclusive = (other.right_end,
+                                          other.right_end_inclusive)
+    else:
+        right_end, right_end_inclusive = (interval.right_end,
+                                          interval.right_end_inclusive)
+    # construction takes care of empty & degenerate intersections
+    return FloatInterval(left_end, right_end,
+                         left_end_inclusive=left_end_inclusive,
+                         right_end_inclusive=right_end_inclusive)
+
+
+@register('__eq__', FloatInterval, FloatInterval)
+def are_float_intervals_equal(interval: FloatInterval,
+                              other: FloatInterval) -> bool:
+    return (interval.left_end == other.left_end
+            and interval.right_end == other.right_end
+            and interval.left_end_inclusive == other.left_end_inclusive
+            and interval.right_end_inclusive == other.right_end_inclusive)
+
+
+def to_float_piece(piece: Piece) -> Piece:
+    left_end, left_end_inclusive, right_end, right_end_inclusive = piece
+    return (float(left_end), left_end_inclusive,
+            float(right_end), right_end_inclusive)
+
+
+OpenFloatInterval = cast(Callable[[SupportsFloat, SupportsFloat],
+                                  FloatInterval],
+                         partial(FloatInterval,
+                                 left_end_inclusive=False,
+                                 right_end_inclusive=False))
+float_real_line = OpenFloatInterval(-math.inf, math.inf)
+float_real_line_extended = FloatInterval(-math.inf, math.inf)
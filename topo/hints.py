@@ -2,5 +2,6 @@ from typing import (Callable,
                     TypeVar)
 
 Domain = TypeVar('Domain')
+Key = TypeVar('Key')
 Range = TypeVar('Range')
 Map = Callable[[Domain], Range]
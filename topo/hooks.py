@@ -0,0 +1,73 @@
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Tuple,
+                    Type)
+
+from .base import Set
+from .dispatch import (METHODS,
+                       OPERATIONS)
+
+Operation = Callable[[Set, Set], Any]
+Wrapper = Callable[[Type[Set], str, Operation], Operation]
+
+_wrappers = []  # type: List[Wrapper]
+_originals = {}  # type: Dict[Tuple[Type[Set], str], Operation]
+
+
+def install(wrapper: Wrapper) -> None:
+    """
+    Installs wrapper around binary operations & relations
+    of all set classes.
+
+    Wrapper gets set class, method name & method
+    and should return method to be used instead.
+    Since methods are replaced on installation
+    there is no overhead while no wrappers are installed.
+    """
+    if wrapper in _wrappers:
+        return
+    _wrappers.append(wrapper)
+    refresh()
+
+
+def uninstall(wrapper: Wrapper) -> None:
+    """
+    Uninstalls previously installed wrapper.
+    """
+    try:
+        _wrappers.remove(wrapper)
+    except ValueError:
+        return
+    refresh()
+
+
+def refresh() -> None:
+    """
+    Re-applies installed wrappers,
+    e.g. to cover set classes defined after installation.
+    """
+    for cls in to_subclasses(Set):
+        for name in METHODS:
+            key = cls, name
+            try:
+                method = _originals[key]
+            except KeyError:
+                try:
+                    method = cls.__dict__[name]
+                except KeyError:
+                    continue
+                _originals[key] = method
+            for wrapper in _wrappers:
+                method = wrapper(cls, name, method)
+            setattr(cls, name, method)
+    if not _wrappers:
+        _originals.clear()
+
+
+def to_subclasses(cls: type) -> Iterable[type]:
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from to_subclasses(subclass)
@@ -0,0 +1,203 @@
+import time
+from functools import wraps
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Tuple,
+                    Type)
+
+from reprit.base import generate_repr
+
+from . import (base,
+               hooks)
+from .base import Set
+
+Key = Tuple[str, str, str]
+Tags = Dict[str, str]
+Sink = Callable[[str, Tags, float], None]
+
+UNIONS = ('__or__', '__ror__')
+
+
+class Instrumentation:
+    """
+    Collects statistics of binary set operations & relations
+    (number of calls & cumulative time in seconds
+    keyed by method name & operands types names)
+    and of unions compression
+    (number of calls, cumulative time, sizes of unions before & after it
+    and number of ``|`` operations performed while compressing).
+
+    Times are inclusive, i.e. time of an operation
+    contains time of all nested operations & compressions.
+
+    Works only while enabled (either explicitly or as a context manager),
+    there is no overhead when disabled.
+    """
+
+    def __init__(self,
+                 timer: Callable[[], float] = time.perf_counter) -> None:
+        self.timer = timer
+        self._operations = {}  # type: Dict[Key, List[float]]
+        self._unions_count = 0
+        self._reset_compress()
+        self._enabled = False
+
+    __repr__ = generate_repr(__init__)
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.disable()
+
+    def disable(self) -> None:
+        if not self._enabled:
+            return
+        hooks.uninstall(self._wrap)
+        _enabled_instrumentations.remove(self)
+        if not _enabled_instrumentations:
+            base.compress = _compress
+        self._enabled = False
+
+    def enable(self) -> None:
+        if self._enabled:
+            return
+        hooks.install(self._wrap)
+        _enabled_instrumentations.append(self)
+        base.compress = _instrumented_compress
+        self._enabled = True
+
+    def export(self, sink: Sink) -> None:
+        """
+        Passes collected statistics to given sink
+        as metric name, tags & value (e.g. to feed metrics pipeline).
+        """
+        for (name, left_type, right_type), (calls, seconds) in sorted(
+                self._operations.items()):
+            tags = {'operation': name,
+                    'left_type': left_type,
+                    'right_type': right_type}
+            sink('topo.operation.calls', tags, calls)
+            sink('topo.operation.seconds', tags, seconds)
+        for name, value in sorted(self.compress_statistics().items()):
+            sink('topo.compress.' + name, {}, value)
+
+    def compress_statistics(self) -> Dict[str, float]:
+        return {'calls': self._compress_calls,
+                'seconds': self._compress_seconds,
+                'unions': self._compress_unions,
+                'input_size': self._compress_input_size,
+                'max_input_size': self._compress_max_input_size,
+                'output_size': self._compress_output_size}
+
+    def operations_statistics(self) -> Dict[Key, Dict[str, float]]:
+        return {key: {'calls': calls, 'seconds': seconds}
+                for key, (calls, seconds) in self._operations.items()}
+
+    def reset(self) -> None:
+        """
+        Clears collected statistics.
+        """
+        self._operations.clear()
+        self._unions_count = 0
+        self._reset_compress()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns collected statistics as plain data
+        (e.g. to be serialized into JSON).
+        """
+        return {'operations': [
+                    {'operation': name,
+                     'left_type': left_type,
+                     'right_type': right_type,
+                     'calls': calls,
+                     'seconds': seconds}
+                    for (name, left_type, right_type), (calls, seconds)
+                    in sorted(self._operations.items())],
+                'compress': self.compress_statistics()}
+
+    def _record_compress(self,
+                         input_size: int,
+                         output_size: int,
+                         unions: int,
+                         seconds: float) -> None:
+        self._compress_calls += 1
+        self._compress_seconds += seconds
+        self._compress_unions += unions
+        self._compress_input_size += input_size
+        self._compress_max_input_size = max(self._compress_max_input_size,
+                                            input_size)
+        self._compress_output_size += output_size
+
+    def _reset_compress(self) -> None:
+        self._compress_calls = self._compress_unions = 0
+        self._compress_input_size = self._compress_max_input_size = 0
+        self._compress_output_size = 0
+        self._compress_seconds = 0.
+
+    def _wrap(self,
+              cls: Type[Set],
+              name: str,
+              method: hooks.Operation) -> hooks.Operation:
+        operations = self._operations
+        timer = self.timer
+        is_union = name in UNIONS
+
+        @wraps(method)
+        def wrapped(set_: Set, other: Any) -> Any:
+            start = timer()
+            try:
+                return method(set_, other)
+            finally:
+                seconds = timer() - start
+                key = name, type(set_).__name__, type(other).__name__
+                try:
+                    statistics = operations[key]
+                except KeyError:
+                    operations[key] = [1, seconds]
+                else:
+                    statistics[0] += 1
+                    statistics[1] += seconds
+                if is_union:
+                    self._unions_count += 1
+
+        return wrapped
+
+
+_compress = base.compress
+_enabled_instrumentations = []  # type: List[Instrumentation]
+
+
+def _instrumented_compress(sets: Iterable[Set]) -> Iterable[Set]:
+    sets = list(sets)
+    starts = [(instrumentation,
+               instrumentation._unions_count,
+               instrumentation.timer())
+              for instrumentation in _enabled_instrumentations]
+    result = list(_compress(sets))
+    for instrumentation, unions_count, start in starts:
+        instrumentation._record_compress(
+                len(sets), len(result),
+                instrumentation._unions_count - unions_count,
+                instrumentation.timer() - start)
+    return result
+
+
+def instrumentation(timer: Callable[[], float] = time.perf_counter
+                    ) -> Instrumentation:
+    """
+    Returns new instrumentation to be used as a context manager.
+    """
+    return Instrumentation(timer)
+
+
+def enabled_instrumentations() -> List[Instrumentation]:
+    """
+    Returns currently enabled instrumentations.
+    """
+    return list(_enabled_instrumentations)
@@ -0,0 +1,85 @@
+from typing import (Any,
+                    Dict,
+                    Iterator,
+                    List,
+                    Mapping,
+                    Tuple)
+
+from .continuous import Interval
+from .hints import Key
+
+Position = Tuple[Any, int]
+Event = Tuple[Position, int, int, int]
+
+START_KIND, STOP_KIND = 0, 1
+LEFT_SIDE, RIGHT_SIDE = 0, 1
+
+
+def join_intervals(left: Mapping[Key, Interval],
+                   right: Mapping[Key, Interval],
+                   *,
+                   merging: bool = False) -> Iterator[Tuple[Key, Key]]:
+    """
+    Returns pairs of keys of intersecting intervals
+    (or mergeable ones, i.e. also touching ones
+    with at least one of touching ends inclusive, if ``merging`` is set)
+    from given keyed intervals
+    with the first key from the left mapping and the second from the right one
+    by sweeping over sorted intervals ends
+    in ``O((n + m) log (n + m) + k)`` time
+    where ``n`` & ``m`` are the numbers of intervals
+    and ``k`` is the number of resulting pairs.
+
+    Pairs are generated lazily, so only active intervals are kept in memory
+    besides the ends themselves.
+    """
+    sides_keys = [list(left), list(right)]
+    events = []  # type: List[Event]
+    for side, intervals in enumerate((left, right)):
+        for index, interval in enumerate(intervals.values()):
+            start, stop = to_positions(interval,
+                                       merging=merging)
+            events.append((start, START_KIND, side, index))
+            events.append((stop, STOP_KIND, side, index))
+    # starts go before stops at the same position, so touching intervals
+    # are active simultaneously
+    events.sort(key=to_event_sorting_key)
+    sides_active = [{}, {}]  # type: List[Dict[int, None]]
+    for _, kind, side, index in events:
+        active = sides_active[side]
+        if kind == STOP_KIND:
+            del active[index]
+            continue
+        key = sides_keys[side][index]
+        other_keys = sides_keys[1 - side]
+        if side == LEFT_SIDE:
+            for other_index in sides_active[RIGHT_SIDE]:
+                yield key, other_keys[other_index]
+        else:
+            for other_index in sides_active[LEFT_SIDE]:
+                yield other_keys[other_index], key
+        active[index] = None
+
+
+def to_positions(interval: Interval,
+                 *,
+                 merging: bool) -> Tuple[Position, Position]:
+    """
+    Returns positions of the first & the last points of the interval
+    with each position represented by its value
+    and offset of lying right before (``-1``), at (``0``)
+    or right after (``1``) it.
+
+    For merging stop position is shifted one offset forward,
+    so touching intervals overlap
+    unless both of touching ends are exclusive.
+    """
+    start = interval.left_end, 1 - interval.left_end_inclusive
+    stop = (interval.right_end,
+            interval.right_end_inclusive - 1 + merging)
+    return start, stop
+
+
+def to_event_sorting_key(event: Event) -> Tuple[Position, int]:
+    position, kind, _, _ = event
+    return position, kind
@@ -0,0 +1,232 @@
+from abc import abstractmethod
+from operator import (and_,
+                      or_,
+                      sub,
+                      xor)
+from typing import (Any,
+                    Iterable,
+                    Tuple)
+from weakref import WeakValueDictionary
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import to_array
+from .base import Set
+from .hints import Domain
+
+operators = {'difference': sub,
+             'intersection': and_,
+             'symmetric_difference': xor,
+             'union': or_}
+commutative_operations = {'intersection', 'symmetric_difference', 'union'}
+
+
+class Expression(Set[Domain]):
+    """
+    Lazily evaluated set expression.
+
+    Equal leaves and identical operations over the same operands
+    are represented by a single node,
+    so common subexpressions are evaluated at most once.
+    """
+
+    __slots__ = ('_value', '__weakref__')
+
+    def __bool__(self) -> bool:
+        return bool(self.evaluate())
+
+    def __hash__(self) -> int:
+        return hash(self.evaluate())
+
+    def __str__(self) -> str:
+        return str(self.evaluate())
+
+    def __and__(self, other: Set) -> 'Expression':
+        if not isinstance(other, Set):
+            return NotImplemented
+        return Operation('intersection', self, lazy(other))
+
+    def __eq__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.evaluate() == to_value(other)
+
+    def __ge__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.evaluate() >= to_value(other)
+
+    def __gt__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.evaluate() > to_value(other)
+
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.evaluate() <= to_value(other)
+
+    def __lt__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.evaluate() < to_value(other)
+
+    def __or__(self, other: Set) -> 'Expression':
+        if not isinstance(other, Set):
+            return NotImplemented
+        return Operation('union', self, lazy(other))
+
+    def __rsub__(self, other: Set) -> 'Expression':
+        if not isinstance(other, Set):
+            return NotImplemented
+        return Operation('difference', lazy(other), self)
+
+    def __sub__(self, other: Set) -> 'Expression':
+        if not isinstance(other, Set):
+            return NotImplemented
+        return Operation('difference', self, lazy(other))
+
+    def __xor__(self, other: Set) -> 'Expression':
+        if not isinstance(other, Set):
+            return NotImplemented
+        return Operation('symmetric_difference', self, lazy(other))
+
+    def evaluate(self) -> Set:
+        """
+        Returns value of the expression computing it at most once.
+        """
+        if self._value is None:
+            self._value = self._compute()
+        return self._value
+
+    @abstractmethod
+    def _compute(self) -> Set:
+        """
+        Returns value of the expression.
+        """
+        pass
+
+    def unfold(self) -> Iterable[Set]:
+        yield from self.evaluate().unfold()
+
+
+class Leaf(Expression[Domain]):
+    __slots__ = ('set_',)
+
+    _nodes = WeakValueDictionary()
+
+    def __new__(cls, set_: Set) -> 'Leaf':
+        try:
+            return cls._nodes[set_]
+        except KeyError:
+            result = super().__new__(cls)
+            result.set_ = result._value = set_
+            cls._nodes[set_] = result
+            return result
+
+    def __init__(self, set_: Set) -> None:
+        pass
+
+    __repr__ = generate_repr(__init__)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.set_,)
+
+    def __bool__(self) -> bool:
+        return bool(self.set_)
+
+    def __contains__(self, object_: Domain) -> bool:
+        return object_ in self.set_
+
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        return self.set_.contains_many(objects)
+
+    def _compute(self) -> Set:
+        return self.set_
+
+
+class Operation(Expression[Domain]):
+    __slots__ = ('operation', 'left', 'right')
+
+    _nodes = WeakValueDictionary()
+
+    def __new__(cls,
+                operation: str,
+                left: Expression,
+                right: Expression) -> 'Operation':
+        if (operation in commutative_operations
+                and id(right) < id(left)):
+            left, right = right, left
+        key = operation, id(left), id(right)
+        try:
+            return cls._nodes[key]
+        except KeyError:
+            result = super().__new__(cls)
+            result._value = None
+            result.operation = operation
+            result.left = left
+            result.right = right
+            cls._nodes[key] = result
+            return result
+
+    def __init__(self,
+                 operation: str,
+                 left: Expression,
+                 right: Expression) -> None:
+        pass
+
+    __repr__ = generate_repr(__init__)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.operation, self.left, self.right)
+
+    def __bool__(self) -> bool:
+        if self._value is not None:
+            return bool(self._value)
+        if self.operation == 'union':
+            return bool(self.left) or bool(self.right)
+        if self.operation == 'intersection':
+            if not (self.left and self.right):
+                return False
+        elif self.operation == 'difference' and not self.left:
+            return False
+        return bool(self.evaluate())
+
+    def __contains__(self, object_: Domain) -> bool:
+        if self._value is not None:
+            return object_ in self._value
+        if self.operation == 'intersection':
+            return object_ in self.left and object_ in self.right
+        elif self.operation == 'union':
+            return object_ in self.left or object_ in self.right
+        elif self.operation == 'difference':
+            return object_ in self.left and object_ not in self.right
+        else:
+            return (object_ in self.left) is not (object_ in self.right)
+
+    def contains_many(self, objects: Iterable[Domain]) -> np.ndarray:
+        if self._value is not None:
+            return self._value.contains_many(objects)
+        objects = to_array(objects)
+        left_mask = self.left.contains_many(objects)
+        right_mask = self.right.contains_many(objects)
+        if self.operation == 'difference':
+            return left_mask & ~right_mask
+        return operators[self.operation](left_mask, right_mask)
+
+    def _compute(self) -> Set:
+        return operators[self.operation](self.left.evaluate(),
+                                         self.right.evaluate())
+
+
+def lazy(set_: Set) -> Expression:
+    """
+    Wraps given set into expression
+    which defers operations until their results are needed.
+    """
+    return set_ if isinstance(set_, Expression) else Leaf(set_)
+
+
+def to_value(set_: Set) -> Set:
+    return set_.evaluate() if isinstance(set_, Expression) else set_
@@ -0,0 +1,427 @@
+from heapq import merge
+from typing import (Any,
+                    Iterable,
+                    List,
+                    Optional,
+                    SupportsFloat,
+                    Tuple)
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import (REAL_KINDS,
+                     is_numeric,
+                     to_array,
+                     to_array_scalar,
+                     to_real_parts,
+                     to_real_point)
+from .base import (EMPTY_SET_STRING,
+                   Bounds,
+                   Set,
+                   rejecting_disjoint,
+                   unite_bounds)
+from .continuous import (IntervalUnion,
+                         Piece,
+                         point_to_piece,
+                         to_interval_union,
+                         to_piece_sorting_key)
+from .discrete import NumericDiscreteSet
+from .dispatch import dispatched
+
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class PackedIntervalUnion(Set[SupportsFloat]):
+    """
+    Union of intervals and isolated real points
+    stored as columns of ends & points with packed inclusivity bitfield,
+    so it can be backed by foreign (e.g. memory-mapped) buffers.
+    """
+
+    __slots__ = ('_left_ends', '_right_ends', '_inclusions', '_points',
+                 '_folded', '_hash')
+
+    def __init__(self, *subsets: Set) -> None:
+        self._initialize(*to_columns(IntervalUnion(*subsets)))
+
+    @classmethod
+    def from_columns(cls,
+                     left_ends: np.ndarray,
+                     right_ends: np.ndarray,
+                     inclusions: np.ndarray,
+                     points: np.ndarray) -> 'PackedIntervalUnion':
+        """
+        Creates union from sorted ends of disjoint non-mergeable intervals,
+        bitfield of their ends inclusions packed in big-endian order
+        (left end flag followed by right end one)
+        & sorted isolated points without normalization & copying.
+        """
+        result = super().__new__(cls)
+        result._initialize(left_ends, right_ends, inclusions, points)
+        return result
+
+    @classmethod
+    def from_arrays(cls,
+                    left_ends: Any,
+                    right_ends: Any,
+                    left_ends_inclusive: Any = True,
+                    right_ends_inclusive: Any = True
+                    ) -> 'PackedIntervalUnion':
+        """
+        Creates union from array-likes of intervals ends
+        & their inclusions (either arrays or flags for all intervals)
+        in any order with empty, degenerate & overlapping ones allowed
+        sorting & merging them with vectorized operations,
+        so no objects are created per interval.
+
+        Ends are stored as 64-bit integers if they all are integers
+        and as 64-bit floats otherwise.
+        """
+        left_ends, right_ends = to_ends_arrays(left_ends, right_ends)
+        left_ends_inclusive = np.broadcast_to(
+                np.asarray(left_ends_inclusive,
+                           dtype=bool),
+                left_ends.shape)
+        right_ends_inclusive = np.broadcast_to(
+                np.asarray(right_ends_inclusive,
+                           dtype=bool),
+                right_ends.shape)
+        non_empty = ((left_ends < right_ends)
+                     | ((left_ends == right_ends)
+                        & left_ends_inclusive & right_ends_inclusive))
+        left_ends, right_ends = left_ends[non_empty], right_ends[non_empty]
+        left_ends_inclusive = left_ends_inclusive[non_empty]
+        right_ends_inclusive = right_ends_inclusive[non_empty]
+        # sorting by left ends with inclusive ones first
+        order = np.lexsort((~left_ends_inclusive, left_ends))
+        left_ends, right_ends = left_ends[order], right_ends[order]
+        left_ends_inclusive = left_ends_inclusive[order]
+        right_ends_inclusive = right_ends_inclusive[order]
+        # indices of pieces with the greatest right end (inclusive last)
+        # among preceding ones including themselves
+        right_order = np.lexsort((right_ends_inclusive, right_ends))
+        ranks = np.empty_like(right_order)
+        ranks[right_order] = np.arange(right_order.size)
+        furthest = right_order[np.maximum.accumulate(ranks)]
+        previous_furthest = furthest[:-1]
+        previous_right_ends = right_ends[previous_furthest]
+        starts = np.flatnonzero(
+                (left_ends[1:] > previous_right_ends)
+                | ((left_ends[1:] == previous_right_ends)
+                   & ~left_ends_inclusive[1:]
+                   & ~right_ends_inclusive[previous_furthest])) + 1
+        if left_ends.size:
+            starts = np.concatenate(([0], starts))
+        stops = np.append(starts[1:], left_ends.size) - 1
+        stops_furthest = furthest[stops[:starts.size]]
+        left_ends = left_ends[starts]
+        left_ends_inclusive = left_ends_inclusive[starts]
+        right_ends = right_ends[stops_furthest]
+        right_ends_inclusive = right_ends_inclusive[stops_furthest]
+        is_point = left_ends == right_ends
+        is_interval = ~is_point
+        inclusions = np.empty(2 * int(is_interval.sum()),
+                              dtype=bool)
+        inclusions[::2] = left_ends_inclusive[is_interval]
+        inclusions[1::2] = right_ends_inclusive[is_interval]
+        return cls.from_columns(left_ends[is_interval],
+                                right_ends[is_interval],
+                                np.packbits(inclusions),
+                                left_ends[is_point])
+
+    def _initialize(self,
+                    left_ends: np.ndarray,
+                    right_ends: np.ndarray,
+                    inclusions: np.ndarray,
+                    points: np.ndarray) -> None:
+        self._left_ends = left_ends
+        self._right_ends = right_ends
+        self._inclusions = inclusions
+        self._points = points
+        self._folded = None
+        self._hash = None
+
+    @property
+    def columns(self) -> Columns:
+        """
+        Returns left ends, right ends, packed inclusions & points.
+        """
+        return (self._left_ends, self._right_ends,
+                self._inclusions, self._points)
+
+    @property
+    def subsets(self) -> Tuple[Set, ...]:
+        return tuple(self.unfold())
+
+    def __bool__(self) -> bool:
+        return bool(self._left_ends.size or self._points.size)
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if not self:
+            return None
+        bounds = []
+        left_ends, right_ends = self._left_ends, self._right_ends
+        if left_ends.size:
+            bounds.append((left_ends[0].item(),
+                           is_bit_set(self._inclusions, 0),
+                           right_ends[-1].item(),
+                           is_bit_set(self._inclusions,
+                                      2 * right_ends.size - 1)))
+        points = self._points
+        if points.size:
+            bounds.append((points[0].item(), True, points[-1].item(), True))
+        return unite_bounds(bounds)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.fold())
+        return self._hash
+
+    __repr__ = generate_repr(__init__)
+
+    def __str__(self) -> str:
+        if not self:
+            return EMPTY_SET_STRING
+        return ' or '.join(map(str, self.unfold()))
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() & other
+
+    def __contains__(self, object_: Any) -> bool:
+        point = to_real_point(object_)
+        if point is None:
+            return False
+        scalar = to_array_scalar(point)
+        left_ends = self._left_ends
+        index = int(np.searchsorted(left_ends, scalar,
+                                    side='right')) - 1
+        if index >= 0:
+            left_end = left_ends[index].item()
+            right_end = self._right_ends[index].item()
+            if ((left_end < point
+                 or left_end == point
+                 and is_bit_set(self._inclusions, 2 * index))
+                    and (point < right_end
+                         or point == right_end
+                         and is_bit_set(self._inclusions, 2 * index + 1))):
+                return True
+        points = self._points
+        index = int(np.searchsorted(points, scalar))
+        return index < points.size and points[index].item() == point
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        if not is_numeric(objects):
+            return super().contains_many(objects)
+        values = to_real_parts(objects)
+        points = self._points
+        if points.size:
+            indices = np.searchsorted(points, values)
+            np.minimum(indices, points.size - 1,
+                       out=indices)
+            result = points[indices] == values
+        else:
+            result = np.zeros(values.shape,
+                              dtype=bool)
+        left_ends = self._left_ends
+        if left_ends.size:
+            indices = np.searchsorted(left_ends, values,
+                                      side='right') - 1
+            found = indices >= 0
+            indices[~found] = 0
+            candidates_left_ends = left_ends[indices]
+            candidates_right_ends = self._right_ends[indices]
+            result |= (found
+                       & ((candidates_left_ends < values)
+                          | are_bits_set(self._inclusions, 2 * indices)
+                          & (candidates_left_ends == values))
+                       & ((values < candidates_right_ends)
+                          | are_bits_set(self._inclusions, 2 * indices + 1)
+                          & (values == candidates_right_ends)))
+        return result
+
+    @rejecting_disjoint
+    @dispatched
+    def __eq__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if not isinstance(other, PackedIntervalUnion):
+            return self.fold() == other
+        return all(map(np.array_equal, self.columns, other.columns))
+
+    @rejecting_disjoint
+    @dispatched
+    def __ge__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() >= other
+
+    @rejecting_disjoint
+    @dispatched
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() <= other
+
+    @dispatched
+    def __or__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() | other
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return other - self.fold()
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() - other
+
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() ^ other
+
+    __rand__ = __and__
+    __ror__ = __or__
+
+    def fold(self) -> Set:
+        """
+        Returns set with the same elements built from columns.
+        """
+        if self._folded is None:
+            self._folded = IntervalUnion.from_pieces(self.pieces()).fold()
+        return self._folded
+
+    def pieces(self) -> Iterable[Piece]:
+        """
+        Returns sorted disjoint pieces
+        with isolated points as degenerate ones.
+        """
+        inclusions = np.unpackbits(self._inclusions,
+                                   count=2 * self._left_ends.size)
+        inclusions = inclusions.astype(bool).tolist()
+        intervals_pieces = zip(self._left_ends.tolist(), inclusions[::2],
+                               self._right_ends.tolist(), inclusions[1::2])
+        return merge(intervals_pieces,
+                     map(point_to_piece, self._points.tolist()),
+                     key=to_piece_sorting_key)
+
+    def unfold(self) -> Iterable[Set]:
+        yield from self.fold().unfold()
+
+
+def to_columns(set_: Set) -> Columns:
+    """
+    Returns columns of given union of intervals & real points.
+    """
+    if isinstance(set_, PackedIntervalUnion):
+        return set_.columns
+    if isinstance(set_, NumericDiscreteSet):
+        left_ends, right_ends, inclusions = [], [], []
+        points = set_.array.tolist()
+    else:
+        union = (to_interval_union(set_)
+                 if set_
+                 else IntervalUnion())
+        if union is None or union.non_real_points:
+            raise ValueError('Invalid set: {set_!r}, '
+                             'should be union of intervals & real points.'
+                             .format(set_=set_))
+        left_ends, right_ends = union._left_ends, union._right_ends
+        inclusions = [None] * (2 * len(left_ends))
+        inclusions[::2] = union._left_ends_inclusive
+        inclusions[1::2] = union._right_ends_inclusive
+        points = union._points
+    ends = to_ends_array(left_ends + right_ends + points)
+    intervals_count = len(left_ends)
+    return (ends[:intervals_count], ends[intervals_count:2 * intervals_count],
+            np.packbits(np.array(inclusions,
+                                 dtype=bool)),
+            ends[2 * intervals_count:])
+
+
+INTEGERS_DTYPE = np.dtype('<i8')
+FLOATS_DTYPE = np.dtype('<f8')
+
+
+def to_ends_array(values: List[SupportsFloat]) -> np.ndarray:
+    """
+    Converts given values into array of little-endian 64-bit integers
+    or floats which represents them exactly.
+    """
+    dtypes = ((INTEGERS_DTYPE, FLOATS_DTYPE)
+              if to_array(values).dtype.kind in 'biu'
+              else (FLOATS_DTYPE,))
+    for dtype in dtypes:
+        try:
+            result = np.array(values,
+                              dtype=dtype)
+        except (OverflowError, TypeError, ValueError):
+            continue
+        if result.tolist() == values:
+            return result
+    for value in values:
+        try:
+            is_exact = float(value) == value
+        except (OverflowError, TypeError, ValueError):
+            is_exact = False
+        if not is_exact:
+            raise ValueError('Invalid value: {value!r}, '
+                             'should be representable '
+                             'as 64-bit float or integer.'
+                             .format(value=value))
+    raise ValueError('Invalid values: {values!r}, '
+                     'should be representable '
+                     'as 64-bit floats or integers.'
+                     .format(values=values))
+
+
+def to_ends_arrays(left_ends: Any,
+                   right_ends: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts given array-likes of ends into one-dimensional arrays
+    of little-endian 64-bit integers if possible or floats otherwise.
+    """
+    left_ends, right_ends = np.asarray(left_ends), np.asarray(right_ends)
+    if not (left_ends.ndim == right_ends.ndim == 1
+            and left_ends.size == right_ends.size):
+        raise ValueError('Invalid ends shapes: {left_shape}, {right_shape}, '
+                         'should be one-dimensional of the same size.'
+                         .format(left_shape=left_ends.shape,
+                                 right_shape=right_ends.shape))
+    dtype = np.result_type(left_ends, right_ends)
+    if dtype.kind not in REAL_KINDS:
+        raise ValueError('Invalid ends type: {dtype}, '
+                         'should be real numbers.'
+                         .format(dtype=dtype))
+    # unsigned 64-bit integers do not fit into signed ones
+    dtype = (INTEGERS_DTYPE
+             if (dtype.kind == 'i'
+                 or dtype.kind == 'u'
+                 and dtype.itemsize < INTEGERS_DTYPE.itemsize)
+             else FLOATS_DTYPE)
+    return (left_ends.astype(dtype,
+                             copy=False),
+            right_ends.astype(dtype,
+                              copy=False))
+
+
+def is_bit_set(bits: np.ndarray, index: int) -> bool:
+    return bool(bits[index >> 3] >> (7 - (index & 7)) & 1)
+
+
+def are_bits_set(bits: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    return (bits[indices >> 3] >> (7 - (indices & 7)) & 1).astype(bool)
@@ -0,0 +1,148 @@
+import re
+from typing import (Callable,
+                    Iterable,
+                    Iterator,
+                    List,
+                    SupportsFloat,
+                    Tuple)
+
+from .base import Set
+from .continuous import (IntervalUnion,
+                         Piece,
+                         merge_pieces,
+                         point_to_piece,
+                         to_piece_sorting_key)
+from .discrete import Run
+from .ranges import (RangeSet,
+                     unite_runs)
+
+NUMBER_PATTERN = (r'[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+                  r'|[iI]nf(?:inity)?|Infinity)')
+NUMBER = re.compile(NUMBER_PATTERN)
+TERM = re.compile(r'\s*(?:([\[(])\s*(' + NUMBER_PATTERN + r')\s*,'
+                  r'\s*(' + NUMBER_PATTERN + r')\s*([\])])'
+                  r'|\{([^{}]*)\})\s*(or\b)?')
+ELLIPSIS = '...'
+
+NumberType = Callable[[str], SupportsFloat]
+
+
+def parse(string: str,
+          *,
+          number_type: NumberType = float) -> Set:
+    """
+    Parses set from notation produced by ``str``
+    (e.g. ``'[0, 1) or {2, 3}'``) in a single pass
+    constructing canonical union in bulk.
+
+    Ends & points are parsed as integers if possible
+    and with given number type otherwise
+    (falling back to floats for infinities it can not represent).
+    Notation does not carry types of numbers,
+    so exact ones (e.g. ``Decimal``) are restored only if their type is given.
+    """
+    pieces, runs = parse_pieces(string,
+                                number_type=number_type)
+    pieces.sort(key=to_piece_sorting_key)
+    result = IntervalUnion.from_pieces(merge_pieces(pieces)).fold()
+    if runs:
+        runs.sort()
+        result |= RangeSet.from_runs(unite_runs(runs))
+    return result
+
+
+def parse_lines(lines: Iterable[str],
+                *,
+                number_type: NumberType = float) -> Iterator[Set]:
+    """
+    Lazily parses sets from given lines (e.g. opened text file)
+    skipping blank ones.
+    """
+    for line in lines:
+        if line.strip():
+            yield parse(line,
+                        number_type=number_type)
+
+
+def parse_pieces(string: str,
+                 *,
+                 number_type: NumberType = float
+                 ) -> Tuple[List[Piece], List[Run]]:
+    """
+    Parses pieces & runs of integers (from ``'{a, ..., b}'`` terms)
+    of given notation in order of their appearance.
+    """
+    pieces, runs = [], []
+    position, size = 0, len(string)
+    while True:
+        match = TERM.match(string, position)
+        if match is None:
+            raise ValueError('Invalid notation: {fragment!r} '
+                             'at position {position}, '
+                             'should be interval or discrete set.'
+                             .format(fragment=string[position:position + 20],
+                                     position=position))
+        (left_bracket, left_end, right_end, right_bracket,
+         points, separator) = match.groups()
+        if points is None:
+            left_end, right_end = (to_number(left_end, number_type),
+                                   to_number(right_end, number_type))
+            left_end_inclusive = left_bracket == '['
+            right_end_inclusive = right_bracket == ']'
+            if (left_end < right_end
+                    or left_end == right_end
+                    and left_end_inclusive and right_end_inclusive):
+                pieces.append((left_end, left_end_inclusive,
+                               right_end, right_end_inclusive))
+        else:
+            parse_points(points, pieces, runs,
+                         number_type=number_type)
+        position = match.end()
+        if separator is None:
+            break
+    if position != size:
+        raise ValueError('Invalid notation: {fragment!r} '
+                         'at position {position}, should be "or".'
+                         .format(fragment=string[position:position + 20],
+                                 position=position))
+    return pieces, runs
+
+
+def parse_points(string: str,
+                 pieces: List[Piece],
+                 runs: List[Run],
+                 *,
+                 number_type: NumberType = float) -> None:
+    if not string.strip():
+        return
+    tokens = [token.strip() for token in string.split(',')]
+    if len(tokens) == 3 and tokens[1] == ELLIPSIS:
+        start, stop = (to_checked_number(tokens[0], number_type),
+                       to_checked_number(tokens[2], number_type))
+        if not (isinstance(start, int) and isinstance(stop, int)):
+            raise ValueError('Invalid run: {string!r}, '
+                             'should have integer ends.'
+                             .format(string=string))
+        if start <= stop:
+            runs.append((start, stop + 1))
+        return
+    pieces.extend(point_to_piece(to_checked_number(token, number_type))
+                  for token in tokens)
+
+
+def to_checked_number(token: str, number_type: NumberType) -> SupportsFloat:
+    if NUMBER.fullmatch(token) is None:
+        raise ValueError('Invalid number: {token!r}.'
+                         .format(token=token))
+    return to_number(token, number_type)
+
+
+def to_number(token: str, number_type: NumberType) -> SupportsFloat:
+    if token.lstrip('+-').isdigit():
+        return int(token)
+    try:
+        return number_type(token)
+    except (ArithmeticError, ValueError):
+        # e.g. fractions do not support infinities
+        return float(token)
+
@@ -0,0 +1,424 @@
+import random
+from collections import deque
+from typing import (Any,
+                    Callable,
+                    FrozenSet,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    SupportsFloat,
+                    Tuple)
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import to_real_point
+from .base import (EMPTY_SET_STRING,
+                   Bounds,
+                   Set,
+                   rejecting_disjoint)
+from .builders import (to_pieces,
+                       to_sorted_pieces)
+from .continuous import (IntervalUnion,
+                         Piece,
+                         intersect_pieces,
+                         merge_pieces,
+                         subtract_pieces,
+                         symmetrically_subtract_pieces,
+                         to_piece_sorting_key)
+from .dispatch import dispatched
+
+
+class Node:
+    """
+    Node of treap which is never mutated after being published,
+    so versions share unchanged subtrees.
+    """
+
+    __slots__ = ('piece', 'priority', 'left', 'right')
+
+    def __init__(self,
+                 piece: Piece,
+                 priority: float,
+                 left: Optional['Node'] = None,
+                 right: Optional['Node'] = None) -> None:
+        self.piece = piece
+        self.priority = priority
+        self.left = left
+        self.right = right
+
+
+class PersistentIntervalSet(Set[SupportsFloat]):
+    """
+    Union of intervals and points
+    with real part stored as persistent treap
+    of sorted disjoint non-mergeable pieces,
+    so each update takes logarithmic expected time
+    and shares unchanged subtrees with previous version.
+    """
+
+    __slots__ = ('_root', '_non_real_points', '_folded', '_hash')
+
+    def __init__(self, *subsets: Set) -> None:
+        union = IntervalUnion(*subsets)
+        self._initialize(pieces_to_node(list(union.pieces())),
+                         union.non_real_points)
+
+    @classmethod
+    def from_pieces(cls,
+                    pieces: Iterable[Piece],
+                    non_real_points: FrozenSet[Any] = frozenset()
+                    ) -> 'PersistentIntervalSet':
+        """
+        Creates set from sorted disjoint non-mergeable pieces
+        without normalization.
+        """
+        result = super().__new__(cls)
+        result._initialize(pieces_to_node(list(pieces)), non_real_points)
+        return result
+
+    @classmethod
+    def _from_root(cls,
+                   root: Optional[Node],
+                   non_real_points: FrozenSet[Any]
+                   ) -> 'PersistentIntervalSet':
+        result = super().__new__(cls)
+        result._initialize(root, non_real_points)
+        return result
+
+    def _initialize(self,
+                    root: Optional[Node],
+                    non_real_points: FrozenSet[Any]) -> None:
+        self._root = root
+        self._non_real_points = non_real_points
+        self._folded = None
+        self._hash = None
+
+    @property
+    def subsets(self) -> Tuple[Set, ...]:
+        return tuple(self.unfold())
+
+    def __bool__(self) -> bool:
+        return self._root is not None or bool(self._non_real_points)
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if self._root is None or self._non_real_points:
+            return None
+        left_end, left_end_inclusive, _, _ = min_piece(self._root)
+        _, _, right_end, right_end_inclusive = max_piece(self._root)
+        return left_end, left_end_inclusive, right_end, right_end_inclusive
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.fold())
+        return self._hash
+
+    __repr__ = generate_repr(__init__)
+
+    def __str__(self) -> str:
+        if not self:
+            return EMPTY_SET_STRING
+        return ' or '.join(map(str, self.unfold()))
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        try:
+            pieces, non_real_points = to_sorted_pieces(other)
+        except TypeError:
+            return self.fold() & other
+        return PersistentIntervalSet.from_pieces(
+                intersect_pieces(list(self.pieces()), pieces),
+                self._non_real_points.intersection(non_real_points))
+
+    def __contains__(self, object_: Any) -> bool:
+        point = to_real_point(object_)
+        if point is None:
+            return object_ in self._non_real_points
+        node, candidate = self._root, None
+        while node is not None:
+            if to_piece_sorting_key(node.piece) <= (point, False):
+                candidate, node = node.piece, node.right
+            else:
+                node = node.left
+        if candidate is None:
+            return False
+        _, _, right_end, right_end_inclusive = candidate
+        return point < right_end or point == right_end and right_end_inclusive
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        return self.fold().contains_many(objects)
+
+    @rejecting_disjoint
+    @dispatched
+    def __eq__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if not isinstance(other, PersistentIntervalSet):
+            return self.fold() == other
+        return ((self._root is other._root
+                 or list(self.pieces()) == list(other.pieces()))
+                and self._non_real_points == other._non_real_points)
+
+    @rejecting_disjoint
+    @dispatched
+    def __ge__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() >= other
+
+    @rejecting_disjoint
+    @dispatched
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.fold() <= other
+
+    @dispatched
+    def __or__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        try:
+            return self.add(other)
+        except TypeError:
+            return self.fold() | other
+
+    @rejecting_disjoint
+    @dispatched
+    def __rand__(self, other: Set) -> Set:
+        return self & other
+
+    @dispatched
+    def __ror__(self, other: Set) -> Set:
+        return self | other
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        return other - self.fold()
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        try:
+            return self.discard(other)
+        except TypeError:
+            return self.fold() - other
+
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        try:
+            pieces, non_real_points = to_sorted_pieces(other)
+        except TypeError:
+            return self.fold() ^ other
+        return PersistentIntervalSet.from_pieces(
+                symmetrically_subtract_pieces(list(self.pieces()), pieces),
+                self._non_real_points.symmetric_difference(non_real_points))
+
+    def add(self, set_: Set) -> 'PersistentIntervalSet':
+        """
+        Returns new version with given set added.
+        """
+        pieces, non_real_points = to_pieces(set_)
+        root = self._root
+        for piece in pieces:
+            root = add_piece(root, piece)
+        return PersistentIntervalSet._from_root(
+                root, self._non_real_points.union(non_real_points)
+                if non_real_points
+                else self._non_real_points)
+
+    def discard(self, set_: Set) -> 'PersistentIntervalSet':
+        """
+        Returns new version with given set removed.
+        """
+        pieces, non_real_points = to_pieces(set_)
+        root = self._root
+        for piece in pieces:
+            root = discard_piece(root, piece)
+        return PersistentIntervalSet._from_root(
+                root, self._non_real_points.difference(non_real_points)
+                if non_real_points
+                else self._non_real_points)
+
+    def fold(self) -> Set:
+        """
+        Returns immutable set with the same elements.
+        """
+        if self._folded is None:
+            self._folded = (IntervalUnion.from_pieces(self.pieces(),
+                                                      self._non_real_points)
+                            .fold())
+        return self._folded
+
+    def pieces(self) -> Iterator[Piece]:
+        """
+        Returns sorted disjoint pieces of real part
+        with isolated points as degenerate ones.
+        """
+        stack = []  # type: List[Node]
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.piece
+            node = node.right
+
+    def unfold(self) -> Iterable[Set]:
+        yield from self.fold().unfold()
+
+
+def add_piece(root: Optional[Node], piece: Piece) -> Optional[Node]:
+    """
+    Returns root of tree with given piece added.
+    """
+    key = to_piece_sorting_key(piece)
+    head, tail = split_node(
+            root, lambda candidate: to_piece_sorting_key(candidate) < key)
+    if head is not None:
+        merged = list(merge_pieces([max_piece(head), piece]))
+        if len(merged) == 1:
+            head = remove_max_piece(head)
+            piece, = merged
+    merges, tail = split_node(tail, partial_merges(piece))
+    if merges is not None:
+        piece, = merge_pieces([piece, max_piece(merges)])
+    return join_nodes(head, join_nodes(Node(piece, random.random()), tail))
+
+
+def discard_piece(root: Optional[Node], piece: Piece) -> Optional[Node]:
+    """
+    Returns root of tree with given piece removed.
+    """
+    key = to_piece_sorting_key(piece)
+    head, tail = split_node(
+            root, lambda candidate: to_piece_sorting_key(candidate) < key)
+    affected = []
+    if head is not None:
+        last_piece = max_piece(head)
+        if list(intersect_pieces([last_piece], [piece])):
+            head = remove_max_piece(head)
+            affected.append(last_piece)
+    intersections, tail = split_node(tail, partial_intersects(piece))
+    if intersections is not None:
+        # all pieces except the last one are covered by removed piece
+        affected.append(max_piece(intersections))
+    rest = pieces_to_node(list(subtract_pieces(affected, [piece])))
+    return join_nodes(head, join_nodes(rest, tail))
+
+
+def partial_intersects(piece: Piece) -> Callable[[Piece], bool]:
+    _, _, right_end, right_end_inclusive = piece
+
+    def intersects(candidate: Piece) -> bool:
+        left_end, left_end_inclusive, _, _ = candidate
+        return (left_end < right_end
+                or left_end == right_end
+                and left_end_inclusive and right_end_inclusive)
+
+    return intersects
+
+
+def partial_merges(piece: Piece) -> Callable[[Piece], bool]:
+    _, _, right_end, right_end_inclusive = piece
+
+    def merges(candidate: Piece) -> bool:
+        left_end, left_end_inclusive, _, _ = candidate
+        return (left_end < right_end
+                or left_end == right_end
+                and (left_end_inclusive or right_end_inclusive))
+
+    return merges
+
+
+def split_node(node: Optional[Node],
+               predicate: Callable[[Piece], bool]
+               ) -> Tuple[Optional[Node], Optional[Node]]:
+    """
+    Splits tree into the one with prefix of pieces satisfying predicate
+    and the one with the rest of them.
+    """
+    if node is None:
+        return None, None
+    if predicate(node.piece):
+        head, tail = split_node(node.right, predicate)
+        return Node(node.piece, node.priority, node.left, head), tail
+    head, tail = split_node(node.left, predicate)
+    return head, Node(node.piece, node.priority, tail, node.right)
+
+
+def join_nodes(left: Optional[Node],
+               right: Optional[Node]) -> Optional[Node]:
+    """
+    Joins trees with all pieces of the left one preceding the right ones.
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        return Node(left.piece, left.priority, left.left,
+                    join_nodes(left.right, right))
+    return Node(right.piece, right.priority, join_nodes(left, right.left),
+                right.right)
+
+
+def min_piece(node: Node) -> Piece:
+    while node.left is not None:
+        node = node.left
+    return node.piece
+
+
+def max_piece(node: Node) -> Piece:
+    while node.right is not None:
+        node = node.right
+    return node.piece
+
+
+def remove_max_piece(node: Node) -> Optional[Node]:
+    if node.right is None:
+        return node.left
+    return Node(node.piece, node.priority, node.left,
+                remove_max_piece(node.right))
+
+
+def pieces_to_node(pieces: List[Piece]) -> Optional[Node]:
+    """
+    Builds tree from sorted pieces in linear time.
+    """
+    priorities = sorted((random.random() for _ in pieces),
+                        reverse=True)
+    # assigning priorities in breadth-first order keeps heap property
+    nodes = [None] * len(pieces)  # type: List[Optional[Node]]
+    queue = deque([(0, len(pieces))])
+    for priority in priorities:
+        start, stop = queue.popleft()
+        middle = (start + stop) // 2
+        nodes[middle] = Node(pieces[middle], priority)
+        if start < middle:
+            queue.append((start, middle))
+        if middle + 1 < stop:
+            queue.append((middle + 1, stop))
+    return link_nodes(nodes, 0, len(nodes))
+
+
+def link_nodes(nodes: List[Node], start: int, stop: int) -> Optional[Node]:
+    if start == stop:
+        return None
+    middle = (start + stop) // 2
+    node = nodes[middle]
+    node.left = link_nodes(nodes, start, middle)
+    node.right = link_nodes(nodes, middle + 1, stop)
+    return node
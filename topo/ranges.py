@@ -0,0 +1,393 @@
+import math
+from bisect import bisect_right
+from heapq import merge
+from itertools import filterfalse
+from typing import (Any,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import (is_numeric,
+                     to_array,
+                     to_integer,
+                     to_real_parts)
+from .base import (EMPTY_SET,
+                   EMPTY_SET_STRING,
+                   Bounds,
+                   Set,
+                   Union,
+                   rejecting_disjoint)
+from .continuous import (Interval,
+                         IntervalUnion,
+                         Piece,
+                         close_interval,
+                         interval_to_piece)
+from .discrete import (DiscreteSet,
+                       Run,
+                       to_runs)
+from .dispatch import dispatched
+
+
+class RangeSet(Set[int]):
+    """
+    Set of integers stored as sorted disjoint non-adjacent runs
+    of consecutive integers.
+    """
+
+    __slots__ = ('_starts', '_stops', '_arrays', '_hash')
+
+    def __init__(self, *ranges: range) -> None:
+        runs = []
+        for range_ in ranges:
+            if not range_:
+                continue
+            if range_.step < 0:
+                range_ = range_[::-1]
+            if range_.step != 1:
+                raise ValueError('Invalid range: {range_!r}, '
+                                 'should have unit step.'
+                                 .format(range_=range_))
+            runs.append((range_.start, range_.stop))
+        runs.sort()
+        self._initialize(unite_runs(runs))
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[Run]) -> 'RangeSet':
+        """
+        Creates set from sorted disjoint non-adjacent runs
+        without normalization.
+        """
+        result = super().__new__(cls)
+        result._initialize(runs)
+        return result
+
+    def _initialize(self, runs: Iterable[Run]) -> None:
+        starts, stops = [], []
+        for start, stop in runs:
+            starts.append(start)
+            stops.append(stop)
+        self._starts = starts
+        self._stops = stops
+        self._arrays = None
+        self._hash = None
+
+    @property
+    def ranges(self) -> Tuple[range, ...]:
+        """
+        Returns sorted ranges of consecutive integers.
+        """
+        return tuple(map(range, self._starts, self._stops))
+
+    def runs(self) -> Iterable[Run]:
+        """
+        Returns sorted runs of consecutive integers.
+        """
+        return zip(self._starts, self._stops)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        if not self._starts:
+            return None
+        return self._starts[0], True, self._stops[-1] - 1, True
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = (hash(tuple(self.runs()))
+                          if self
+                          else hash(EMPTY_SET))
+        return self._hash
+
+    def __iter__(self) -> Iterator[int]:
+        for start, stop in self.runs():
+            yield from range(start, stop)
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in self.runs())
+
+    __repr__ = generate_repr(__init__)
+
+    def __str__(self) -> str:
+        if not self:
+            return EMPTY_SET_STRING
+        return ' or '.join(map(run_to_string, self.runs()))
+
+    @rejecting_disjoint
+    @dispatched
+    def __and__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, DiscreteSet):
+            return other & self
+        if isinstance(other, Interval):
+            return self._clip(other)
+        if not isinstance(other, RangeSet):
+            return other & self
+        return RangeSet.from_runs(intersect_runs(list(self.runs()),
+                                                 list(other.runs())))
+
+    def __contains__(self, object_: Any) -> bool:
+        integer = to_integer(object_)
+        if integer is None:
+            return False
+        index = bisect_right(self._starts, integer) - 1
+        return index >= 0 and integer < self._stops[index]
+
+    def contains_many(self, objects: Iterable[Any]) -> np.ndarray:
+        objects = to_array(objects)
+        arrays = self._to_arrays()
+        if not (arrays and is_numeric(objects)):
+            return super().contains_many(objects)
+        starts, stops = arrays
+        objects = to_real_parts(objects)
+        indices = np.searchsorted(starts, objects,
+                                  side='right') - 1
+        return ((indices >= 0)
+                & (objects < stops[indices])
+                & (objects == np.floor(objects)))
+
+    def _to_arrays(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        if self._arrays is None:
+            arrays = to_array(self._starts), to_array(self._stops)
+            self._arrays = (arrays
+                            if self and all(map(is_numeric, arrays))
+                            else ())
+        return self._arrays
+
+    @rejecting_disjoint
+    @dispatched
+    def __eq__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, RangeSet):
+            return (self._starts == other._starts
+                    and self._stops == other._stops)
+        if isinstance(other, DiscreteSet):
+            return (len(self) == len(other.points)
+                    and all(map(self.__contains__, other.points)))
+        if isinstance(other, Interval):
+            return False
+        return super().__eq__(other)
+
+    @rejecting_disjoint
+    @dispatched
+    def __ge__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, RangeSet):
+            return not subtract_runs(list(other.runs()), list(self.runs()))
+        if isinstance(other, DiscreteSet):
+            return all(map(self.__contains__, other.points))
+        if isinstance(other, Interval):
+            return False
+        return super().__ge__(other)
+
+    @rejecting_disjoint
+    @dispatched
+    def __le__(self, other: Set) -> bool:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, RangeSet):
+            return not subtract_runs(list(self.runs()), list(other.runs()))
+        if isinstance(other, DiscreteSet):
+            return (len(self) <= len(other.points)
+                    and all(map(other.__contains__, self)))
+        if isinstance(other, Interval):
+            return (not self
+                    or self._starts[0] in other
+                    and self._stops[-1] - 1 in other)
+        return super().__le__(other)
+
+    @dispatched
+    def __or__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, DiscreteSet):
+            integers = self | to_range_set(other.points)
+            non_integers = DiscreteSet(*filterfalse(is_integer,
+                                                    other.points))
+            return Union(integers, non_integers) if non_integers else integers
+        if isinstance(other, Interval):
+            other = close_interval(other, self)
+            rest_integers = self - other
+            return Union(other, rest_integers) if rest_integers else other
+        if not isinstance(other, RangeSet):
+            return other | self
+        return RangeSet.from_runs(unite_runs(merge(self.runs(),
+                                                   other.runs())))
+
+    @rejecting_disjoint
+    @dispatched
+    def __rsub__(self, other: Set) -> Set:
+        if not isinstance(other, Interval):
+            return super().__rsub__(other)
+        punctures = self._clip(other)
+        if not punctures:
+            return other
+        return (IntervalUnion.from_pieces(
+                puncture_piece(interval_to_piece(other), punctures.runs()))
+                .fold())
+
+    @rejecting_disjoint
+    @dispatched
+    def __sub__(self, other: Set) -> Set:
+        if not isinstance(other, Set):
+            return NotImplemented
+        if isinstance(other, DiscreteSet):
+            other = to_range_set(other.points)
+        elif isinstance(other, Interval):
+            other = self._clip(other)
+        if not isinstance(other, RangeSet):
+            return other.__rsub__(self)
+        return RangeSet.from_runs(subtract_runs(list(self.runs()),
+                                                list(other.runs())))
+
+    @dispatched
+    def __xor__(self, other: Set) -> Set:
+        if not isinstance(other, RangeSet):
+            return super().__xor__(other)
+        return (self - other) | (other - self)
+
+    def _clip(self, interval: Interval) -> 'RangeSet':
+        if not self:
+            return self
+        start, stop = to_integer_bounds(interval)
+        if start is None:
+            start = self._starts[0]
+        if stop is None:
+            stop = self._stops[-1]
+        start_index = bisect_right(self._stops, start)
+        stop_index = bisect_right(self._starts, stop - 1)
+        return RangeSet.from_runs(intersect_runs(
+                list(zip(self._starts[start_index:stop_index],
+                         self._stops[start_index:stop_index])),
+                [(start, stop)]))
+
+
+def to_integer_bounds(interval: Interval) -> Tuple[Optional[int],
+                                                   Optional[int]]:
+    """
+    Returns start & stop of integers lying in given interval
+    with ``None`` for unbounded sides.
+    """
+    if math.isinf(interval.left_end):
+        start = None
+    else:
+        start = math.ceil(interval.left_end)
+        if start == interval.left_end and not interval.left_end_inclusive:
+            start += 1
+    if math.isinf(interval.right_end):
+        stop = None
+    else:
+        stop = math.floor(interval.right_end) + 1
+        if (stop - 1 == interval.right_end
+                and not interval.right_end_inclusive):
+            stop -= 1
+    return start, stop
+
+
+def is_integer(object_: Any) -> bool:
+    return to_integer(object_) is not None
+
+
+def to_range_set(points: Iterable[Any]) -> RangeSet:
+    """
+    Returns set of integers among given points.
+    """
+    return RangeSet.from_runs(to_runs(sorted(map(to_integer,
+                                                 filter(is_integer, points)))))
+
+
+def puncture_piece(piece: Piece, runs: Iterable[Run]) -> Iterator[Piece]:
+    """
+    Returns sorted pieces left from given piece
+    after excluding integers of given sorted runs lying in it.
+    """
+    left_end, left_end_inclusive, right_end, right_end_inclusive = piece
+    for start, stop in runs:
+        for integer in range(start, stop):
+            if left_end < integer:
+                yield left_end, left_end_inclusive, integer, False
+            left_end, left_end_inclusive = integer, False
+    if left_end < right_end:
+        yield left_end, left_end_inclusive, right_end, right_end_inclusive
+
+
+def run_to_string(run: Run) -> str:
+    start, stop = run
+    if stop - start > 2:
+        return '{' + str(start) + ', ..., ' + str(stop - 1) + '}'
+    return '{' + ', '.join(map(str, range(start, stop))) + '}'
+
+
+def unite_runs(runs: Iterable[Run]) -> Iterable[Run]:
+    """
+    Merges overlapping & adjacent runs sorted by starts.
+    """
+    runs = iter(runs)
+    try:
+        start, stop = next(runs)
+    except StopIteration:
+        return
+    for next_start, next_stop in runs:
+        if next_start > stop:
+            yield start, stop
+            start, stop = next_start, next_stop
+        elif next_stop > stop:
+            stop = next_stop
+    yield start, stop
+
+
+def intersect_runs(left: Sequence[Run],
+                   right: Sequence[Run]) -> List[Run]:
+    """
+    Intersects sorted disjoint non-adjacent runs in linear time.
+    """
+    result = []
+    left_index = right_index = 0
+    while left_index < len(left) and right_index < len(right):
+        left_start, left_stop = left[left_index]
+        right_start, right_stop = right[right_index]
+        start, stop = max(left_start, right_start), min(left_stop, right_stop)
+        if start < stop:
+            result.append((start, stop))
+        if left_stop < right_stop:
+            left_index += 1
+        else:
+            right_index += 1
+    return result
+
+
+def subtract_runs(minuend: Sequence[Run],
+                  subtrahend: Sequence[Run]) -> List[Run]:
+    """
+    Subtracts sorted disjoint non-adjacent runs in linear time.
+    """
+    result = []
+    index = 0
+    for start, stop in minuend:
+        while index < len(subtrahend) and subtrahend[index][1] <= start:
+            index += 1
+        other_index = index
+        while other_index < len(subtrahend):
+            other_start, other_stop = subtrahend[other_index]
+            if other_start >= stop:
+                break
+            if start < other_start:
+                result.append((start, other_start))
+            start = max(start, other_stop)
+            if other_stop > stop:
+                break
+            other_index += 1
+        index = other_index
+        if start < stop:
+            result.append((start, stop))
+    return result
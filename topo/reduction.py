@@ -0,0 +1,252 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from heapq import merge
+from itertools import groupby
+from operator import (and_,
+                      itemgetter,
+                      or_)
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    FrozenSet,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    SupportsFloat,
+                    Tuple,
+                    Union as TypingUnion)
+
+from .base import (EMPTY_SET,
+                   Set)
+from .builders import to_sorted_pieces
+from .continuous import (IntervalUnion,
+                         Piece,
+                         merge_pieces,
+                         to_piece_sorting_key)
+from .functional import flatmap
+from .packed import (PackedIntervalUnion,
+                     to_columns)
+
+Operand = Tuple[List[Piece], FrozenSet[Any]]
+Event = Tuple[SupportsFloat, bool, int]
+Payload = TypingUnion[Operand, PackedIntervalUnion]
+
+
+def unite_operands(operands: List[Operand]) -> Operand:
+    # k-way merge of sorted pieces through a heap
+    # takes ``O(n log k)`` time for ``n`` pieces in ``k`` operands
+    return (list(merge_pieces(merge(*[pieces for pieces, _ in operands],
+                                    key=to_piece_sorting_key))),
+            frozenset(flatmap(itemgetter(1), operands)))
+
+
+def intersect_operands(operands: List[Operand]) -> Operand:
+    return (list(cover_pieces([pieces for pieces, _ in operands],
+                              len(operands))),
+            frozenset.intersection(*[non_real_points
+                                     for _, non_real_points in operands]))
+
+
+operands_operations = {
+    'intersection': intersect_operands,
+    'union': unite_operands,
+}  # type: Dict[str, Callable[[List[Operand]], Operand]]
+sets_operations = {
+    'intersection': and_,
+    'union': or_,
+}  # type: Dict[str, Callable[[Set, Set], Set]]
+
+
+def union_all(sets: Iterable[Set],
+              *,
+              workers: Optional[int] = 1) -> Set:
+    """
+    Unites given sets splitting them into contiguous chunks
+    united in given number of processes (``None`` for number of processors)
+    by k-way merging of their sorted pieces
+    with subsequent merging of chunks results.
+    """
+    return reduce_all('union', [set_ for set_ in sets if set_],
+                      workers=workers)
+
+
+def intersect_all(sets: Iterable[Set],
+                  *,
+                  workers: Optional[int] = 1) -> Set:
+    """
+    Intersects given sets splitting them into contiguous chunks
+    intersected in given number of processes
+    (``None`` for number of processors) in a single sweep over their pieces
+    with subsequent intersecting of their results.
+    """
+    sets = list(sets)
+    if not sets:
+        raise ValueError('Sets should be non-empty.')
+    if not all(sets):
+        return EMPTY_SET
+    return reduce_all('intersection', sets,
+                      workers=workers)
+
+
+def covered_by_at_least(sets: Iterable[Set], count: int) -> Set:
+    """
+    Returns set of elements which belong to at least given number of sets
+    (e.g. ``1`` for union & number of sets for intersection)
+    computed in a single sweep over their sorted pieces.
+    """
+    if count < 1:
+        raise ValueError('Count should be positive, but found {count}.'
+                         .format(count=count))
+    operands = [to_operand(set_) for set_ in sets]
+    if count > len(operands):
+        return EMPTY_SET
+    non_real_points_counter = Counter(flatmap(itemgetter(1), operands))
+    non_real_points = frozenset(point
+                                for point, point_count
+                                in non_real_points_counter.items()
+                                if point_count >= count)
+    return (IntervalUnion.from_pieces(
+            cover_pieces([pieces for pieces, _ in operands], count),
+            non_real_points)
+            .fold())
+
+
+def reduce_all(operation_name: str,
+               sets: List[Set],
+               *,
+               workers: Optional[int]) -> Set:
+    if not sets:
+        return EMPTY_SET
+    workers = workers or os.cpu_count() or 1
+    try:
+        operands = [to_operand(set_) for set_ in sets]
+    except TypeError:
+        # not every set is a union of intervals & points,
+        # so falling back to sets operations
+        if workers > 1 and len(sets) > 1:
+            with ProcessPoolExecutor(workers) as executor:
+                sets = list(executor.map(partial(reduce_sets,
+                                                 operation_name),
+                                         split(sets, workers)))
+        return reduce_sets(operation_name, sets)
+    if workers > 1 and len(operands) > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            operands = list(map(from_payload,
+                                executor.map(partial(reduce_payloads,
+                                                     operation_name),
+                                             split(list(map(to_payload,
+                                                            operands)),
+                                                   workers))))
+    pieces, non_real_points = operands_operations[operation_name](operands)
+    return IntervalUnion.from_pieces(pieces, non_real_points).fold()
+
+
+def reduce_payloads(operation_name: str, payloads: List[Payload]) -> Payload:
+    """
+    Reduces transferable representations of operands
+    into transferable representation of the result.
+    """
+    return to_payload(operands_operations[operation_name](
+            list(map(from_payload, payloads))))
+
+
+def reduce_sets(operation_name: str, sets: List[Set]) -> Set:
+    return reduce_balanced(sets_operations[operation_name], sets)
+
+
+def reduce_balanced(function: Callable[[Any, Any], Any],
+                    operands: List[Any]) -> Any:
+    """
+    Reduces operands by applying function to adjacent pairs
+    level by level, so each operand takes part
+    in logarithmic number of applications.
+    """
+    while len(operands) > 1:
+        reduced = [function(left, right)
+                   for left, right in zip(operands[::2], operands[1::2])]
+        if len(operands) % 2:
+            reduced.append(operands[-1])
+        operands = reduced
+    return operands[0]
+
+
+def cover_pieces(pieces_sequences: List[Iterable[Piece]],
+                 count: int) -> Iterator[Piece]:
+    """
+    Returns sorted disjoint non-mergeable pieces
+    covered by at least given number of sequences
+    of sorted disjoint non-mergeable pieces
+    by streaming their ends through a heap
+    in ``O(n log k)`` time for ``n`` pieces in ``k`` sequences.
+    """
+    coverage = 0
+    start = None
+    events = merge(*map(to_events, pieces_sequences))
+    for position, position_events in groupby(events, itemgetter(0, 1)):
+        for _, _, delta in position_events:
+            coverage += delta
+        if coverage >= count:
+            if start is None:
+                start = position
+        elif start is not None:
+            left_end, left_end_exclusive = start
+            right_end, right_end_inclusive = position
+            yield (left_end, not left_end_exclusive,
+                   right_end, right_end_inclusive)
+            start = None
+
+
+def to_events(pieces: Iterable[Piece]) -> Iterator[Event]:
+    """
+    Returns sorted coverage changes of given pieces
+    with each end position represented by its value
+    and flag of lying right after it.
+    """
+    for left_end, left_end_inclusive, right_end, right_end_inclusive in pieces:
+        yield left_end, not left_end_inclusive, 1
+        yield right_end, right_end_inclusive, -1
+
+
+def split(values: List[Any], parts_count: int) -> List[List[Any]]:
+    """
+    Splits values into given number of contiguous parts
+    of almost equal sizes omitting empty ones.
+    """
+    size, rest = divmod(len(values), parts_count)
+    result, start = [], 0
+    for index in range(parts_count):
+        stop = start + size + (index < rest)
+        if start < stop:
+            result.append(values[start:stop])
+        start = stop
+    return result
+
+
+def to_operand(set_: Set) -> Operand:
+    pieces, non_real_points = to_sorted_pieces(set_)
+    return pieces, frozenset(non_real_points)
+
+
+def to_payload(operand: Operand) -> Payload:
+    """
+    Returns representation of operand which is cheap to transfer
+    between processes: packed union with columns of ends if possible
+    and operand itself otherwise.
+    """
+    pieces, non_real_points = operand
+    if non_real_points:
+        return operand
+    try:
+        columns = to_columns(IntervalUnion.from_pieces(pieces))
+    except ValueError:
+        return operand
+    return PackedIntervalUnion.from_columns(*columns)
+
+
+def from_payload(payload: Payload) -> Operand:
+    if isinstance(payload, PackedIntervalUnion):
+        return list(payload.pieces()), frozenset()
+    return payload
@@ -0,0 +1,147 @@
+"""
+Binary format of unions of intervals & real points.
+
+File starts with header of
+- magic bytes ``b'TOPO'``,
+- format version as unsigned 16-bit integer,
+- ends type code: ``b'i'`` for 64-bit integers & ``b'f'`` for 64-bit floats,
+- padding byte,
+- intervals count & isolated points count as unsigned 64-bit integers,
+
+followed by columns of
+- intervals left ends,
+- intervals right ends,
+- isolated points,
+- inclusions of intervals ends packed into bits
+  in big-endian order (left end flag followed by right end one).
+
+All numbers are little-endian and columns are aligned by 8 bytes,
+so they can be used in-place without copying.
+"""
+import io
+import mmap
+import struct
+from typing import (Any,
+                    BinaryIO)
+
+import numpy as np
+
+from .base import (EMPTY_SET,
+                   Set)
+from .discrete import NumericDiscreteSet
+from .packed import (PackedIntervalUnion,
+                     to_columns)
+
+MAGIC = b'TOPO'
+VERSION = 1
+HEADER = struct.Struct('<4sHcxQQ')
+DTYPES = {b'f': np.dtype('<f8'),
+          b'i': np.dtype('<i8')}
+DTYPES_CODES = {dtype: code for code, dtype in DTYPES.items()}
+
+
+def dump(set_: Set, file: BinaryIO) -> None:
+    """
+    Writes given set into binary file.
+    """
+    left_ends, right_ends, inclusions, points = to_columns(set_)
+    # empty columns are written as no bytes, so their types do not matter
+    dtypes = ({column.dtype
+               for column in (left_ends, right_ends, points)
+               if column.size}
+              or {left_ends.dtype})
+    if len(dtypes) > 1:
+        raise ValueError('Invalid ends types: {dtypes}, should be the same.'
+                         .format(dtypes=', '.join(sorted(map(str, dtypes)))))
+    dtype, = dtypes
+    try:
+        dtype_code = DTYPES_CODES[dtype]
+    except KeyError:
+        raise ValueError('Invalid ends type: {dtype}, '
+                         'should be one of {dtypes}.'
+                         .format(dtype=dtype,
+                                 dtypes=', '.join(map(str, DTYPES_CODES))))
+    file.write(HEADER.pack(MAGIC, VERSION, dtype_code,
+                           left_ends.size, points.size))
+    file.write(left_ends.tobytes())
+    file.write(right_ends.tobytes())
+    file.write(points.tobytes())
+    file.write(inclusions.tobytes())
+
+
+def dumps(set_: Set) -> bytes:
+    """
+    Returns binary representation of given set.
+    """
+    file = io.BytesIO()
+    dump(set_, file)
+    return file.getvalue()
+
+
+def load(path: str) -> Set:
+    """
+    Loads set from binary file by memory-mapping it,
+    so its columns are not copied into memory.
+    """
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ)
+    return loads(buffer)
+
+
+def loads(buffer: Any) -> Set:
+    """
+    Loads set from binary representation in given bytes-like object
+    sharing memory with it.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError('Invalid buffer: should have at least {size} bytes.'
+                         .format(size=HEADER.size))
+    magic, version, dtype_code, intervals_count, points_count = (
+        HEADER.unpack_from(buffer))
+    if magic != MAGIC:
+        raise ValueError('Invalid magic: {magic!r}, should be {expected!r}.'
+                         .format(magic=magic,
+                                 expected=MAGIC))
+    if version != VERSION:
+        raise ValueError('Invalid version: {version!r}, '
+                         'should be {expected!r}.'
+                         .format(version=version,
+                                 expected=VERSION))
+    try:
+        dtype = DTYPES[dtype_code]
+    except KeyError:
+        raise ValueError('Invalid ends type code: {code!r}, '
+                         'should be one of {codes}.'
+                         .format(code=dtype_code,
+                                 codes=', '.join(map(repr, DTYPES))))
+    inclusions_size = -(-2 * intervals_count // 8)
+    expected_size = (HEADER.size
+                     + (2 * intervals_count + points_count) * dtype.itemsize
+                     + inclusions_size)
+    if len(buffer) != expected_size:
+        raise ValueError('Invalid buffer size: {size}, should be {expected}.'
+                         .format(size=len(buffer),
+                                 expected=expected_size))
+    offset = HEADER.size
+    left_ends = np.frombuffer(buffer, dtype,
+                              count=intervals_count,
+                              offset=offset)
+    offset += left_ends.nbytes
+    right_ends = np.frombuffer(buffer, dtype,
+                               count=intervals_count,
+                               offset=offset)
+    offset += right_ends.nbytes
+    points = np.frombuffer(buffer, dtype,
+                           count=points_count,
+                           offset=offset)
+    offset += points.nbytes
+    inclusions = np.frombuffer(buffer, np.uint8,
+                               count=inclusions_size,
+                               offset=offset)
+    if intervals_count:
+        return PackedIntervalUnion.from_columns(left_ends, right_ends,
+                                                inclusions, points)
+    if points_count:
+        return NumericDiscreteSet.from_sorted_array(points)
+    return EMPTY_SET
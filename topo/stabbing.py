@@ -0,0 +1,138 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import (Any,
+                    Dict,
+                    Generic,
+                    Iterable,
+                    List,
+                    Mapping,
+                    Tuple)
+
+import numpy as np
+from reprit.base import generate_repr
+
+from .arrays import (is_numeric,
+                     to_array,
+                     to_array_scalar,
+                     to_real_parts,
+                     to_real_point)
+from .base import Set
+from .continuous import to_interval_union
+from .hints import Key
+
+
+class StabbingIndex(Generic[Key]):
+    """
+    Index over keyed sets answering which of them contain given point.
+
+    Ends of all pieces split the real line into elementary cells
+    (ends themselves and open gaps between them)
+    with keys of covering sets stored in nodes of segment tree over cells,
+    so every piece is stored in ``O(log n)`` nodes
+    and queries take ``O(log n + k)`` time
+    where ``n`` is the number of ends and ``k`` is the number of results.
+    """
+
+    def __init__(self, sets: Mapping[Key, Set]) -> None:
+        self.sets = dict(sets)
+        pieces = []
+        non_real_points_keys = defaultdict(list)  # type: Dict[Any, List[Key]]
+        fallback_sets = []
+        for key, set_ in self.sets.items():
+            union = to_interval_union(set_)
+            if union is None:
+                fallback_sets.append((key, set_))
+                continue
+            pieces.extend((key, piece) for piece in union.pieces())
+            for point in union.non_real_points:
+                non_real_points_keys[point].append(key)
+        ends = sorted({end
+                       for _, (left_end, _, right_end, _) in pieces
+                       for end in (left_end, right_end)})
+        cells_count = 2 * len(ends) + 1
+        nodes_keys = defaultdict(list)  # type: Dict[int, List[Key]]
+        for key, (left_end, left_end_inclusive,
+                  right_end, right_end_inclusive) in pieces:
+            # leaves of the tree are stored after its inner nodes,
+            # so covered cells are split into canonical nodes bottom-up
+            start = (2 * bisect_left(ends, left_end) + 2 - left_end_inclusive
+                     + cells_count)
+            stop = (2 * bisect_left(ends, right_end) + 1 + right_end_inclusive
+                    + cells_count)
+            while start < stop:
+                if start & 1:
+                    nodes_keys[start].append(key)
+                    start += 1
+                if stop & 1:
+                    stop -= 1
+                    nodes_keys[stop].append(key)
+                start >>= 1
+                stop >>= 1
+        self._ends = ends
+        self._cells_count = cells_count
+        self._nodes_keys = {node: tuple(keys)
+                            for node, keys in nodes_keys.items()}
+        self._non_real_points_keys = {point: tuple(keys)
+                                      for point, keys
+                                      in non_real_points_keys.items()}
+        self._fallback_sets = fallback_sets
+        ends_array = to_array(list(map(to_array_scalar, ends)))
+        self._ends_array = ends_array if is_numeric(ends_array) else None
+
+    __repr__ = generate_repr(__init__)
+
+    def stab(self, point: Any) -> Tuple[Key, ...]:
+        """
+        Returns keys of sets which contain given point.
+        """
+        real_point = to_real_point(point)
+        if real_point is None:
+            result = self._non_real_points_keys.get(point, ())
+        else:
+            result = self._to_cell_keys(self._to_cell(real_point))
+        if self._fallback_sets:
+            result += tuple(key
+                            for key, set_ in self._fallback_sets
+                            if point in set_)
+        return result
+
+    def stab_many(self, points: Iterable[Any]) -> List[Tuple[Key, ...]]:
+        """
+        Returns keys of sets which contain given points
+        for each point respectively.
+        """
+        points = to_array(points)
+        ends = self._ends_array
+        if ends is None or not is_numeric(points) or self._fallback_sets:
+            return [self.stab(point) for point in points.ravel().tolist()]
+        values = to_real_parts(points.ravel())
+        indices = np.searchsorted(ends, values)
+        found = indices < len(ends)
+        cells = 2 * indices
+        cells[found] += ends[indices[found]] == values[found]
+        unique_cells, inverse = np.unique(cells,
+                                          return_inverse=True)
+        unique_cells_keys = list(map(self._to_cell_keys,
+                                     unique_cells.tolist()))
+        result = [unique_cells_keys[index]
+                  for index in inverse.ravel().tolist()]
+        for index in np.flatnonzero(np.isnan(values)).tolist():
+            result[index] = self.stab(points.ravel()[index].item())
+        return result
+
+    def _to_cell_keys(self, cell: int) -> Tuple[Key, ...]:
+        """
+        Returns keys of sets covering given cell
+        collected on the path from its leaf to the root.
+        """
+        result = []  # type: List[Key]
+        node = cell + self._cells_count
+        while node:
+            result.extend(self._nodes_keys.get(node, ()))
+            node >>= 1
+        return tuple(result)
+
+    def _to_cell(self, point: Any) -> int:
+        index = bisect_left(self._ends, point)
+        return (2 * index
+                + (index < len(self._ends) and self._ends[index] == point))